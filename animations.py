@@ -6,6 +6,8 @@ from typing import Tuple, Optional
 class Animation:
     """Base class for animations"""
     
+    __slots__ = ('duration', 'elapsed', 'completed')
+    
     def __init__(self, duration: float):
         self.duration = duration
         self.elapsed = 0.0
@@ -26,30 +28,61 @@ class Animation:
 class FallAnimation(Animation):
     """Animation for falling tiles"""
     
+    __slots__ = ('start_y', 'end_y', 'current_y', 'col', 'to_row', 'from_row', 'tile',
+                 'is_new_tile', 'is_existing_tile', 'completion_delay', 'delay_elapsed')
+    
     def __init__(self, start_y: float, end_y: float, duration: float):
-        super().__init__(duration)
+        self.reset(start_y, end_y, duration)
+    
+    def reset(self, start_y: float, end_y: float, duration: float):
+        """Restart as a fresh fall (used when recycling from a pool)"""
+        Animation.__init__(self, duration)
         self.start_y = start_y
         self.end_y = end_y
         self.current_y = start_y
+        # Filled in by the game: the tile, its column and destination row, and for a tile
+        # already on the board the row it falls from (None for new tiles)
+        self.col = None
+        self.to_row = None
+        self.from_row = None
+        self.tile = None
+        self.is_new_tile = False
+        self.is_existing_tile = False
+        # Settle time after landing before the animation is dropped (None until it lands)
+        self.completion_delay = None
+        self.delay_elapsed = 0.0
     
     def update(self, dt: float) -> bool:
-        completed = super().update(dt)
-        progress = self.get_progress()
+        # Runs for every falling tile on both boards each frame, so the base update,
+        # get_progress and ease_in_quad are written out inline on locals
+        elapsed = self.elapsed + dt
+        duration = self.duration
+        if elapsed >= duration:
+            elapsed = duration
+            self.completed = True
+        self.elapsed = elapsed
+        progress = elapsed / duration if duration > 0 else 1.0
         
         # Clamp progress to prevent overshooting
-        progress = min(1.0, max(0.0, progress))
+        if progress > 1.0:
+            progress = 1.0
+        elif progress < 0.0:
+            progress = 0.0
         
-        # Use easing function for more natural fall
-        eased_progress = self.ease_in_quad(progress)
-        self.current_y = self.start_y + (self.end_y - self.start_y) * eased_progress
+        # Quadratic easing for more natural fall
+        start_y = self.start_y
+        end_y = self.end_y
+        current_y = start_y + (end_y - start_y) * (progress * progress)
         
         # Ensure we never overshoot the target position
-        if self.start_y < self.end_y:  # Falling down
-            self.current_y = min(self.current_y, self.end_y)
-        else:  # Falling up (shouldn't happen, but safety)
-            self.current_y = max(self.current_y, self.end_y)
+        if start_y < end_y:  # Falling down
+            if current_y > end_y:
+                current_y = end_y
+        elif current_y < end_y:  # Falling up (shouldn't happen, but safety)
+            current_y = end_y
+        self.current_y = current_y
         
-        return completed
+        return self.completed
     
     def ease_in_quad(self, t: float) -> float:
         """Quadratic easing function for gentle acceleration"""
@@ -59,32 +92,50 @@ class FallAnimation(Animation):
 class SwapAnimation(Animation):
     """Animation for swapping tiles"""
     
+    __slots__ = ('start_pos1', 'start_pos2', 'current_pos1', 'current_pos2',
+                 'tile_pos1', 'tile_pos2', 'original_tile1', 'original_tile2', 'is_reversal')
+    
     def __init__(self, pos1: Tuple[float, float], pos2: Tuple[float, float], duration: float):
-        super().__init__(duration)
+        self.reset(pos1, pos2, duration)
+    
+    def reset(self, pos1: Tuple[float, float], pos2: Tuple[float, float], duration: float):
+        """Restart as a fresh swap (used when recycling from a pool)"""
+        Animation.__init__(self, duration)
         self.start_pos1 = pos1
         self.start_pos2 = pos2
         self.current_pos1 = pos1
         self.current_pos2 = pos2
+        # Filled in by the game: the board cells being swapped and the tiles drawn while moving
+        self.tile_pos1 = None
+        self.tile_pos2 = None
+        self.original_tile1 = None
+        self.original_tile2 = None
+        self.is_reversal = False
     
     def update(self, dt: float) -> bool:
-        # Debug output for boss animations
-        if hasattr(self, 'tile_pos1') and getattr(self, 'tile_pos1', None) is not None:
-            pass  # No debug output needed
-        
-        completed = super().update(dt)
-        progress = self.get_progress()
+        # Same inlining as FallAnimation.update: base update, get_progress,
+        # ease_in_out_cubic and lerp_pos written out on locals
+        elapsed = self.elapsed + dt
+        duration = self.duration
+        if elapsed >= duration:
+            elapsed = duration
+            self.completed = True
+        self.elapsed = elapsed
+        progress = elapsed / duration if duration > 0 else 1.0
         
         # Use smooth easing
-        eased_progress = self.ease_in_out_cubic(progress)
+        if progress < 0.5:
+            eased_progress = 4 * progress * progress * progress
+        else:
+            eased_progress = 1 - pow(-2 * progress + 2, 3) / 2
         
         # Interpolate positions
-        self.current_pos1 = self.lerp_pos(self.start_pos1, self.start_pos2, eased_progress)
-        self.current_pos2 = self.lerp_pos(self.start_pos2, self.start_pos1, eased_progress)
+        x1, y1 = self.start_pos1
+        x2, y2 = self.start_pos2
+        self.current_pos1 = (x1 + (x2 - x1) * eased_progress, y1 + (y2 - y1) * eased_progress)
+        self.current_pos2 = (x2 + (x1 - x2) * eased_progress, y2 + (y1 - y2) * eased_progress)
         
-        if hasattr(self, 'tile_pos1') and getattr(self, 'tile_pos1', None) is not None and completed:
-            pass  # Animation completed, no debug needed
-        
-        return completed
+        return self.completed
     
     def lerp_pos(self, pos1: Tuple[float, float], pos2: Tuple[float, float], t: float) -> Tuple[float, float]:
         """Linear interpolation between two positions"""
@@ -124,6 +175,11 @@ class ParticleEffect:
     
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], count: int = 10):
         self.particles = []
+        self.reset(x, y, color, count)
+    
+    def reset(self, x: float, y: float, color: Tuple[int, int, int], count: int = 10):
+        """Start a fresh burst, reusing this effect (used when recycling from a pool)"""
+        self.particles.clear()
         for _ in range(count):
             particle = {
                 'x': x,
@@ -139,14 +195,19 @@ class ParticleEffect:
     
     def update(self, dt: float):
         """Update all particles"""
-        for particle in self.particles[:]:
+        # Single pass: step each particle and keep the live ones, instead of copying the
+        # list and paying an O(n) list.remove for every particle that dies
+        gravity = 200 * dt
+        alive = []
+        for particle in self.particles:
             particle['x'] += particle['vx'] * dt
             particle['y'] += particle['vy'] * dt
-            particle['vy'] += 200 * dt  # Gravity
+            particle['vy'] += gravity  # Gravity
             particle['life'] -= dt
             
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw all particles"""
@@ -173,41 +234,42 @@ class ParticleEffect:
 class PopAnimation(Animation):
     """Animation for tiles popping/shrinking when matched"""
     
+    __slots__ = ('tile_positions', 'cells', 'tile_data', 'center_pos', 'scale', 'is_special')
+    
     def __init__(self, tile_positions: list, tile_data: list, center_pos: Optional[Tuple[float, float]] = None, duration: float = 0.15):
         super().__init__(duration)
         self.tile_positions = tile_positions  # List of (row, col, x, y) positions
+        self.cells = [(row, col) for row, col, _, _ in tile_positions]  # Board cell of each tile, for indexing
         self.tile_data = tile_data  # List of actual tile objects to draw during animation
         self.center_pos = center_pos  # If None, shrink to nothing; if set, shrink to center
-        self.scales = [1.0] * len(tile_positions)  # Current scale for each tile
+        self.scale = 1.0  # Every tile in a pop shrinks in lockstep, so one scale covers them all
         self.is_special = center_pos is not None
     
     def update(self, dt: float) -> bool:
         completed = super().update(dt)
         progress = self.get_progress()
         
-        
         if self.is_special:
-            # Special tile creation: shrink toward center position
-            for i in range(len(self.scales)):
-                # Fast shrink with slight bounce
-                self.scales[i] = max(0.0, 1.0 - (progress * 1.2))
+            # Special tile creation: fast shrink toward center position
+            self.scale = max(0.0, 1.0 - (progress * 1.2))
         else:
             # Normal match: shrink to nothing with bounce
             bounce_factor = 1.0 + (math.sin(progress * math.pi * 2) * 0.1)
-            for i in range(len(self.scales)):
-                self.scales[i] = max(0.0, (1.0 - progress) * bounce_factor)
+            self.scale = max(0.0, (1.0 - progress) * bounce_factor)
         
         return completed
     
     def get_tile_scale(self, index: int) -> float:
         """Get the current scale for a tile at given index"""
-        if index < len(self.scales):
-            return self.scales[index]
+        if index < len(self.cells):
+            return self.scale
         return 0.0
 
 class SpawnAnimation(Animation):
     """Animation for special tiles spawning/growing from tiny to normal size"""
     
+    __slots__ = ('row', 'col', 'scale')
+    
     def __init__(self, row: int, col: int, duration: float = 0.25):
         super().__init__(duration)
         self.row = row
@@ -233,70 +295,94 @@ class SpawnAnimation(Animation):
         """Get the current scale for the spawning tile"""
         return self.scale
 
-class PopParticle:
-    """Simple pop particle effect"""
-    
-    def __init__(self, x: float, y: float, color: Tuple[int, int, int], is_special: bool = False):
-        self.x = x
-        self.y = y
-        self.color = color if not is_special else (255, 255, 255)  # White for special
-        self.life = 0.3  # Short duration
-        self.max_life = 0.3
-        self.size = 8 if not is_special else 12
-        self.max_size = self.size
-        self.particles = []
-        
-        # Create small particle burst
+_POP_CIRCLE_CACHE_LIMIT = 2048
+_pop_circle_cache = {}
+
+def _pop_circle_surface(color: Tuple[int, int, int], size: int, alpha: int) -> pygame.Surface:
+    """Get a cached circle of radius size at the given alpha"""
+    key = (color, size, alpha)
+    surf = _pop_circle_cache.get(key)
+    if surf is None:
+        if len(_pop_circle_cache) >= _POP_CIRCLE_CACHE_LIMIT:
+            _pop_circle_cache.clear()
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (size, size), size)
+        surf.set_alpha(alpha)
+        _pop_circle_cache[key] = surf
+    return surf
+
+class PopParticleSystem:
+    """Pop particle bursts for one board"""
+    
+    def __init__(self):
+        # Every live particle of every burst is stored in flat parallel lists, each one carrying
+        # its burst's color and remaining burst life, so update() is one pass over plain floats
+        self.px = []
+        self.py = []
+        self.vx = []
+        self.vy = []
+        self.particle_life = []
+        self.particle_max_life = []
+        self.particle_size = []
+        self.particle_color = []
+        self.burst_life = []
+    
+    def __len__(self) -> int:
+        return len(self.particle_life)
+    
+    def burst(self, x: float, y: float, color: Tuple[int, int, int], is_special: bool = False):
+        """Start a small particle burst at (x, y)"""
+        if is_special:
+            color = (255, 255, 255)  # White for special
         particle_count = 6 if not is_special else 10
         for _ in range(particle_count):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(30, 80)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.uniform(0.2, 0.4),
-                'max_life': random.uniform(0.2, 0.4),
-                'size': random.uniform(2, 4)
-            })
+            self.px.append(x)
+            self.py.append(y)
+            self.vx.append(math.cos(angle) * speed)
+            self.vy.append(math.sin(angle) * speed)
+            self.particle_life.append(random.uniform(0.2, 0.4))
+            self.particle_max_life.append(random.uniform(0.2, 0.4))
+            self.particle_size.append(random.uniform(2, 4))
+            self.particle_color.append(color)
+            self.burst_life.append(0.3)  # Short duration
     
     def update(self, dt: float):
-        """Update particle effect"""
-        self.life -= dt
-        
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['vx'] *= 0.95  # Friction
-            particle['vy'] *= 0.95
-            particle['life'] -= dt
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        """Update all bursts, dropping particles that died or whose burst is over"""
+        px, py, vx, vy = self.px, self.py, self.vx, self.vy
+        lives, burst_lives = self.particle_life, self.burst_life
+        any_dead = False
+        for i in range(len(lives)):
+            px[i] += vx[i] * dt
+            py[i] += vy[i] * dt
+            vx[i] *= 0.95  # Friction
+            vy[i] *= 0.95
+            lives[i] -= dt
+            burst_lives[i] -= dt
+            if lives[i] <= 0 or burst_lives[i] <= 0:
+                any_dead = True
+        
+        if any_dead:
+            keep = [i for i in range(len(lives)) if lives[i] > 0 and burst_lives[i] > 0]
+            for values in (px, py, vx, vy, lives, burst_lives, self.particle_max_life,
+                           self.particle_size, self.particle_color):
+                values[:] = [values[i] for i in keep]
     
     def draw(self, screen: pygame.Surface):
-        """Draw particle effect"""
-        if self.life <= 0:
+        """Draw all bursts"""
+        if not self.particle_life:
             return
-            
-        for particle in self.particles:
-            if particle['life'] <= 0:
-                continue
-                
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            size = max(1, int(particle['size'] * (particle['life'] / particle['max_life'])))
-            
-            # Create surface with alpha
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, self.color, (size, size), size)
-            particle_surface.set_alpha(alpha)
-            
-            screen.blit(particle_surface, (particle['x'] - size, particle['y'] - size))
-    
-    def is_finished(self) -> bool:
-        """Check if particle effect is done"""
-        return self.life <= 0 and len(self.particles) == 0
+        
+        batch = []
+        for x, y, life, max_life, base_size, color in zip(self.px, self.py, self.particle_life, self.particle_max_life,
+                                                          self.particle_size, self.particle_color):
+            fraction = life / max_life
+            # set_alpha clamps to 255, so clamping the key shares one surface for all opaque frames
+            alpha = min(255, int(255 * fraction))
+            size = max(1, int(base_size * fraction))
+            batch.append((_pop_circle_surface(color, size, alpha), (x - size, y - size)))
+        screen.blits(batch, doreturn=False)
 
 class PlopOutAnimation(Animation):
     """Animation for tiles deleted by special tiles - scales up and fades out"""
@@ -413,6 +499,7 @@ class BoardWipeChargingAnimation(Animation):
         # Animation phases
         self.charge_duration = 0.8  # How long to charge before activation
         self.should_activate = False
+        self.activated = False  # Set once the game has detonated this board wipe
         
         # Store tile and position data
         self.tile = None
@@ -7,6 +7,25 @@ import math
 import random
 from typing import Tuple, List
 
+# Solid-color particle surfaces keyed by (width, height, color, alpha). Effects that used to build
+# a fresh Surface per particle per frame reuse these and hand them to a single screen.blits() call.
+_solid_surface_cache = {}
+_SOLID_SURFACE_CACHE_LIMIT = 2048
+
+
+def _solid_surface(width: int, height: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """Get a cached surface filled with color at the given alpha"""
+    key = (width, height, color, alpha)
+    surf = _solid_surface_cache.get(key)
+    if surf is None:
+        if len(_solid_surface_cache) >= _SOLID_SURFACE_CACHE_LIMIT:
+            _solid_surface_cache.clear()
+        surf = pygame.Surface((width, height))
+        surf.fill(color)
+        surf.set_alpha(alpha)
+        _solid_surface_cache[key] = surf
+    return surf
+
 class PixelArcadeParticleSystem:
     """Wrapper to use Arcade particles in a Pygame context with pixel art styling"""
     
@@ -150,12 +169,14 @@ class PixelArcadeParticleSystem:
     
     def update(self, dt: float):
         """Update all particle emitters"""
-        for emitter in self.emitters[:]:
+        alive = []
+        for emitter in self.emitters:
             emitter.update()
             
-            # Remove finished emitters
-            if len(emitter.get_particles()) == 0 and emitter.can_reap():
-                self.emitters.remove(emitter)
+            # Drop finished emitters
+            if not (len(emitter.get_particles()) == 0 and emitter.can_reap()):
+                alive.append(emitter)
+        self.emitters[:] = alive
     
     def render_to_pygame(self, pygame_screen: pygame.Surface):
         """Render particles to pygame surface"""
@@ -202,11 +223,17 @@ class PixelParticleSystem:
     
     def __init__(self):
         self.effects = []
+        self.active = False  # True while any effect is alive; lets callers skip idle frames
+    
+    def _add_effect(self, effect):
+        """Register a new effect and mark the system as active"""
+        self.effects.append(effect)
+        self.active = True
     
     def create_bomb_explosion(self, x: float, y: float):
         """Create pixel art bomb explosion"""
         effect = PixelExplosionEffect(x, y)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_rocket_trail(self, start_x: float, start_y: float, direction: str, board_bounds: Tuple[int, int, int, int]):
         """Create rocket trail effect
@@ -217,16 +244,16 @@ class PixelParticleSystem:
         """
         if direction == 'horizontal':
             effect = RocketTrailEffect(start_x, start_y, 'horizontal', board_bounds)
-            self.effects.append(effect)
+            self._add_effect(effect)
         elif direction == 'vertical':
             effect = RocketTrailEffect(start_x, start_y, 'vertical', board_bounds)
-            self.effects.append(effect)
+            self._add_effect(effect)
         elif direction == 'cross':
             # Create both horizontal and vertical trails for cross pattern
             h_effect = RocketTrailEffect(start_x, start_y, 'horizontal', board_bounds)
             v_effect = RocketTrailEffect(start_x, start_y, 'vertical', board_bounds)
-            self.effects.append(h_effect)
-            self.effects.append(v_effect)
+            self._add_effect(h_effect)
+            self._add_effect(v_effect)
     
     def create_bomb_rocket_trail(self, start_x: float, start_y: float, board_bounds: Tuple[int, int, int, int]):
         """Create large bomb-colored rocket trail in cross pattern (3-wide)"""
@@ -234,51 +261,50 @@ class PixelParticleSystem:
         for offset in [-1, 0, 1]:
             adjusted_y = start_y + (offset * 32)  # Assuming 32px tile size for spacing
             h_effect = BombRocketTrailEffect(start_x, adjusted_y, 'horizontal', board_bounds)
-            self.effects.append(h_effect)
+            self._add_effect(h_effect)
         
         # Create three vertical trails (3-wide effect)
         for offset in [-1, 0, 1]:
             adjusted_x = start_x + (offset * 32)  # Assuming 32px tile size for spacing
             v_effect = BombRocketTrailEffect(adjusted_x, start_y, 'vertical', board_bounds)
-            self.effects.append(v_effect)
+            self._add_effect(v_effect)
     
     def create_lightning_arc(self, x: float, y: float):
         """Create dramatic lightning arc effect"""
         effect = LightningArcEffect(x, y)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_board_wipe_arcs(self, start_x: float, start_y: float, target_positions: List[Tuple[float, float]], target_color):
         """Create board wipe arcing lines effect"""
         effect = BoardWipeArcEffect(start_x, start_y, target_positions, target_color)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_row_lightning_arc(self, row: int, direction: str, board_bounds: Tuple[int, int, int, int]):
         """Create lightning arc that blasts across an entire row"""
         effect = RowLightningArcEffect(row, direction, board_bounds)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_nuclear_megabomb(self, x: float, y: float):
         """Create nuclear-style megabomb explosion with shockwave, smoke, and massive explosion"""
         effect = NuclearMegabombEffect(x, y)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_black_hole_lightning_explosion(self, x: float, y: float):
         """Create massive lightning explosion from black hole center"""
         effect = BlackHoleLightningExplosion(x, y)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def update(self, dt: float):
         """Update all effects with optimized cleanup"""
-        # Update effects and collect finished ones for removal
-        finished_effects = []
+        # Update effects and keep the live ones in a single pass (no per-effect list.remove)
+        alive = []
         for effect in self.effects:
             effect.update(dt)
-            if effect.is_finished():
-                finished_effects.append(effect)
+            if not effect.is_finished():
+                alive.append(effect)
+        self.effects[:] = alive
         
-        # Remove finished effects in batch (more efficient)
-        for finished in finished_effects:
-            self.effects.remove(finished)
+        self.active = len(self.effects) > 0
     
     def draw(self, screen: pygame.Surface):
         """Draw all effects with performance budgeting"""
@@ -292,17 +318,17 @@ class PixelParticleSystem:
     def create_diagonal_lightning(self, start_x: float, start_y: float, end_x: float, end_y: float, color: Tuple[int, int, int], thickness: int):
         """Create diagonal lightning effect for Reality Break"""
         effect = DiagonalLightningEffect(start_x, start_y, end_x, end_y, color, thickness)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_reality_black_hole(self, center_x: float, center_y: float):
         """Create reality-consuming black hole effect"""
         effect = RealityBlackHoleEffect(center_x, center_y)
-        self.effects.append(effect)
+        self._add_effect(effect)
     
     def create_white_singularity(self, center_x: float, center_y: float):
         """Create white singularity collapse effect"""
         effect = WhiteSingularityEffect(center_x, center_y)
-        self.effects.append(effect)
+        self._add_effect(effect)
 
     def is_finished(self) -> bool:
         """Check if all effects are finished"""
@@ -453,7 +479,9 @@ class PixelExplosionEffect:
         """Update explosion particles with dramatic layered physics"""
         self.elapsed += dt
         
-        for particle in self.particles[:]:
+        # Single pass: step every particle and keep the live ones (no list copy or list.remove)
+        alive = []
+        for particle in self.particles:
             # Update position
             particle['x'] += particle['vx'] * dt
             particle['y'] += particle['vy'] * dt
@@ -488,11 +516,15 @@ class PixelExplosionEffect:
             # Update life
             particle['life'] -= dt
             
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw explosion particles with dramatic layered effect"""
+        # Debris and smoke are queued and blitted in one batch; they are created after the
+        # rect-drawn layers, so drawing them last keeps the original layering
+        batch = []
         for particle in self.particles:
             life_ratio = particle['life'] / particle['max_life']
             
@@ -518,11 +550,14 @@ class PixelExplosionEffect:
                     
                 elif particle['type'] == 'debris':
                     # Draw irregular debris chunks
-                    self._draw_debris_rect(screen, x, y, size, particle['color'], alpha)
+                    self._draw_debris_rect(batch, x, y, size, particle['color'], alpha)
                     
                 else:  # smoke
                     # Draw large billowing smoke
-                    self._draw_large_smoke(screen, x, y, size, particle['color'], alpha)
+                    self._draw_large_smoke(batch, x, y, size, particle['color'], alpha)
+        
+        if batch:
+            screen.blits(batch, doreturn=False)
     
     def _draw_pixel_square(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
         """Draw a pixelated square with clean edges - pure pixel art"""
@@ -597,8 +632,8 @@ class PixelExplosionEffect:
             rect = pygame.Rect(pixel_x - pixel_size // 2, pixel_y - pixel_size // 2, pixel_size, pixel_size)
             pygame.draw.rect(screen, adjusted_color, rect)
     
-    def _draw_debris_rect(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
-        """Draw irregular debris chunks with rotation effect"""
+    def _draw_debris_rect(self, batch: list, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
+        """Queue irregular debris chunks with rotation effect"""
         # Snap to pixel grid
         pixel_x = (x // 2) * 2
         pixel_y = (y // 2) * 2
@@ -608,33 +643,26 @@ class PixelExplosionEffect:
         w = pixel_size
         h = max(2, pixel_size * 2 // 3)  # Rectangular chunks
         
-        surf = pygame.Surface((w, h))
-        surf.fill(color)
-        surf.set_alpha(alpha)
-        screen.blit(surf, (pixel_x - w // 2, pixel_y - h // 2))
+        batch.append((_solid_surface(w, h, color, alpha), (pixel_x - w // 2, pixel_y - h // 2)))
         
         # Add some smaller fragments nearby
         if alpha > 80 and random.random() > 0.7:  # 30% chance for fragments
             frag_size = max(1, pixel_size // 3)
-            frag_surf = pygame.Surface((frag_size, frag_size))
-            frag_surf.fill(color)
-            frag_surf.set_alpha(alpha // 2)
+            frag_surf = _solid_surface(frag_size, frag_size, color, alpha // 2)
             offset_x = random.randint(-pixel_size, pixel_size)
             offset_y = random.randint(-pixel_size, pixel_size)
-            screen.blit(frag_surf, (pixel_x + offset_x, pixel_y + offset_y))
+            batch.append((frag_surf, (pixel_x + offset_x, pixel_y + offset_y)))
     
-    def _draw_large_smoke(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
-        """Draw large billowing smoke clouds"""
+    def _draw_large_smoke(self, batch: list, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
+        """Queue large billowing smoke clouds"""
         # Snap to larger pixel grid for chunky smoke
         pixel_x = (x // 4) * 4
         pixel_y = (y // 4) * 4  
         pixel_size = max(6, (size // 3) * 3)
         
         # Draw main smoke cloud
-        surf = pygame.Surface((pixel_size, pixel_size))
-        surf.fill(color)
-        surf.set_alpha(alpha // 3)  # Very transparent smoke
-        screen.blit(surf, (pixel_x - pixel_size // 2, pixel_y - pixel_size // 2))
+        surf = _solid_surface(pixel_size, pixel_size, color, alpha // 3)  # Very transparent smoke
+        batch.append((surf, (pixel_x - pixel_size // 2, pixel_y - pixel_size // 2)))
         
         # Add some wispy edges
         if alpha > 60:
@@ -642,10 +670,8 @@ class PixelExplosionEffect:
                 wisp_x = pixel_x + random.randint(-pixel_size//2, pixel_size//2)
                 wisp_y = pixel_y + random.randint(-pixel_size//2, pixel_size//2)
                 wisp_size = max(2, pixel_size // 3)
-                wisp_surf = pygame.Surface((wisp_size, wisp_size))
-                wisp_surf.fill(color)
-                wisp_surf.set_alpha(alpha // 5)  # Even more transparent
-                screen.blit(wisp_surf, (wisp_x - wisp_size // 2, wisp_y - wisp_size // 2))
+                wisp_surf = _solid_surface(wisp_size, wisp_size, color, alpha // 5)  # Even more transparent
+                batch.append((wisp_surf, (wisp_x - wisp_size // 2, wisp_y - wisp_size // 2)))
     
     def _draw_fuzzy_square(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
         """Draw a fuzzy square for smoke with some transparency variation"""
@@ -767,7 +793,9 @@ class RocketTrailEffect:
         """Update rocket trail effect"""
         self.elapsed += dt
         
-        for particle in self.particles[:]:
+        alive = []
+        spawned = []  # Trail particles created this frame start updating next frame
+        for particle in self.particles:
             # Update rocket position
             old_x, old_y = particle['x'], particle['y']
             particle['x'] += particle['vx'] * dt
@@ -812,15 +840,17 @@ class RocketTrailEffect:
                             'size': random.randint(4, 8),
                             'type': 'trail'
                         }
-                        self.particles.append(trail_particle)
+                        spawned.append(trail_particle)
             
             # Update particle life
             if particle['type'] == 'trail':
                 particle['life'] -= dt
             
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            # Keep live particles
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
+        self.particles.extend(spawned)
     
     def draw(self, screen: pygame.Surface):
         """Draw rocket trail particles"""
@@ -996,7 +1026,9 @@ class BombRocketTrailEffect:
         """Update bomb rocket trail effect"""
         self.elapsed += dt
         
-        for particle in self.particles[:]:
+        alive = []
+        spawned = []  # Trail particles created this frame start updating next frame
+        for particle in self.particles:
             # Update rocket position
             old_x, old_y = particle['x'], particle['y']
             particle['x'] += particle['vx'] * dt
@@ -1043,15 +1075,17 @@ class BombRocketTrailEffect:
                             'size': random.randint(6, 12),  # MUCH bigger trail particles
                             'type': 'bomb_trail'
                         }
-                        self.particles.append(trail_particle)
+                        spawned.append(trail_particle)
             
             # Update particle life
             if particle['type'] == 'bomb_trail':
                 particle['life'] -= dt
             
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            # Keep live particles
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
+        self.particles.extend(spawned)
     
     def draw(self, screen: pygame.Surface):
         """Draw bomb rocket trail particles"""
@@ -1256,7 +1290,8 @@ class LightningArcEffect:
                 self._create_lightning_arc(i + 1)  # Arc sizes 1, 2, 3
         
         # Update all particles
-        for particle in self.particles[:]:
+        alive = []
+        for particle in self.particles:
             if particle['type'] == 'lightning_bolt':
                 # Lightning bolts just fade, don't move
                 particle['life'] -= dt
@@ -1277,9 +1312,10 @@ class LightningArcEffect:
                 particle['vy'] *= 0.90
                 particle['life'] -= dt
             
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            # Keep live particles
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw lightning arc with dramatic electrical effects"""
@@ -1544,7 +1580,8 @@ class RowLightningArcEffect:
         """Update row lightning arc effect"""
         self.elapsed += dt
         
-        for particle in self.particles[:]:
+        alive = []
+        for particle in self.particles:
             if particle['type'] == 'row_lightning':
                 # Lightning segments just fade
                 particle['life'] -= dt
@@ -1561,9 +1598,10 @@ class RowLightningArcEffect:
                 # Flash particles just fade quickly
                 particle['life'] -= dt
             
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            # Keep live particles
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw row lightning arc particles"""
@@ -1878,7 +1916,8 @@ class BoardWipeArcEffect:
                 self._create_sequential_arcs(stage['reach'])
         
         # Update all particles
-        for particle in self.particles[:]:
+        alive = []
+        for particle in self.particles:
             # Update based on particle type
             if particle['type'] == 'arc_segment':
                 # Arc segments just fade
@@ -1911,9 +1950,10 @@ class BoardWipeArcEffect:
                 particle['vy'] += random.uniform(-5, 5)
                 particle['life'] -= dt
             
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            # Keep live particles
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw board wipe arcing lines"""
@@ -2259,7 +2299,8 @@ class NuclearMegabombEffect:
             self._create_massive_explosion()
         
         # Update all particles
-        for particle in self.particles[:]:
+        alive = []
+        for particle in self.particles:
             particle['x'] += particle['vx'] * dt
             particle['y'] += particle['vy'] * dt
             
@@ -2279,11 +2320,14 @@ class NuclearMegabombEffect:
             
             particle['life'] -= dt
             
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw nuclear megabomb particles"""
+        # Every particle is a solid square, so queue them all and blit in one batch
+        batch = []
         for particle in self.particles:
             if particle['life'] <= 0:
                 continue
@@ -2297,47 +2341,44 @@ class NuclearMegabombEffect:
             
             # Draw different types with different styles
             if particle['type'] == 'shockwave':
-                self._draw_shockwave_particle(screen, x, y, size, color, alpha)
+                self._draw_shockwave_particle(batch, x, y, size, color, alpha)
             elif particle['type'] == 'smoke':
-                self._draw_smoke_particle(screen, x, y, size, color, alpha)
+                self._draw_smoke_particle(batch, x, y, size, color, alpha)
             else:
-                self._draw_explosion_particle(screen, x, y, size, color, alpha)
+                self._draw_explosion_particle(batch, x, y, size, color, alpha)
+        
+        if batch:
+            screen.blits(batch, doreturn=False)
     
-    def _draw_shockwave_particle(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
-        """Draw bright shockwave particle as larger connected shape"""
+    def _draw_shockwave_particle(self, batch: list, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
+        """Queue bright shockwave particle as larger connected shape"""
         pixel_size = max(4, size)  # Much larger shockwave particles
         pixel_x = (x // 2) * 2
         pixel_y = (y // 2) * 2
         
         # Draw as larger connected square for better circle visibility
-        surf = pygame.Surface((pixel_size * 3, pixel_size * 3))
-        surf.fill(color)
-        surf.set_alpha(alpha)
-        screen.blit(surf, (pixel_x - (pixel_size * 3) // 2, pixel_y - (pixel_size * 3) // 2))
+        surf = _solid_surface(pixel_size * 3, pixel_size * 3, color, alpha)
+        batch.append((surf, (pixel_x - (pixel_size * 3) // 2, pixel_y - (pixel_size * 3) // 2)))
     
-    def _draw_smoke_particle(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
-        """Draw large smoke cloud"""
+    def _draw_smoke_particle(self, batch: list, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
+        """Queue large smoke cloud"""
         pixel_size = max(6, size // 2)  # Much larger smoke clouds
         pixel_x = (x // 4) * 4
         pixel_y = (y // 4) * 4
         
         # Draw as much larger chunky cloud
-        surf = pygame.Surface((pixel_size * 4, pixel_size * 4))
-        surf.fill(color)
-        surf.set_alpha(alpha)
-        screen.blit(surf, (pixel_x - pixel_size * 2, pixel_y - pixel_size * 2))
+        surf = _solid_surface(pixel_size * 4, pixel_size * 4, color, alpha)
+        batch.append((surf, (pixel_x - pixel_size * 2, pixel_y - pixel_size * 2)))
     
-    def _draw_explosion_particle(self, screen: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
-        """Draw massive explosion particle"""
+    def _draw_explosion_particle(self, batch: list, x: int, y: int, size: int, color: Tuple[int, int, int], alpha: int):
+        """Queue massive explosion particle"""
         pixel_size = max(8, size // 3)  # Much larger explosion particles
         pixel_x = (x // 6) * 6
         pixel_y = (y // 6) * 6
         
         # Draw as huge explosion chunks
-        surf = pygame.Surface((pixel_size * 6, pixel_size * 6))
-        surf.fill(color)
-        surf.set_alpha(alpha)
-        screen.blit(surf, (pixel_x - pixel_size * 3, pixel_y - pixel_size * 3))
+        surf = _solid_surface(pixel_size * 6, pixel_size * 6, color, alpha)
+        batch.append((surf, (pixel_x - pixel_size * 3, pixel_y - pixel_size * 3)))
     
     def is_finished(self) -> bool:
         """Check if effect is finished"""
@@ -2445,7 +2486,8 @@ class BlackHoleLightningExplosion:
         """Update black hole lightning explosion"""
         self.elapsed += dt
         
-        for particle in self.particles[:]:
+        alive = []
+        for particle in self.particles:
             if particle['type'] == 'lightning_bolt':
                 # Lightning bolts just fade
                 particle['life'] -= dt
@@ -2462,8 +2504,9 @@ class BlackHoleLightningExplosion:
                 # Flash particles just fade
                 particle['life'] -= dt
             
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            if particle['life'] > 0:
+                alive.append(particle)
+        self.particles[:] = alive
     
     def draw(self, screen: pygame.Surface):
         """Draw black hole lightning explosion"""
@@ -1,9 +1,7 @@
 import random
-from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Iterator, List, Optional, Set, Tuple
 from enum import Enum
-
-if TYPE_CHECKING:
-    from special_tiles import SpecialTile
+from special_tiles import SpecialTile, SpecialTileType, TileDeck, create_special_tile
 
 class TileColor(Enum):
     RED = (255, 0, 0)
@@ -21,6 +19,39 @@ class MatchType(Enum):
     CORNER = "corner"
     T_SHAPE = "t_shape"
 
+# Special match shapes as (row, col) offsets from the placement's top-left cell
+_SQUARE_PATTERNS = [
+    [(0, 0), (0, 1), (1, 0), (1, 1)],
+]
+
+# L-shaped corners. Pattern: xxx
+#                            xoo
+#                            xoo
+_CORNER_PATTERNS = [
+    # Top-left corner (xxx pattern at top)
+    [(0, 0), (0, 1), (0, 2), (1, 0), (2, 0)],  # xxx at top, x column down
+    # Top-right corner (xxx pattern at top)
+    [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],  # xxx at top, x column down right
+    # Bottom-left corner (xxx pattern at bottom)
+    [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)],  # x column down, xxx at bottom
+    # Bottom-right corner (xxx pattern at bottom)
+    [(0, 2), (1, 2), (2, 0), (2, 1), (2, 2)],  # x column down right, xxx at bottom
+]
+
+# T shapes in all 4 orientations. Pattern: xxx
+#                                          oxo
+#                                          oxo
+_T_PATTERNS = [
+    # T with horizontal top (xxx at top, vertical line down middle)
+    [(0, 0), (0, 1), (0, 2), (1, 1), (2, 1)],  # xxx at top, line down middle
+    # T with horizontal bottom (xxx at bottom, vertical line up middle)
+    [(0, 1), (1, 1), (2, 0), (2, 1), (2, 2)],  # line up middle, xxx at bottom
+    # T with vertical left (xxx on left, horizontal line right middle)
+    [(0, 0), (1, 0), (2, 0), (1, 1), (1, 2)],  # xxx on left, line right middle
+    # T with vertical right (xxx on right, horizontal line left middle)
+    [(0, 2), (1, 0), (1, 1), (1, 2), (2, 2)],  # line left middle, xxx on right
+]
+
 class Tile:
     """Represents a single tile in the game"""
     
@@ -56,6 +87,8 @@ class Match:
     def __init__(self, positions: List[Tuple[int, int]], match_type: MatchType):
         self.positions = positions
         self.match_type = match_type
+        self.is_special_combo = False  # Scored as a special tile combo
+        self.has_special_tile = False  # Scored as a special tile match
         self.score = self.calculate_score()
     
     def calculate_score(self):
@@ -82,9 +115,6 @@ class Board:
                            TileColor.YELLOW, TileColor.ORANGE]
         self.available_colors = self.base_colors.copy()
         self.excluded_colors = set()
-        
-        # Import here to avoid circular imports
-        from special_tiles import TileDeck
         self.tile_deck = TileDeck()
     
     def generate_initial_board(self):
@@ -145,6 +175,46 @@ class Board:
         if 0 <= row < self.height and 0 <= col < self.width:
             self.grid[row][col] = tile
     
+    def clear_row(self, row: int):
+        """Remove every tile in a row"""
+        if 0 <= row < self.height:
+            self.grid[row][:] = [None] * self.width
+    
+    def clear_column(self, col: int):
+        """Remove every tile in a column"""
+        if 0 <= col < self.width:
+            for grid_row in self.grid:
+                grid_row[col] = None
+    
+    def clear_all(self):
+        """Remove every tile from the board"""
+        self.grid = [[None] * self.width for _ in range(self.height)]
+    
+    def clear_positions(self, positions: List[Tuple[int, int]]):
+        """Remove the tiles at all given positions, ignoring any outside the board"""
+        grid = self.grid
+        height, width = self.height, self.width
+        for row, col in positions:
+            if 0 <= row < height and 0 <= col < width:
+                grid[row][col] = None
+    
+    def get_positions_with_color(self, color: TileColor) -> List[Tuple[int, int]]:
+        """Get all positions holding a non-empty tile of the given color, in row-major order"""
+        if color == TileColor.EMPTY:
+            return []
+        # Walk the grid rows directly rather than going through get_tile's bounds checks per cell
+        return [(row, col)
+                for row, grid_row in enumerate(self.grid)
+                for col, tile in enumerate(grid_row)
+                if tile and tile.color == color]
+    
+    def iter_occupied(self) -> Iterator[Tuple[int, int, Tile]]:
+        """Yield (row, col, tile) for every non-empty tile, in row-major order"""
+        for row, grid_row in enumerate(self.grid):
+            for col, tile in enumerate(grid_row):
+                if tile and not tile.is_empty():
+                    yield row, col, tile
+    
     def swap_tiles(self, pos1: Tuple[int, int], pos2: Tuple[int, int]):
         """Swap two tiles on the board"""
         row1, col1 = pos1
@@ -154,78 +224,90 @@ class Board:
             0 <= row2 < self.height and 0 <= col2 < self.width):
             self.grid[row1][col1], self.grid[row2][col2] = self.grid[row2][col2], self.grid[row1][col1]
     
+    def get_color_grid(self) -> List[List[Optional[TileColor]]]:
+        """Snapshot of each cell's color, with None for missing and EMPTY tiles"""
+        empty = TileColor.EMPTY
+        return [[tile.color if tile is not None and tile.color != empty else None for tile in grid_row]
+                for grid_row in self.grid]
+    
     def find_all_matches(self) -> List[Match]:
         """Find all matches on the board"""
+        # Every matcher compares plain colors from one snapshot instead of re-reading tiles
+        return self.find_matches_in_colors(self.get_color_grid())
+    
+    def find_matches_in_colors(self, colors: List[List[Optional[TileColor]]]) -> List[Match]:
+        """Find all matches in a color grid laid out like get_color_grid's snapshot"""
         matches = []
         processed_positions = set()
         
         # Find special pattern matches FIRST (they have higher priority)
-        matches.extend(self.find_corner_matches(processed_positions))
-        matches.extend(self.find_t_matches(processed_positions))
-        matches.extend(self.find_square_matches(processed_positions))
+        matches.extend(self.find_corner_matches(processed_positions, colors))
+        matches.extend(self.find_t_matches(processed_positions, colors))
+        matches.extend(self.find_square_matches(processed_positions, colors))
         
         # Then find horizontal and vertical line matches
-        matches.extend(self.find_line_matches(processed_positions))
+        matches.extend(self.find_line_matches(processed_positions, colors))
         
         return matches
     
-    def find_line_matches(self, processed_positions: Set[Tuple[int, int]]) -> List[Match]:
+    def find_line_matches(self, processed_positions: Set[Tuple[int, int]],
+                          colors: Optional[List[List[Optional[TileColor]]]] = None) -> List[Match]:
         """Find horizontal and vertical line matches"""
+        if colors is None:
+            colors = self.get_color_grid()
         matches = []
+        width, height = self.width, self.height
         
         # Check horizontal matches
-        for row in range(self.height):
+        for row in range(height):
+            color_row = colors[row]
             col = 0
-            while col < self.width:
-                if self.grid[row][col] and not self.grid[row][col].is_empty():
-                    color = self.grid[row][col].color
-                    match_positions = [(row, col)]
-                    
-                    # Extend match to the right
-                    next_col = col + 1
-                    while (next_col < self.width and self.grid[row][next_col] and 
-                           self.grid[row][next_col].color == color):
-                        match_positions.append((row, next_col))
-                        next_col += 1
-                    
-                    # Create match if 3 or more tiles
-                    if len(match_positions) >= 3:
-                        # Skip if already processed
-                        if not any(pos in processed_positions for pos in match_positions):
-                            match_type = self.get_line_match_type(len(match_positions))
-                            matches.append(Match(match_positions, match_type))
-                            processed_positions.update(match_positions)
-                    
-                    col = max(col + 1, next_col)
-                else:
+            while col < width:
+                color = color_row[col]
+                if color is None:
                     col += 1
+                    continue
+                
+                # Extend match to the right
+                next_col = col + 1
+                while next_col < width and color_row[next_col] == color:
+                    next_col += 1
+                
+                # Create match if 3 or more tiles
+                if next_col - col >= 3:
+                    match_positions = [(row, c) for c in range(col, next_col)]
+                    # Skip if already processed
+                    if processed_positions.isdisjoint(match_positions):
+                        match_type = self.get_line_match_type(len(match_positions))
+                        matches.append(Match(match_positions, match_type))
+                        processed_positions.update(match_positions)
+                
+                col = next_col
         
         # Check vertical matches
-        for col in range(self.width):
+        for col in range(width):
             row = 0
-            while row < self.height:
-                if self.grid[row][col] and not self.grid[row][col].is_empty():
-                    color = self.grid[row][col].color
-                    match_positions = [(row, col)]
-                    
-                    # Extend match downward
-                    next_row = row + 1
-                    while (next_row < self.height and self.grid[next_row][col] and 
-                           self.grid[next_row][col].color == color):
-                        match_positions.append((next_row, col))
-                        next_row += 1
-                    
-                    # Create match if 3 or more tiles
-                    if len(match_positions) >= 3:
-                        # Skip if already processed
-                        if not any(pos in processed_positions for pos in match_positions):
-                            match_type = self.get_line_match_type(len(match_positions))
-                            matches.append(Match(match_positions, match_type))
-                            processed_positions.update(match_positions)
-                    
-                    row = max(row + 1, next_row)
-                else:
+            while row < height:
+                color = colors[row][col]
+                if color is None:
                     row += 1
+                    continue
+                
+                # Extend match downward
+                next_row = row + 1
+                while next_row < height and colors[next_row][col] == color:
+                    next_row += 1
+                
+                # Create match if 3 or more tiles
+                if next_row - row >= 3:
+                    match_positions = [(r, col) for r in range(row, next_row)]
+                    # Skip if already processed
+                    if processed_positions.isdisjoint(match_positions):
+                        match_type = self.get_line_match_type(len(match_positions))
+                        matches.append(Match(match_positions, match_type))
+                        processed_positions.update(match_positions)
+                
+                row = next_row
         
         return matches
     
@@ -238,100 +320,52 @@ class Board:
         else:
             return MatchType.FIVE
     
-    def find_square_matches(self, processed_positions: Set[Tuple[int, int]]) -> List[Match]:
-        """Find 2x2 square matches"""
+    def _find_pattern_matches(self, patterns: List[List[Tuple[int, int]]], match_type: MatchType,
+                              processed_positions: Set[Tuple[int, int]],
+                              colors: List[List[Optional[TileColor]]]) -> List[Match]:
+        """Find every placement of the given same-color patterns, in row, column, pattern order"""
         matches = []
-        
-        for row in range(self.height - 1):
-            for col in range(self.width - 1):
-                positions = [(row, col), (row, col + 1), (row + 1, col), (row + 1, col + 1)]
-                
-                # Check if all positions have the same color
-                tiles = [self.grid[r][c] for r, c in positions]
-                if (all(tile and not tile.is_empty() for tile in tiles) and
-                    all(tile.color == tiles[0].color for tile in tiles) and
-                    not any(pos in processed_positions for pos in positions)):
+        pattern_height = max(dr for pattern in patterns for dr, _ in pattern) + 1
+        pattern_width = max(dc for pattern in patterns for _, dc in pattern) + 1
+        
+        # Only placements that fit entirely on the board can match
+        for row in range(self.height - pattern_height + 1):
+            for col in range(self.width - pattern_width + 1):
+                for pattern in patterns:
+                    first_dr, first_dc = pattern[0]
+                    color = colors[row + first_dr][col + first_dc]
+                    if color is None:
+                        continue
+                    if any(colors[row + dr][col + dc] != color for dr, dc in pattern):
+                        continue
                     
-                    matches.append(Match(positions, MatchType.SQUARE))
-                    processed_positions.update(positions)
+                    positions = [(row + dr, col + dc) for dr, dc in pattern]
+                    if processed_positions.isdisjoint(positions):
+                        matches.append(Match(positions, match_type))
+                        processed_positions.update(positions)
         
         return matches
     
-    def find_corner_matches(self, processed_positions: Set[Tuple[int, int]]) -> List[Match]:
+    def find_square_matches(self, processed_positions: Set[Tuple[int, int]],
+                            colors: Optional[List[List[Optional[TileColor]]]] = None) -> List[Match]:
+        """Find 2x2 square matches"""
+        if colors is None:
+            colors = self.get_color_grid()
+        return self._find_pattern_matches(_SQUARE_PATTERNS, MatchType.SQUARE, processed_positions, colors)
+    
+    def find_corner_matches(self, processed_positions: Set[Tuple[int, int]],
+                            colors: Optional[List[List[Optional[TileColor]]]] = None) -> List[Match]:
         """Find L-shaped corner matches"""
-        matches = []
-        
-        # Define corner patterns (relative positions) - L-shapes as you specified
-        # Pattern: xxx
-        #          xoo  
-        #          xoo
-        corner_patterns = [
-            # Top-left corner (xxx pattern at top)
-            [(0, 0), (0, 1), (0, 2), (1, 0), (2, 0)],  # xxx at top, x column down
-            # Top-right corner (xxx pattern at top)
-            [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],  # xxx at top, x column down right
-            # Bottom-left corner (xxx pattern at bottom)
-            [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)],  # x column down, xxx at bottom
-            # Bottom-right corner (xxx pattern at bottom)
-            [(0, 2), (1, 2), (2, 0), (2, 1), (2, 2)],  # x column down right, xxx at bottom
-        ]
-        
-        # Check all possible positions on the board
-        for row in range(self.height):
-            for col in range(self.width):
-                for pattern in corner_patterns:
-                    positions = [(row + dr, col + dc) for dr, dc in pattern]
-                    
-                    # Check bounds
-                    if all(0 <= r < self.height and 0 <= c < self.width for r, c in positions):
-                        tiles = [self.grid[r][c] for r, c in positions]
-                        
-                        if (all(tile and not tile.is_empty() for tile in tiles) and
-                            all(tile.color == tiles[0].color for tile in tiles) and
-                            not any(pos in processed_positions for pos in positions)):
-                            
-                            matches.append(Match(positions, MatchType.CORNER))
-                            processed_positions.update(positions)
-        
-        return matches
+        if colors is None:
+            colors = self.get_color_grid()
+        return self._find_pattern_matches(_CORNER_PATTERNS, MatchType.CORNER, processed_positions, colors)
     
-    def find_t_matches(self, processed_positions: Set[Tuple[int, int]]) -> List[Match]:
+    def find_t_matches(self, processed_positions: Set[Tuple[int, int]],
+                       colors: Optional[List[List[Optional[TileColor]]]] = None) -> List[Match]:
         """Find T-shaped matches"""
-        matches = []
-        
-        # Define T patterns (relative positions) - All 4 orientations
-        # Pattern: xxx
-        #          oxo
-        #          oxo
-        t_patterns = [
-            # T with horizontal top (xxx at top, vertical line down middle)
-            [(0, 0), (0, 1), (0, 2), (1, 1), (2, 1)],  # xxx at top, line down middle
-            # T with horizontal bottom (xxx at bottom, vertical line up middle)  
-            [(0, 1), (1, 1), (2, 0), (2, 1), (2, 2)],  # line up middle, xxx at bottom
-            # T with vertical left (xxx on left, horizontal line right middle)
-            [(0, 0), (1, 0), (2, 0), (1, 1), (1, 2)],  # xxx on left, line right middle
-            # T with vertical right (xxx on right, horizontal line left middle)
-            [(0, 2), (1, 0), (1, 1), (1, 2), (2, 2)],  # line left middle, xxx on right
-        ]
-        
-        # Check all possible positions on the board
-        for row in range(self.height):
-            for col in range(self.width):
-                for pattern in t_patterns:
-                    positions = [(row + dr, col + dc) for dr, dc in pattern]
-                    
-                    # Check bounds
-                    if all(0 <= r < self.height and 0 <= c < self.width for r, c in positions):
-                        tiles = [self.grid[r][c] for r, c in positions]
-                        
-                        if (all(tile and not tile.is_empty() for tile in tiles) and
-                            all(tile.color == tiles[0].color for tile in tiles) and
-                            not any(pos in processed_positions for pos in positions)):
-                            
-                            matches.append(Match(positions, MatchType.T_SHAPE))
-                            processed_positions.update(positions)
-        
-        return matches
+        if colors is None:
+            colors = self.get_color_grid()
+        return self._find_pattern_matches(_T_PATTERNS, MatchType.T_SHAPE, processed_positions, colors)
     
     def clear_matches(self, match: Match):
         """Clear tiles from a match and potentially create special tiles"""
@@ -411,29 +445,27 @@ class Board:
     def apply_gravity_with_animation_data(self):
         """Apply gravity and return data for animations"""
         fall_data = {}
+        grid = self.grid
+        bottom_row = self.height - 1
         
         for col in range(self.width):
-            fall_data[col] = []
-            
-            # Collect non-empty tiles with their current positions
-            tiles_with_positions = []
-            for row in range(self.height - 1, -1, -1):
-                if self.grid[row][col] is not None:
-                    tiles_with_positions.append((row, self.grid[row][col]))
-                self.grid[row][col] = None
+            col_falls = fall_data[col] = []
             
-            # Place tiles from bottom up and record movements
-            for i, (original_row, tile) in enumerate(tiles_with_positions):
-                new_row = self.height - 1 - i
-                
+            # Walk the column bottom-up, dropping each tile to the next free row from the bottom
+            new_row = bottom_row
+            for original_row in range(bottom_row, -1, -1):
+                tile = grid[original_row][col]
+                if tile is None:
+                    continue
                 if original_row != new_row:
-                    fall_data[col].append({
+                    col_falls.append({
                         'from_row': original_row,
                         'to_row': new_row,
                         'tile': tile
                     })
-                
-                self.grid[new_row][col] = tile
+                    grid[new_row][col] = tile
+                    grid[original_row][col] = None
+                new_row -= 1
         
         return fall_data
     
@@ -446,35 +478,47 @@ class Board:
                     self.grid[row][col] = Tile(color)
     
     def fill_empty_spaces_with_fall_data(self):
-        """Fill empty spaces with new random tiles marked for animation"""
+        """Fill empty spaces with new random tiles and return them per column, top to bottom, for animation"""
+        spawn_data = {}
+        grid = self.grid
+        available_colors = self.available_colors
+        
         for col in range(self.width):
-            for row in range(self.height):
-                if self.grid[row][col] is None:
-                    color = random.choice(self.available_colors)
-                    tile = Tile(color)
-                    tile.newly_spawned = True  # Mark for animation
-                    self.grid[row][col] = tile
+            col_spawns = spawn_data[col] = []
+            for row, grid_row in enumerate(grid):
+                if grid_row[col] is None:
+                    tile = Tile(random.choice(available_colors))
+                    grid_row[col] = tile
+                    col_spawns.append((row, tile))
+        
+        return spawn_data
     
     def has_possible_moves(self) -> bool:
         """Check if there are any possible moves on the board"""
+        # Matches depend only on colors, so try each swap on one color snapshot rather than
+        # swapping tiles and re-reading the whole grid for every candidate
+        colors = self.get_color_grid()
+        
         # Try swapping each adjacent pair and check for matches
         for row in range(self.height):
+            color_row = colors[row]
             for col in range(self.width):
                 # Check right neighbor
                 if col < self.width - 1:
-                    self.swap_tiles((row, col), (row, col + 1))
-                    if self.find_all_matches():
-                        self.swap_tiles((row, col), (row, col + 1))  # Swap back
+                    color_row[col], color_row[col + 1] = color_row[col + 1], color_row[col]
+                    found = bool(self.find_matches_in_colors(colors))
+                    color_row[col], color_row[col + 1] = color_row[col + 1], color_row[col]  # Swap back
+                    if found:
                         return True
-                    self.swap_tiles((row, col), (row, col + 1))  # Swap back
                 
                 # Check bottom neighbor
                 if row < self.height - 1:
-                    self.swap_tiles((row, col), (row + 1, col))
-                    if self.find_all_matches():
-                        self.swap_tiles((row, col), (row + 1, col))  # Swap back
+                    below = colors[row + 1]
+                    color_row[col], below[col] = below[col], color_row[col]
+                    found = bool(self.find_matches_in_colors(colors))
+                    color_row[col], below[col] = below[col], color_row[col]  # Swap back
+                    if found:
                         return True
-                    self.swap_tiles((row, col), (row + 1, col))  # Swap back
         
         return False
     
@@ -625,9 +669,6 @@ class Board:
     
     def check_for_combo(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> Optional['SpecialTile']:
         """Check if swapping two special tiles creates a combo"""
-        # Import here to avoid circular imports
-        from special_tiles import SpecialTile, SpecialTileType, create_special_tile
-        
         tile1 = self.get_tile(*pos1)
         tile2 = self.get_tile(*pos2)
         
@@ -698,8 +739,6 @@ class Board:
     
     def get_special_tile_position(self, match: 'Match') -> Optional[Tuple[int, int]]:
         """Get the position where a special tile will be created for a match"""
-        from special_tiles import SpecialTileType
-        
         # Determine what type of special tile this match would create
         if match.match_type == MatchType.FOUR:
             # 4-match creates rocket at center
@@ -3,11 +3,12 @@ import random
 import sys
 import os
 import time
+import logging
 from typing import List, Tuple, Optional, Set
 import math
 from board import Board, Tile, TileColor, Match, MatchType
-from animations import FallAnimation, SwapAnimation, PulseAnimation, ParticleEffect, PopAnimation, PopParticle, SpawnAnimation, PlopOutAnimation, PhysicsEjectAnimation, ProgressiveRocketAnimation, BoardWipeChargingAnimation
-from special_tiles import SpecialTile, SpecialTileType
+from animations import FallAnimation, SwapAnimation, PulseAnimation, ParticleEffect, PopAnimation, PopParticleSystem, SpawnAnimation, PlopOutAnimation, PhysicsEjectAnimation, ProgressiveRocketAnimation, BoardWipeChargingAnimation
+from special_tiles import SpecialTile, SpecialTileType, create_special_tile
 from arcade_particles import PixelParticleSystem
 from levels import get_level_config, LevelConfig
 from level_select import LevelSelectScreen
@@ -16,6 +17,9 @@ from boss_ai import Match3AI, AIConfig, AIDifficulty
 # Initialize Pygame
 pygame.init()
 
+# Animation and combo progress messages; enable with logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
 # Constants
 WINDOW_WIDTH = 1920
 WINDOW_HEIGHT = 1080
@@ -27,16 +31,132 @@ GRID_COLOR = (100, 100, 100)
 SELECTED_COLOR = (255, 255, 255)
 MATCH_HIGHLIGHT_COLOR = (255, 255, 0, 128)  # Yellow with transparency
 
+# Distance from the black hole center (about the farthest tile) at which condensing tiles start to shrink
+_BLACK_HOLE_SHRINK_DISTANCE = 300
+
+# Effect color for each tile color (anything else is white)
+_TILE_EFFECT_COLORS = {
+    TileColor.RED: (255, 100, 100),
+    TileColor.GREEN: (100, 255, 100),
+    TileColor.BLUE: (100, 100, 255),
+    TileColor.YELLOW: (255, 255, 100),
+    TileColor.ORANGE: (255, 165, 0),
+}
+
+# Screen shake jitter in [-1, 1], read in pairs with a wrapping index. Drawn from a private
+# generator so shaking doesn't consume the game's random stream.
+_SHAKE_NOISE_SIZE = 2048  # Power of two so the index can wrap with a mask
+_shake_rng = random.Random(0)
+_SHAKE_NOISE = [_shake_rng.uniform(-1.0, 1.0) for _ in range(_SHAKE_NOISE_SIZE)]
+
+# Match3Game method that creates each special tile type's activation effect, see create_special_effect_particles
+_SPECIAL_FX_HANDLERS = {
+    SpecialTileType.BOMB: '_fx_bomb',
+    SpecialTileType.ROCKET_HORIZONTAL: '_fx_rocket_horizontal',
+    SpecialTileType.ROCKET_VERTICAL: '_fx_rocket_vertical',
+    SpecialTileType.SIMPLE_CROSS: '_fx_simple_cross',
+    SpecialTileType.LIGHTNING_CROSS: '_fx_lightning_cross',
+    SpecialTileType.BOMB_ROCKET: '_fx_bomb_rocket',
+    SpecialTileType.LIGHTNING: '_fx_lightning',
+    SpecialTileType.MEGA_BOMB: '_fx_mega_bomb',
+    SpecialTileType.ENERGIZED_BOMB: '_fx_energized_bomb',
+}
+
+# Screen shake (intensity, duration) started after a special tile's activation effect
+_SPECIAL_FX_SHAKE = {
+    SpecialTileType.BOMB: (12.0, 0.4),  # Strong shake for bombs
+    SpecialTileType.BOMB_ROCKET: (15.0, 0.5),  # Strongest shake for ultimate combo
+    SpecialTileType.LIGHTNING: (6.0, 0.25),  # Medium shake for lightning
+    SpecialTileType.MEGA_BOMB: (20.0, 0.8),  # ULTIMATE shake for nuclear bomb!
+}
+
+# Reality Break and Lightning Cross sequences: (seconds to wait, Match3Game method run next).
+# Methods are named rather than bound so the tables stay module-level and hold no game reference.
+_REALITY_BREAK_SCHEDULE = (
+    (0.8, 'start_diagonal_lightning_phase_2'),
+    (0.8, 'start_reality_black_hole_phase'),
+    (1.5, 'consume_reality_tiles'),  # Partway through the 3 second black hole expansion
+    (1.5, 'start_singularity_collapse'),
+    (1.0, 'complete_reality_break'),
+)
+_LIGHTNING_CROSS_SCHEDULE = (
+    (0.6, 'start_lightning_cross_arc_2'),
+    (0.6, 'start_lightning_cross_arc_3'),
+    (0.6, 'start_lightning_cross_arc_4'),
+    (0.6, 'complete_lightning_cross'),
+)
+
+# Special tiles the debug mode cycles through with TAB and places on click
+_DEBUG_SPECIAL_TYPES = (
+    SpecialTileType.ROCKET_HORIZONTAL,
+    SpecialTileType.ROCKET_VERTICAL,
+    SpecialTileType.BOMB,
+    SpecialTileType.LIGHTNING,
+    SpecialTileType.BOARD_WIPE,
+    SpecialTileType.BOMB_ROCKET,
+    SpecialTileType.BOMB_BOARDWIPE,
+    SpecialTileType.MEGA_BOMB,
+    SpecialTileType.ENERGIZED_BOMB,
+    SpecialTileType.ROCKET_BOARDWIPE,
+    SpecialTileType.ROCKET_LIGHTNING,
+    SpecialTileType.SIMPLE_CROSS,
+    SpecialTileType.LIGHTNING_CROSS,
+)
+_DEBUG_SPECIAL_TYPE_NAMES = tuple(special_type.name for special_type in _DEBUG_SPECIAL_TYPES)
+
+def create_display():
+    """Open the game window through SDL2's renderer path (SCALED) with vsync when the platform allows it"""
+    # Reuse an open window: SDL can fail to build a second SCALED renderer in the same process
+    screen = pygame.display.get_surface()
+    if screen is not None and screen.get_size() == (WINDOW_WIDTH, WINDOW_HEIGHT):
+        return screen
+    
+    flags = pygame.SCALED | pygame.DOUBLEBUF
+    try:
+        return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), flags, vsync=1)
+    except pygame.error:
+        # Some drivers refuse vsync; the renderer path is still worth having without it
+        return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), flags)
+
+class _SpriteStore:
+    """Source sprites held in fixed slots (None when the file is missing or failed to load)"""
+    __slots__ = ('red', 'green', 'blue', 'yellow', 'orange',
+                 'rocket', 'bomb', 'lightning', 'boardwipe', 'border')
+    
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+# Tile colors and special sprite types -> _SpriteStore slot holding their source sprite
+_SPRITE_ATTRS = {
+    TileColor.RED: 'red',
+    TileColor.GREEN: 'green',
+    TileColor.BLUE: 'blue',
+    TileColor.YELLOW: 'yellow',
+    TileColor.ORANGE: 'orange',
+    'rocket': 'rocket',
+    'bomb': 'bomb',
+    'lightning': 'lightning',
+    'boardwipe': 'boardwipe'
+}
+
 class SpriteManager:
     """Manages loading and caching of tile sprites"""
     
     def __init__(self):
-        self.tile_sprites = {}
+        self._store = _SpriteStore()
+        self._scaled_cache = {}  # (sprite key, size...) -> scaled Surface, built on first request
+        self._atlas_cache = {}  # tile size -> (atlas Surface, {sprite key: source Rect})
         self.sprites_path = os.path.join(os.path.dirname(__file__), "sprites", "tiles")
         self.load_tile_sprites()
     
     def load_tile_sprites(self):
         """Load all tile sprites from the sprites/tiles directory"""
+        # Scaled copies of the previous sources are stale once we reload
+        self._scaled_cache.clear()
+        self._atlas_cache.clear()
+        store = self._store
+        
         sprite_files = {
             TileColor.RED: "redtile.png",
             TileColor.GREEN: "greentile.png", 
@@ -51,15 +171,15 @@ class SpriteManager:
             if os.path.exists(filepath):
                 try:
                     sprite = pygame.image.load(filepath).convert_alpha()
-                    self.tile_sprites[color] = sprite
+                    setattr(store, _SPRITE_ATTRS[color], sprite)
                     print(f"✓ Loaded sprite for {color.name}: {filename}")
                 except pygame.error as e:
                     print(f"✗ Failed to load {filename}: {e}")
                     # Fallback to solid color
-                    self.tile_sprites[color] = None
+                    setattr(store, _SPRITE_ATTRS[color], None)
             else:
                 print(f"✗ Sprite file not found: {filepath}")
-                self.tile_sprites[color] = None
+                setattr(store, _SPRITE_ATTRS[color], None)
         
         # Load special tile sprites
         special_sprites = {
@@ -74,74 +194,147 @@ class SpriteManager:
             if os.path.exists(filepath):
                 try:
                     sprite = pygame.image.load(filepath).convert_alpha()
-                    self.tile_sprites[special_type] = sprite
+                    setattr(store, _SPRITE_ATTRS[special_type], sprite)
                     print(f"✓ Loaded special sprite for {special_type}: {filename}")
                 except pygame.error as e:
                     print(f"✗ Failed to load {filename}: {e}")
-                    self.tile_sprites[special_type] = None
+                    setattr(store, _SPRITE_ATTRS[special_type], None)
             else:
                 print(f"✗ Special sprite file not found: {filepath}")
-                self.tile_sprites[special_type] = None
+                setattr(store, _SPRITE_ATTRS[special_type], None)
         
         # Load border sprite
         border_filepath = os.path.join(self.sprites_path, "border.png")
         if os.path.exists(border_filepath):
             try:
-                self.border_sprite = pygame.image.load(border_filepath).convert_alpha()
+                store.border = pygame.image.load(border_filepath).convert_alpha()
                 print(f"✓ Loaded border sprite: border.png")
             except pygame.error as e:
                 print(f"✗ Failed to load border.png: {e}")
-                self.border_sprite = None
+                store.border = None
         else:
             print(f"✗ Border sprite file not found: {border_filepath}")
-            self.border_sprite = None
+            store.border = None
+    
+    def _get_source_sprite(self, key):
+        """Get the unscaled sprite for a tile color or special type, or None"""
+        attr = _SPRITE_ATTRS.get(key)
+        if attr is None:
+            return None
+        return getattr(self._store, attr)
     
     def get_tile_sprite(self, color: TileColor, tile_size: int):
         """Get a scaled sprite for the given color and size"""
-        if color not in self.tile_sprites or self.tile_sprites[color] is None:
+        key = (color, tile_size)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            return scaled
+        
+        sprite = self._get_source_sprite(color)
+        if sprite is None:
             return None
         
-        sprite = self.tile_sprites[color]
         # Scale sprite to be 5 pixels bigger than tile size for normal color tiles
         sprite_size = tile_size + 5
         # Tiles are now 16x16, so calculate scaling factor appropriately
         scale_factor = sprite_size / 16  # 16x16 is the new base size
         # Use nearest neighbor scaling to preserve pixel art crisp look
-        return pygame.transform.scale_by(sprite, scale_factor)
+        scaled = pygame.transform.scale_by(sprite, scale_factor).convert_alpha()
+        self._scaled_cache[key] = scaled
+        return scaled
     
     def has_sprite(self, color: TileColor) -> bool:
         """Check if we have a sprite for this color"""
-        return color in self.tile_sprites and self.tile_sprites[color] is not None
+        return self._get_source_sprite(color) is not None
     
     def get_special_sprite(self, special_type: str, tile_size: int):
         """Get a scaled sprite for special tiles"""
-        if special_type not in self.tile_sprites or self.tile_sprites[special_type] is None:
+        key = (special_type, tile_size)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            return scaled
+        
+        sprite = self._get_source_sprite(special_type)
+        if sprite is None:
             return None
         
-        sprite = self.tile_sprites[special_type]
         # Assume special tiles are also 16x16, scale to fit tile size using nearest neighbor scaling
         scale_factor = tile_size / 16  # 16x16 is the base size for special tiles too
-        return pygame.transform.scale_by(sprite, scale_factor)
+        scaled = pygame.transform.scale_by(sprite, scale_factor).convert_alpha()
+        self._scaled_cache[key] = scaled
+        return scaled
     
     def has_special_sprite(self, special_type: str) -> bool:
         """Check if we have a sprite for this special type"""
-        return special_type in self.tile_sprites and self.tile_sprites[special_type] is not None
+        return self._get_source_sprite(special_type) is not None
     
     def get_border_sprite(self, width: int, height: int):
         """Get a scaled border sprite"""
-        if not hasattr(self, 'border_sprite') or self.border_sprite is None:
+        if self._store.border is None:
             return None
-        # For borders, we can use regular scaling since it's decorative
-        return pygame.transform.scale(self.border_sprite, (width, height))
+        key = ('border', width, height)
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            # For borders, we can use regular scaling since it's decorative
+            scaled = pygame.transform.scale(self._store.border, (width, height)).convert_alpha()
+            self._scaled_cache[key] = scaled
+        return scaled
+    
+    def get_tile_atlas(self, tile_size: int):
+        """Get (atlas, rects) with every scaled tile and special sprite for this size packed in one row"""
+        atlas_entry = self._atlas_cache.get(tile_size)
+        if atlas_entry is not None:
+            return atlas_entry
+        
+        sprites = {}
+        for key, attr in _SPRITE_ATTRS.items():
+            if getattr(self._store, attr) is None:
+                continue
+            if isinstance(key, TileColor):
+                sprites[key] = self.get_tile_sprite(key, tile_size)
+            else:
+                sprites[key] = self.get_special_sprite(key, tile_size)
+        
+        width = sum(sprite.get_width() for sprite in sprites.values())
+        height = max((sprite.get_height() for sprite in sprites.values()), default=0)
+        atlas = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA).convert_alpha()
+        rects = {}
+        x = 0
+        for key, sprite in sprites.items():
+            # RGBA_MAX onto the transparent atlas copies pixels exactly instead of alpha-blending them
+            atlas.blit(sprite, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            rects[key] = pygame.Rect(x, 0, sprite.get_width(), sprite.get_height())
+            x += sprite.get_width()
+        
+        atlas_entry = (atlas, rects)
+        self._atlas_cache[tile_size] = atlas_entry
+        return atlas_entry
+    
+    def get_tile_from_atlas(self, key, tile_size: int):
+        """Get (atlas, source_rect) for a tile color or special type, or None if it has no sprite"""
+        atlas, rects = self.get_tile_atlas(tile_size)
+        rect = rects.get(key)
+        if rect is None:
+            return None
+        return atlas, rect
     
     def has_border_sprite(self) -> bool:
         """Check if we have a border sprite"""
-        return hasattr(self, 'border_sprite') and self.border_sprite is not None
+        return self._store.border is not None
+
+_sprite_manager = None
+
+def get_sprite_manager():
+    """Get the process-wide SpriteManager, loading sprites on first use (needs a display mode set)"""
+    global _sprite_manager
+    if _sprite_manager is None:
+        _sprite_manager = SpriteManager()
+    return _sprite_manager
 
 class Match3Game:
     def __init__(self, level: int = 1):
-        # Enable hardware acceleration for better performance
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE)
+        # Use the SDL2 renderer path (HWSURFACE is a no-op under SDL2)
+        self.screen = create_display()
         pygame.display.set_caption("Match 3 Game")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -188,15 +381,25 @@ class Match3Game:
         
         # Animation systems
         self.fall_animations = []
+        self._falling_cells = {}  # (row, col) -> number of fall animations starting or ending there
         self.swap_animations = []
+        self._swapping_cells = {}  # (row, col) -> number of swap animations involving that cell
         self.pulse_animations = []
         self.particle_effects = []
         self.pixel_particles = PixelParticleSystem()
         self.pop_animations = []
-        self.pop_particles = []
+        self._pop_cells = {}  # (row, col) -> (first pop animation covering that cell, tile index in it)
+        self.pop_particles = PopParticleSystem()
         self.spawn_animations = []
+        self._spawn_cells = {}  # (row, col) -> first spawn animation at that cell
         self.pending_matches = None
         
+        # Finished particle effects kept for reuse so they don't allocate new objects every match
+        self._particle_effect_pool = []
+        # Finished fall/swap animations kept for reuse by cascades and board refills
+        self._fall_animation_pool = []
+        self._swap_animation_pool = []
+        
         # Special tile deletion animations
         self.plop_out_animations = []
         self.physics_eject_animations = []
@@ -207,8 +410,10 @@ class Match3Game:
         self.boss_fall_animations = []
         self.boss_swap_animations = []
         self.boss_pop_animations = []
-        self.boss_pop_particles = []
+        self._boss_pop_cells = {}
+        self.boss_pop_particles = PopParticleSystem()
         self.boss_spawn_animations = []
+        self._boss_spawn_cells = {}
         self.boss_animating = False
         self.pending_boss_matches = None
         self.boss_move_delay = 0.0  # Delay between boss moves
@@ -231,6 +436,7 @@ class Match3Game:
         
         # Bomb boardwipe animation state
         self.bomb_boardwipe_active = False
+        self.bomb_boardwipe_phase = 'showing'  # 'showing' (bombs placed) or 'detonating'
         self.bomb_boardwipe_positions = []
         self.bomb_boardwipe_timer = 0
         self.bomb_boardwipe_detonation_timer = 0
@@ -242,6 +448,15 @@ class Match3Game:
         self.rocket_lightning_timer = 0
         self.rocket_lightning_row_index = 0
         
+        # Reality Break and Lightning Cross sequences, run from the module-level schedules.
+        # The phase attribute is the index of the pending step, or None when idle.
+        self.reality_break_active = False
+        self.reality_break_timer = 0
+        self.reality_break_phase = None
+        self.lightning_cross_active = False
+        self.lightning_cross_timer = 0
+        self.lightning_cross_phase = None
+        
         # Board wipe animation state
         self.board_wipe_active = False
         self.board_wipe_positions = []
@@ -254,6 +469,7 @@ class Match3Game:
         self.screen_shake_timer = 0
         self.screen_offset_x = 0
         self.screen_offset_y = 0
+        self._shake_noise_index = 0
         
         # Black hole (bomb+lightning) animation state
         self.black_hole_active = False
@@ -262,6 +478,19 @@ class Match3Game:
         self.black_hole_timer = 0
         self.black_hole_phase = 'condensing'  # 'condensing' or 'exploding'
         self.original_tile_positions = {}  # Store original positions for animation
+        # Per-tile columns of the condensing animation, filled from original_tile_positions when it starts
+        self.black_hole_tiles = []
+        self.black_hole_origin_x = []
+        self.black_hole_origin_y = []
+        self.black_hole_delta_x = []
+        self.black_hole_delta_y = []
+        self.black_hole_current_x = []
+        self.black_hole_current_y = []
+        self.black_hole_start_distance = []
+        self.black_hole_scales = []
+        
+        # Idle frame skipping: key of the last presented frame while nothing was moving
+        self._last_idle_frame_key = None
         
         # Level configuration
         self.current_level = level
@@ -279,8 +508,7 @@ class Match3Game:
         
         # Initialize board and sprite manager
         self.board = Board(self.board_width, self.board_height, self.tile_size)
-        self.sprite_manager = SpriteManager()
-        self.sprite_manager.load_tile_sprites()
+        self.sprite_manager = get_sprite_manager()
         self.board.generate_initial_board()
         
         # Boss board for dual board levels
@@ -321,9 +549,84 @@ class Match3Game:
             self.board_y = (WINDOW_HEIGHT - total_board_height) // 2
             self.boss_ai = None  # No AI for single board mode
         
+        # Pixel offsets of each tile's inner area (past the 2px spacing) from the board origin.
+        # Kept relative so they stay valid while draw() shifts board_x/board_y for screen shake,
+        # and shared by the boss board which has the same dimensions and tile size.
+        spacing = 2
+        # Tile top-left offsets from the board origin, for placing pop and fall animations
+        self._col_offset_x = [col * self.tile_size for col in range(self.board_width)]
+        self._row_offset_y = [row * self.tile_size for row in range(self.board_height)]
+        self._col_x = [col * self.tile_size + spacing for col in range(self.board_width)]
+        self._row_y = [row * self.tile_size + spacing for row in range(self.board_height)]
+        self._tile_inner_size = self.tile_size - (spacing * 2)
+        # Tile center offsets from the board origin, used by the screen-position and particle helpers
+        half_tile = self.tile_size // 2
+        self._col_center_x = [col * self.tile_size + half_tile for col in range(self.board_width)]
+        self._row_center_y = [row * self.tile_size + half_tile for row in range(self.board_height)]
+        # Clipping areas of the player and boss boards; only their position changes (with shake),
+        # so draw moves them into place instead of building new Rects every frame
+        self._board_clip_rect = pygame.Rect(0, 0, self.board_width * self.tile_size, self.board_height * self.tile_size)
+        self._boss_board_clip_rect = self._board_clip_rect.copy()
+        # Resting boss tile blits from the last frame nothing on the boss board moved, and what they showed
+        self._boss_static_blits = []
+        self._boss_static_blits_key = None
+        # Shading laid over animating tiles that can't be selected, built once instead of per draw
+        self._dim_overlay = pygame.Surface((self.tile_size, self.tile_size))
+        self._dim_overlay.set_alpha(100)
+        self._dim_overlay.fill((0, 0, 0))
+        # Right and bottom screen edges of the player board, used as lightning endpoints
+        self._board_right = self.board_x + self.board_width * self.tile_size
+        self._board_bottom = self.board_y + self.board_height * self.tile_size
+        
+        # Background and borders, rendered on first draw (see draw_background)
+        self._static_background = None
+        
+        # Top-left to bottom-right diagonal cleared by the diagonal lightning effects
+        diagonal_length = min(self.board_height, self.board_width)
+        self._diagonal_coords = [(i, i) for i in range(diagonal_length)]
+        # Top-right to bottom-left diagonal
+        self._anti_diagonal_coords = [(i, self.board_width - 1 - i) for i in range(diagonal_length)]
+        
         # Font for UI
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
+        self.small_font = pygame.font.Font(None, 24)
+        # Dual board labels and the AI thinking text never change, so they're rendered once
+        self._player_label = self.font.render("PLAYER", True, (255, 255, 255))
+        self._boss_label = self.font.render("BOSS", True, (255, 100, 100))
+        self._thinking_text = self.font.render("AI THINKING...", True, (255, 255, 0))
+        self._thinking_dots_text = self.font.render("⚈ ⚈ ⚈", True, (255, 255, 255))
+        # Backdrop behind the thinking text; only its alpha changes as it pulses
+        self._thinking_bg = pygame.Surface((self._thinking_text.get_width() + 20, self._thinking_text.get_height() + 10))
+        self._thinking_bg.fill((0, 0, 0))
+        # Spinning dots rotated to each whole degree, filled in as the spin reaches them
+        self._thinking_dots_rotations = {}
+        # Fallback special tile symbols, rendered once per (symbol, size, color)
+        self._symbol_fonts = {}
+        self._symbol_cache = {}
+        # Special tile legend: fixed text and squares, so everything but the blit is done once
+        legend_y = 150
+        legend_items = [
+            ("R (Orange): Horizontal Rocket - Clears entire row", (255, 69, 0)),
+            ("R (Blue): Vertical Rocket - Clears entire column", (30, 144, 255)),
+            ("B (Gray): Bomb - Explodes 5x5 area", (64, 64, 64)),
+            ("L (Dark Blue): Lightning - Arc pattern strike", (25, 25, 112)),
+            ("W (Purple): Board Wipe - Clears all of same color", (128, 0, 128))
+        ]
+        square_size = 20
+        self._legend_squares = [(color, pygame.Rect(20, legend_y + i * 25, square_size, square_size))
+                                for i, (text, color) in enumerate(legend_items)]
+        self._legend_blits = [(self.small_font.render(text, True, (255, 255, 255)), (50, legend_y + i * 25))
+                              for i, (text, color) in enumerate(legend_items)]
+        # Debug overlay backdrop and its static lines; only the "Current Tile" line is rendered per frame
+        self._debug_overlay_bg = pygame.Surface((WINDOW_WIDTH, 120))
+        self._debug_overlay_bg.set_alpha(200)
+        self._debug_overlay_bg.fill((0, 0, 0))
+        self._debug_overlay_blits = [
+            (self.small_font.render("DEBUG MODE ACTIVE", True, (255, 255, 0)), (10, 10)),
+            (self.small_font.render("TAB = Cycle tiles | Click = Place tile", True, (255, 255, 255)), (10, 60)),
+            (self.small_font.render("F3+1 = Exit debug mode", True, (255, 255, 255)), (10, 85)),
+        ]
         
         # Load custom fonts for combo display
         try:
@@ -355,12 +658,11 @@ class Match3Game:
     
     def update_yellow_tile_exclusion(self):
         """Update board color exclusions based on No Yellow perk"""
-        from board import TileColor
         excluded_colors = set()
         if self.no_yellow_tiles:
             excluded_colors.add(TileColor.YELLOW)
         self.board.set_excluded_colors(excluded_colors)
-        if hasattr(self, 'boss_board') and self.boss_board is not None:
+        if self.boss_board is not None:
             self.boss_board.set_excluded_colors(excluded_colors)
     
     def run(self):
@@ -381,6 +683,9 @@ class Match3Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Window contents were lost, so the next frame has to be presented again
+                self._last_idle_frame_key = None
             elif event.type == pygame.KEYDOWN:
                 self.handle_key_press(event.key)
             elif event.type == pygame.KEYUP:
@@ -406,24 +711,8 @@ class Match3Game:
             self.perk_gui.toggle_visibility()
         elif key == pygame.K_TAB and self.debug_mode:
             # Cycle through special tile types
-            from special_tiles import SpecialTileType
-            special_types = [
-                SpecialTileType.ROCKET_HORIZONTAL,
-                SpecialTileType.ROCKET_VERTICAL,
-                SpecialTileType.BOMB,
-                SpecialTileType.LIGHTNING,
-                SpecialTileType.BOARD_WIPE,
-                SpecialTileType.BOMB_ROCKET,
-                SpecialTileType.BOMB_BOARDWIPE,
-                SpecialTileType.MEGA_BOMB,
-                SpecialTileType.ENERGIZED_BOMB,
-                SpecialTileType.ROCKET_BOARDWIPE,
-                SpecialTileType.ROCKET_LIGHTNING,
-                SpecialTileType.SIMPLE_CROSS,
-                SpecialTileType.LIGHTNING_CROSS,
-            ]
-            self.debug_special_type = (self.debug_special_type + 1) % len(special_types)
-            current_type = special_types[self.debug_special_type]
+            self.debug_special_type = (self.debug_special_type + 1) % len(_DEBUG_SPECIAL_TYPES)
+            current_type = _DEBUG_SPECIAL_TYPES[self.debug_special_type]
             print(f"Selected special tile: {current_type.name}")
     
     def handle_key_release(self, key):
@@ -455,18 +744,12 @@ class Match3Game:
                 return  # Click was on boss board, ignore
         
         if 0 <= board_x < self.board_width * self.tile_size and 0 <= board_y < self.board_height * self.tile_size:
-            col = board_x // self.tile_size
-            row = board_y // self.tile_size
-            
-            # Check if click is actually within the tile (accounting for spacing)
-            spacing = 2
-            tile_x = col * self.tile_size + spacing
-            tile_y = row * self.tile_size + spacing
-            tile_size_with_spacing = self.tile_size - (spacing * 2)
-            
-            # Check if click is within the actual tile area (not in the spacing)
-            if not (tile_x <= board_x < tile_x + tile_size_with_spacing and 
-                    tile_y <= board_y < tile_y + tile_size_with_spacing):
+            col, offset_x = divmod(board_x, self.tile_size)
+            row, offset_y = divmod(board_y, self.tile_size)
+            
+            # Check if click is within the actual tile area (not in the 2px spacing on each side)
+            max_offset = self.tile_size - 2
+            if not (2 <= offset_x < max_offset and 2 <= offset_y < max_offset):
                 return  # Click was in the spacing area, ignore it
             
             # Debug mode: place special tiles
@@ -496,33 +779,14 @@ class Match3Game:
     
     def place_debug_tile(self, row, col):
         """Place a special tile at the specified position (debug mode only)"""
-        from special_tiles import SpecialTileType, create_special_tile
-        from board import TileColor, Tile
-        
-        # Define available special tile types
-        special_types = [
-            SpecialTileType.ROCKET_HORIZONTAL,
-            SpecialTileType.ROCKET_VERTICAL,
-            SpecialTileType.BOMB,
-            SpecialTileType.LIGHTNING,
-            SpecialTileType.BOARD_WIPE,
-            SpecialTileType.BOMB_ROCKET,
-            SpecialTileType.BOMB_BOARDWIPE,
-            SpecialTileType.MEGA_BOMB,
-            SpecialTileType.ENERGIZED_BOMB,
-            SpecialTileType.ROCKET_BOARDWIPE,
-            SpecialTileType.ROCKET_LIGHTNING,
-            SpecialTileType.SIMPLE_CROSS,
-            SpecialTileType.LIGHTNING_CROSS,
-        ]
         
         # Get current special tile type with bounds checking
-        if 0 <= self.debug_special_type < len(special_types):
-            current_type = special_types[self.debug_special_type]
+        if 0 <= self.debug_special_type < len(_DEBUG_SPECIAL_TYPES):
+            current_type = _DEBUG_SPECIAL_TYPES[self.debug_special_type]
         else:
             # Reset to first tile if out of bounds
             self.debug_special_type = 0
-            current_type = special_types[0]
+            current_type = _DEBUG_SPECIAL_TYPES[0]
         
         # Create a special tile
         special_tile = create_special_tile(current_type, color=TileColor.RED)
@@ -533,15 +797,13 @@ class Match3Game:
         # Place the tile on the board
         self.board.set_tile(row, col, new_tile)
         
-        print(f"Placed {current_type.name} at ({row}, {col})")
+        logger.debug("Placed %s at (%s, %s)", current_type.name, row, col)
     
     def handle_bomb_boardwipe_combo(self, pos, combo_tile):
         """Handle the bomb + boardwipe combo with special animation"""
-        from special_tiles import create_special_tile, SpecialTileType
-        from board import Tile, TileColor
         
         # Clear any existing fall animations to prevent stuck falling tiles
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Get bomb positions before removing combo tile
         bomb_positions = combo_tile.get_bomb_positions(self.board, pos)
@@ -555,11 +817,12 @@ class Match3Game:
         # Remove the combo tile after placing bombs
         self.board.set_tile(*pos, None)
         
-        # Sort positions from top to bottom, left to right for sequential detonation
-        bomb_positions.sort(key=lambda pos: (pos[0], pos[1]))
+        # Sort positions from top to bottom, left to right for sequential detonation (tuple order is (row, col))
+        bomb_positions.sort()
         
         # Set up animation state
         self.bomb_boardwipe_active = True
+        self.bomb_boardwipe_phase = 'showing'
         self.bomb_boardwipe_positions = bomb_positions
         self.bomb_boardwipe_timer = 0
         self.bomb_boardwipe_detonation_timer = 0
@@ -579,16 +842,13 @@ class Match3Game:
         # Immediately start a fall animation to fill gaps
         self.start_fall_animation()
         
-        print(f"Placed {len(bomb_positions)} bombs for sequential detonation!")
+        logger.debug("Placed %s bombs for sequential detonation!", len(bomb_positions))
     
     def handle_rocket_boardwipe_combo(self, pos, combo_tile):
         """Handle the rocket + boardwipe combo with special animation"""
-        from special_tiles import create_special_tile, SpecialTileType
-        from board import Tile, TileColor
-        import random
         
         # Clear any existing fall animations to prevent stuck falling tiles
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Get rocket positions before removing combo tile
         rocket_positions = combo_tile.get_rocket_positions(self.board, pos)
@@ -604,11 +864,12 @@ class Match3Game:
         # Remove the combo tile after placing rockets
         self.board.set_tile(*pos, None)
         
-        # Sort positions from top to bottom, left to right for sequential detonation
-        rocket_positions.sort(key=lambda pos: (pos[0], pos[1]))
+        # Sort positions from top to bottom, left to right for sequential detonation (tuple order is (row, col))
+        rocket_positions.sort()
         
         # Set up animation state (reuse bomb boardwipe animation system)
         self.bomb_boardwipe_active = True
+        self.bomb_boardwipe_phase = 'showing'
         self.bomb_boardwipe_positions = rocket_positions
         self.bomb_boardwipe_timer = 0
         self.bomb_boardwipe_detonation_timer = 0
@@ -628,12 +889,12 @@ class Match3Game:
         # Immediately start a fall animation to fill gaps
         self.start_fall_animation()
         
-        print(f"Placed {len(rocket_positions)} rockets for sequential detonation!")
+        logger.debug("Placed %s rockets for sequential detonation!", len(rocket_positions))
     
     def handle_rocket_lightning_combo(self, pos, combo_tile):
         """Handle the rocket + lightning combo with cascading row clearing"""
         # Clear any existing fall animations to prevent stuck falling tiles
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Remove the combo tile
         self.board.set_tile(*pos, None)
@@ -661,12 +922,12 @@ class Match3Game:
         # Start with the first row immediately
         self.clear_row_cascade(0)
         
-        print(f"Starting rocket lightning cascade clearing {len(cascade_rows)} rows!")
+        logger.debug("Starting rocket lightning cascade clearing %s rows!", len(cascade_rows))
     
     def handle_reality_break_combo(self, pos, combo_tile):
         """Handle the ultimate Reality Break combo - breaks the 4th wall!"""
         # Clear any existing fall animations to prevent interference
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Pause combo timer during the long reality break animation
         self.pause_combo_timer()
@@ -677,8 +938,7 @@ class Match3Game:
         # Set up Reality Break animation state
         self.reality_break_active = True
         self.reality_break_timer = 0
-        self.reality_break_phase = 'diagonal_lightning_1'
-        self.reality_tiles_consumed = False  # Reset tile consumption flag
+        self.reality_break_phase = 0
         
         # Add points to combo system (special tiles give 100 points)
         self.combo_points += 100
@@ -687,7 +947,7 @@ class Match3Game:
         # Start the Reality Break sequence immediately
         self.start_diagonal_lightning_phase_1()
         
-        print("REALITY BREAK INITIATED - BREAKING THE 4TH WALL!")
+        logger.debug("REALITY BREAK INITIATED - BREAKING THE 4TH WALL!")
     
     def start_diagonal_lightning_phase_1(self):
         """Phase 1: Red diagonal lightning from top-left to bottom-right"""
@@ -695,21 +955,19 @@ class Match3Game:
         self.pixel_particles.create_diagonal_lightning(
             start_x=self.board_x,
             start_y=self.board_y,
-            end_x=self.board_x + self.board_width * self.tile_size,
-            end_y=self.board_y + self.board_height * self.tile_size,
+            end_x=self._board_right,
+            end_y=self._board_bottom,
             color=(255, 0, 0),  # Red lightning
             thickness=8
         )
         
         # Clear tiles along the diagonal path for visual effect
-        for i in range(min(self.board_height, self.board_width)):
-            if i < self.board_height and i < self.board_width:
-                self.board.set_tile(i, i, None)
+        self.board.clear_positions(self._diagonal_coords)
         
         # Massive screen shake for reality breaking
         self.start_screen_shake(25.0, 0.5)  # ULTIMATE SHAKE!
         
-        print("Phase 1: Red diagonal lightning breaks reality!")
+        logger.debug("Phase 1: Red diagonal lightning breaks reality!")
     
     def clear_row_cascade(self, row_index):
         """Clear a single row in the cascade with lightning arc effect"""
@@ -727,36 +985,33 @@ class Match3Game:
             self.start_screen_shake(8.0, 0.3)  # Strong shake for 0.3 seconds
             
             # Clear entire row
-            for col in range(self.board.width):
-                self.board.set_tile(row, col, None)
+            self.board.clear_row(row)
             
-            print(f"Cleared row {row} with {direction} lightning arc")
+            logger.debug("Cleared row %s with %s lightning arc", row, direction)
             # Don't start fall animation during cascade - wait until end
     
     def handle_board_wipe_activation(self, pos, board_wipe_tile, target_color):
         """Handle board wipe activation with target color and particles"""
         # Find all positions with the target color
-        positions_to_clear = []
-        for row in range(self.board.height):
-            for col in range(self.board.width):
-                tile = self.board.get_tile(row, col)
-                if tile and not tile.is_empty() and tile.color == target_color:
-                    positions_to_clear.append((row, col))
+        positions_to_clear = self.board.get_positions_with_color(target_color)
         
         if positions_to_clear:
             # Remove the board wipe tile itself first
             self.board.set_tile(*pos, None)
             
+            # Arc points sit half a tile past each tile's get_tile_screen_pos center;
+            # compute them directly instead of calling it twice per tile
+            tile_size = self.tile_size
+            origin_x = self.board_x + (tile_size // 2) * 2
+            origin_y = self.board_y + (tile_size // 2) * 2
+            
             # Create board wipe particle effect first
-            center_x = self.get_tile_screen_pos(pos)[0] + self.tile_size // 2
-            center_y = self.get_tile_screen_pos(pos)[1] + self.tile_size // 2
+            center_x = origin_x + pos[1] * tile_size
+            center_y = origin_y + pos[0] * tile_size
             
             # Get target positions for arc effect
-            target_positions = []
-            for target_pos in positions_to_clear:
-                target_x = self.get_tile_screen_pos(target_pos)[0] + self.tile_size // 2
-                target_y = self.get_tile_screen_pos(target_pos)[1] + self.tile_size // 2
-                target_positions.append((target_x, target_y))
+            target_positions = [(origin_x + col * tile_size, origin_y + row * tile_size)
+                                for row, col in positions_to_clear]
             
             # Create board wipe arc effect
             self.pixel_particles.create_board_wipe_arcs(center_x, center_y, target_positions, target_color)
@@ -778,7 +1033,7 @@ class Match3Game:
             else:
                 self.combo_timer = 0.0  # Reset combo timer
             
-            print(f"Board wipe targeting {target_color.name} - will clear {len(positions_to_clear)} tiles")
+            logger.debug("Board wipe targeting %s - will clear %s tiles", target_color.name, len(positions_to_clear))
     
     def update_board_wipe_animation(self, dt):
         """Update the board wipe animation with delayed clearing"""
@@ -792,8 +1047,9 @@ class Match3Game:
                 if tile:
                     # Start physics eject animation for this tile
                     self.start_physics_eject_animation(row, col, tile)
-                    # Clear the tile from the board (animation will show the flying tile)
-                    self.board.set_tile(row, col, None)
+            
+            # Clear the tiles from the board (animations will show the flying tiles)
+            self.board.clear_positions(self.board_wipe_positions)
             
             # Reset state
             self.board_wipe_active = False
@@ -803,59 +1059,59 @@ class Match3Game:
             # Start fall animation to fill gaps
             self.start_fall_animation()
             
-            print("Board wipe completed!")
+            logger.debug("Board wipe completed!")
     
     def update_bomb_boardwipe_animation(self, dt):
-        """Update the bomb boardwipe animation sequence"""
-        self.bomb_boardwipe_timer += dt
-        
-        # Phase 1: Show bombs for 0.5 seconds
-        if self.bomb_boardwipe_timer < 0.5:
-            return  # Just show the bombs
-        
+        """Update the detonating phase of the bomb boardwipe sequence (update() runs the 0.5s showing phase)"""
         # Phase 2: Sequential detonation (0.1 seconds between each bomb)
         self.bomb_boardwipe_detonation_timer += dt
         
-        if self.bomb_boardwipe_detonation_timer >= 0.1:  # Detonate every 0.1 seconds
-            if self.bomb_boardwipe_detonation_index < len(self.bomb_boardwipe_positions):
-                # Detonate the current bomb
-                pos = self.bomb_boardwipe_positions[self.bomb_boardwipe_detonation_index]
-                tile = self.board.get_tile(*pos)
-                
-                if tile and tile.is_special():
-                    # Activate this bomb with animations
-                    result = self.activate_special_tile_with_animation(*pos)
-                    if isinstance(result, tuple) and len(result) == 2:
-                        affected_positions, activated_tiles = result
-                    else:
-                        # Handle old return format for compatibility
-                        affected_positions = result if result else []
-                        activated_tiles = [(pos[0], pos[1], tile.special_tile)] if tile.special_tile else []
-                    
-                    # Create particle effects for all activated special tiles
-                    for tile_row, tile_col, special_tile in activated_tiles:
-                        self.create_special_effect_particles((tile_row, tile_col), special_tile)
-                    
-                    # Add screen shake for each bomb detonation in sequence
-                    self.start_screen_shake(8.0, 0.2)  # Quick shakes for each bomb
-                    
-                    # Start a fall animation after each bomb to keep tiles falling
-                    self.start_fall_animation()
-                
-                self.bomb_boardwipe_detonation_index += 1
-                self.bomb_boardwipe_detonation_timer = 0
-            else:
-                # All bombs detonated, finish the animation
-                self.bomb_boardwipe_active = False
-                self.bomb_boardwipe_positions = []
-                self.bomb_boardwipe_timer = 0
-                self.bomb_boardwipe_detonation_timer = 0
-                self.bomb_boardwipe_detonation_index = 0
-                
-                # Resume combo timer after big animation
-                self.resume_combo_timer()
-                
-                print("Bomb boardwipe sequence completed!")
+        # Detonate every bomb that is due this frame, so a dt spike doesn't leave them lagging
+        activated_tiles = []
+        while (self.bomb_boardwipe_detonation_timer >= 0.1 and
+               self.bomb_boardwipe_detonation_index < len(self.bomb_boardwipe_positions)):
+            activated_tiles.extend(self.detonate_boardwipe_bomb(self.bomb_boardwipe_positions[self.bomb_boardwipe_detonation_index]))
+            self.bomb_boardwipe_detonation_index += 1
+            self.bomb_boardwipe_detonation_timer -= 0.1
+        
+        # Create particle effects for all bombs detonated this frame in one batch
+        if activated_tiles:
+            self.create_special_effect_particles_batch(activated_tiles)
+        
+        if (self.bomb_boardwipe_detonation_timer >= 0.1 and
+                self.bomb_boardwipe_detonation_index >= len(self.bomb_boardwipe_positions)):
+            self.complete_bomb_boardwipe()
+    
+    def detonate_boardwipe_bomb(self, pos):
+        """Detonate a single bomb of the boardwipe sequence, returning the special tiles it activated"""
+        tile = self.board.get_tile(*pos)
+        if not (tile and tile.is_special()):
+            return []
+        
+        # Activate this bomb with animations
+        affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos)
+        
+        # Add screen shake for each bomb detonation in sequence
+        self.start_screen_shake(8.0, 0.2)  # Quick shakes for each bomb
+        
+        # Start a fall animation after each bomb to keep tiles falling
+        self.start_fall_animation()
+        
+        return activated_tiles
+    
+    def complete_bomb_boardwipe(self):
+        """All bombs detonated, finish the boardwipe animation"""
+        self.bomb_boardwipe_active = False
+        self.bomb_boardwipe_phase = 'showing'
+        self.bomb_boardwipe_positions = []
+        self.bomb_boardwipe_timer = 0
+        self.bomb_boardwipe_detonation_timer = 0
+        self.bomb_boardwipe_detonation_index = 0
+        
+        # Resume combo timer after big animation
+        self.resume_combo_timer()
+        
+        logger.debug("Bomb boardwipe sequence completed!")
     
     def update_rocket_lightning_animation(self, dt):
         """Update the rocket lightning cascade animation"""
@@ -882,12 +1138,12 @@ class Match3Game:
                 # Now start fall animation to fill all the empty spaces
                 self.start_fall_animation()
                 
-                print("Rocket lightning cascade completed!")
+                logger.debug("Rocket lightning cascade completed!")
     
     def start_black_hole_animation(self, center_x: float, center_y: float):
         """Start black hole animation for bomb+lightning combo"""
         # Clear any existing fall animations to prevent stuck falling tiles
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Pause combo timer during the long black hole animation
         self.pause_combo_timer()
@@ -899,11 +1155,32 @@ class Match3Game:
         self.black_hole_phase = 'condensing'
         
         # Tile positions should already be stored before activation
-        if not hasattr(self, 'original_tile_positions') or not self.original_tile_positions:
-            print("Warning: No tile positions stored for black hole animation!")
-            self.original_tile_positions = {}
-        
-        print(f"Starting black hole animation at ({center_x}, {center_y}) with {len(self.original_tile_positions)} tiles")
+        if not self.original_tile_positions:
+            logger.warning("No tile positions stored for black hole animation!")
+        
+        # Split the stored positions into parallel lists so each frame's lerp is one pass per axis
+        tile_data_list = list(self.original_tile_positions.values())
+        self.black_hole_tiles = [tile_data['tile'] for tile_data in tile_data_list]
+        self.black_hole_origin_x = [tile_data['original_x'] for tile_data in tile_data_list]
+        self.black_hole_origin_y = [tile_data['original_y'] for tile_data in tile_data_list]
+        # The center is fixed for the whole animation, so each tile's path to it is computed once
+        self.black_hole_delta_x = [center_x - origin_x for origin_x in self.black_hole_origin_x]
+        self.black_hole_delta_y = [center_y - origin_y for origin_y in self.black_hole_origin_y]
+        self.black_hole_current_x = self.black_hole_origin_x[:]
+        self.black_hole_current_y = self.black_hole_origin_y[:]
+        # Tiles move straight in, so only their starting distance (as a fraction of the
+        # distance where shrinking begins) is needed to scale them at any later point
+        self.black_hole_start_distance = [math.hypot(delta_x, delta_y) / _BLACK_HOLE_SHRINK_DISTANCE
+                                          for delta_x, delta_y in zip(self.black_hole_delta_x, self.black_hole_delta_y)]
+        self.black_hole_scales = self.get_black_hole_scales(0.0)
+        
+        logger.debug("Starting black hole animation at (%s, %s) with %s tiles", center_x, center_y, len(self.original_tile_positions))
+    
+    def get_black_hole_scales(self, eased_progress):
+        """Get the draw scale of each condensing tile once it has covered eased_progress of its path"""
+        remaining = 1.0 - eased_progress
+        # Far away = full size (1.0), close to center = tiny (0.1)
+        return [0.1 + min(1.0, start_distance * remaining) * 0.9 for start_distance in self.black_hole_start_distance]
     
     def update_black_hole_animation(self, dt):
         """Update the black hole animation"""
@@ -918,22 +1195,17 @@ class Match3Game:
                 
                 # Clear the board immediately when condensing starts to hide original tiles
                 if self.black_hole_timer < 0.1:  # Only on first frame
-                    for row in range(self.board.height):
-                        for col in range(self.board.width):
-                            self.board.set_tile(row, col, None)
+                    self.board.clear_all()
                 
-                # Update each tile's position to move toward center with easing
-                for (row, col), tile_data in self.original_tile_positions.items():
-                    # Calculate movement toward center with ease-in effect
-                    target_x = self.black_hole_center_x
-                    target_y = self.black_hole_center_y
-                    
-                    # Use quadratic easing for more dramatic effect
-                    eased_progress = progress * progress
-                    
-                    # Lerp from original position to center
-                    tile_data['current_x'] = tile_data['original_x'] + (target_x - tile_data['original_x']) * eased_progress
-                    tile_data['current_y'] = tile_data['original_y'] + (target_y - tile_data['original_y']) * eased_progress
+                # Use quadratic easing for more dramatic effect
+                eased_progress = progress * progress
+                
+                # Lerp each tile from its original position toward the center
+                self.black_hole_current_x = [origin_x + delta_x * eased_progress
+                                             for origin_x, delta_x in zip(self.black_hole_origin_x, self.black_hole_delta_x)]
+                self.black_hole_current_y = [origin_y + delta_y * eased_progress
+                                             for origin_y, delta_y in zip(self.black_hole_origin_y, self.black_hole_delta_y)]
+                self.black_hole_scales = self.get_black_hole_scales(eased_progress)
                     
             else:
                 # Condensing complete, start explosion
@@ -941,9 +1213,7 @@ class Match3Game:
                 self.black_hole_timer = 0
                 
                 # NOW clear all tiles from the board (board wipe effect)
-                for row in range(self.board.height):
-                    for col in range(self.board.width):
-                        self.board.set_tile(row, col, None)
+                self.board.clear_all()
                 
                 # Create massive lightning explosion
                 self.pixel_particles.create_black_hole_lightning_explosion(
@@ -961,88 +1231,61 @@ class Match3Game:
                 # Animation complete
                 self.black_hole_active = False
                 self.original_tile_positions = {}
+                self.black_hole_tiles = []
+                self.black_hole_origin_x = []
+                self.black_hole_origin_y = []
+                self.black_hole_delta_x = []
+                self.black_hole_delta_y = []
+                self.black_hole_current_x = []
+                self.black_hole_current_y = []
+                self.black_hole_start_distance = []
+                self.black_hole_scales = []
                 
                 # Resume combo timer after black hole animation
                 self.resume_combo_timer()
                 
                 # Clear any existing fall animations to prevent duplicates
-                self.fall_animations.clear()
+                self._clear_fall_animations()
                 
                 # Instead of instantly filling the board, create falling tiles from the top
                 # Clear the board first
-                for row in range(self.board.height):
-                    for col in range(self.board.width):
-                        self.board.set_tile(row, col, None)
+                self.board.clear_all()
                 
                 # Create tiles above the board that will fall down naturally
                 self.create_falling_tiles_for_empty_board()
                 
-                print("Black hole animation completed!")
+                logger.debug("Black hole animation completed!")
     
     def update_reality_break_animation(self, dt):
-        """Update the Reality Break animation through all phases"""
+        """Update the Reality Break animation, running each scheduled phase once its wait has elapsed"""
         self.reality_break_timer += dt
         
-        if self.reality_break_phase == 'diagonal_lightning_1':
-            # Wait 0.8 seconds then start phase 2 directly (no falling during reality break)
-            if self.reality_break_timer >= 0.8:
-                self.reality_break_phase = 'diagonal_lightning_2'
-                self.reality_break_timer = 0
-                self.start_diagonal_lightning_phase_2()
-                
-        elif self.reality_break_phase == 'diagonal_lightning_2':
-            # Wait 0.8 seconds then start black hole phase directly (no falling during reality break)
-            if self.reality_break_timer >= 0.8:
-                self.reality_break_phase = 'black_hole_expand'
-                self.reality_break_timer = 0
-                self.start_reality_black_hole_phase()
-                
-        elif self.reality_break_phase == 'black_hole_expand':
-            # Clear remaining tiles partway through black hole expansion (after 1.5 seconds)
-            if self.reality_break_timer >= 1.5 and not getattr(self, 'reality_tiles_consumed', False):
-                # Clear any remaining tiles that weren't destroyed by lightning
-                for row in range(self.board.height):
-                    for col in range(self.board.width):
-                        self.board.set_tile(row, col, None)
-                self.reality_tiles_consumed = True
-                print("Black hole consumes remaining tiles!")
-            
-            # Black hole expands for 3 seconds total, consuming everything
-            if self.reality_break_timer >= 3.0:
-                self.reality_break_phase = 'singularity_collapse'
-                self.reality_break_timer = 0
-                self.start_singularity_collapse()
-                
-        elif self.reality_break_phase == 'singularity_collapse':
-            # Singularity collapses in 1.0 second
-            if self.reality_break_timer >= 1.0:
-                self.reality_break_phase = 'complete'
-                self.reality_break_timer = 0
-                self.complete_reality_break()
+        duration, next_phase = _REALITY_BREAK_SCHEDULE[self.reality_break_phase]
+        if self.reality_break_timer >= duration:
+            self.reality_break_phase += 1
+            # Carry the overshoot into the next wait so the phases keep their total length
+            self.reality_break_timer -= duration
+            getattr(self, next_phase)()
     
     def start_diagonal_lightning_phase_2(self):
         """Phase 2: Black diagonal lightning from top-right to bottom-left"""
         # Create massive diagonal lightning effect (black)
         self.pixel_particles.create_diagonal_lightning(
-            start_x=self.board_x + self.board_width * self.tile_size,
+            start_x=self._board_right,
             start_y=self.board_y,
             end_x=self.board_x,
-            end_y=self.board_y + self.board_height * self.tile_size,
+            end_y=self._board_bottom,
             color=(0, 0, 0),  # Black lightning
             thickness=8
         )
         
         # Clear tiles along the opposite diagonal path for visual effect
-        for i in range(min(self.board_height, self.board_width)):
-            row = i
-            col = (self.board_width - 1) - i
-            if 0 <= row < self.board_height and 0 <= col < self.board_width:
-                self.board.set_tile(row, col, None)
+        self.board.clear_positions(self._anti_diagonal_coords)
         
         # Another massive screen shake
         self.start_screen_shake(25.0, 0.5)
         
-        print("Phase 2: Black diagonal lightning tears reality further!")
+        logger.debug("Phase 2: Black diagonal lightning tears reality further!")
     
     def start_reality_black_hole_phase(self):
         """Phase 3: Massive black hole that consumes everything including UI"""
@@ -1059,7 +1302,12 @@ class Match3Game:
         # Ultimate screen shake as reality breaks down
         self.start_screen_shake(30.0, 2.0)  # Most intense shake for 2 seconds
         
-        print("Phase 3: Reality black hole consumes everything!")
+        logger.debug("Phase 3: Reality black hole consumes everything!")
+    
+    def consume_reality_tiles(self):
+        """Clear any remaining tiles that weren't destroyed by lightning"""
+        self.board.clear_all()
+        logger.debug("Black hole consumes remaining tiles!")
     
     def start_singularity_collapse(self):
         """Phase 4: White singularity collapse"""
@@ -1072,7 +1320,7 @@ class Match3Game:
         # Final massive shake as reality collapses
         self.start_screen_shake(35.0, 1.0)
         
-        print("Phase 4: White singularity collapses reality!")
+        logger.debug("Phase 4: White singularity collapses reality!")
     
     def complete_reality_break(self):
         """Complete the Reality Break animation and restore normal gameplay"""
@@ -1083,73 +1331,52 @@ class Match3Game:
         self.resume_combo_timer()
         
         # Clear all animations and effects
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Regenerate the board naturally with falling tiles
         self.create_falling_tiles_for_empty_board()
         
-        print("REALITY RESTORED - Normal gameplay resumed!")
+        logger.debug("REALITY RESTORED - Normal gameplay resumed!")
     
     def update_lightning_cross_animation(self, dt):
-        """Update Lightning Cross sequential arc animation"""
+        """Update Lightning Cross sequential arc animation, firing the next arc every 0.6 seconds"""
         self.lightning_cross_timer += dt
         
-        if self.lightning_cross_phase == 'arc_1':
-            # Wait 0.6 seconds then start arc 2
-            if self.lightning_cross_timer >= 0.6:
-                self.lightning_cross_phase = 'arc_2'
-                self.lightning_cross_timer = 0
-                self.start_lightning_cross_arc_2()
-                
-        elif self.lightning_cross_phase == 'arc_2':
-            # Wait 0.6 seconds then start arc 3
-            if self.lightning_cross_timer >= 0.6:
-                self.lightning_cross_phase = 'arc_3'
-                self.lightning_cross_timer = 0
-                self.start_lightning_cross_arc_3()
-                
-        elif self.lightning_cross_phase == 'arc_3':
-            # Wait 0.6 seconds then start arc 4
-            if self.lightning_cross_timer >= 0.6:
-                self.lightning_cross_phase = 'arc_4'
-                self.lightning_cross_timer = 0
-                self.start_lightning_cross_arc_4()
-                
-        elif self.lightning_cross_phase == 'arc_4':
-            # Wait 0.6 seconds then complete
-            if self.lightning_cross_timer >= 0.6:
-                self.lightning_cross_phase = 'complete'
-                self.lightning_cross_timer = 0
-                self.complete_lightning_cross()
+        duration, next_arc = _LIGHTNING_CROSS_SCHEDULE[self.lightning_cross_phase]
+        if self.lightning_cross_timer >= duration:
+            self.lightning_cross_phase += 1
+            # Carry the overshoot into the next wait so the arcs stay 0.6 seconds apart
+            self.lightning_cross_timer -= duration
+            getattr(self, next_arc)()
     
     def create_falling_tiles_for_empty_board(self):
         """Create falling tiles to fill an empty board naturally"""
-        from board import TileColor, Tile
-        import random
+        
+        width, height = self.board.width, self.board.height
+        tile_size = self.tile_size
+        board_y = self.board_y
+        
+        # Each tile starts a full board height above its slot, so the fall distance (and with it
+        # the duration) is the same for every tile; only the per-row start/end positions differ
+        start_ys = [board_y - (height - row) * tile_size for row in range(height)]
+        end_ys = [board_y + row_y for row_y in self._row_offset_y]
+        fall_distance = height * tile_size
+        fall_duration = 0.3 + (fall_distance / (self.board_height * tile_size)) * 0.8
+        
+        # Draw every color in one call, respecting excluded colors (e.g., no yellow perk)
+        colors = iter(random.choices(self.board.available_colors, k=width * height))
         
         # For each column, create enough tiles to fill it
-        for col in range(self.board.width):
-            for row in range(self.board.height):
-                # Choose a random color respecting excluded colors (e.g., no yellow perk)
-                color = random.choice(self.board.available_colors)
-                tile = Tile(color)
-                
-                # Calculate starting and ending positions
-                start_y = self.board_y - (self.board.height - row) * self.tile_size
-                end_y = self.board_y + row * self.tile_size
-                
-                # Calculate fall duration based on distance
-                fall_distance = end_y - start_y
-                fall_duration = 0.3 + (fall_distance / (self.board_height * self.tile_size)) * 0.8
-                
+        for col in range(width):
+            for row in range(height):
                 # Create fall animation using the correct constructor
-                fall_anim = FallAnimation(start_y, end_y, fall_duration)
+                fall_anim = self.acquire_fall_animation(start_ys[row], end_ys[row], fall_duration)
                 fall_anim.col = col
                 fall_anim.to_row = row
-                fall_anim.tile = tile
+                fall_anim.tile = Tile(next(colors))
                 fall_anim.is_new_tile = True
                 
-                self.fall_animations.append(fall_anim)
+                self._add_fall_animation(fall_anim)
     
     def start_screen_shake(self, intensity: float, duration: float):
         """Start screen shake effect for dramatic impact"""
@@ -1158,29 +1385,29 @@ class Match3Game:
         self.screen_shake_timer = 0
     
     def update_screen_shake(self, dt):
-        """Update screen shake effect"""
-        if self.screen_shake_duration > 0:
-            self.screen_shake_timer += dt
+        """Update an active screen shake (update() skips this while screen_shake_duration is 0)"""
+        self.screen_shake_timer += dt
+        
+        if self.screen_shake_timer < self.screen_shake_duration:
+            # Calculate shake based on remaining time
+            progress = 1.0 - (self.screen_shake_timer / self.screen_shake_duration)
+            current_intensity = self.screen_shake_intensity * progress
             
-            if self.screen_shake_timer < self.screen_shake_duration:
-                # Calculate shake based on remaining time
-                progress = 1.0 - (self.screen_shake_timer / self.screen_shake_duration)
-                current_intensity = self.screen_shake_intensity * progress
-                
-                # Random shake offset
-                import random
-                self.screen_offset_x = random.uniform(-current_intensity, current_intensity)
-                self.screen_offset_y = random.uniform(-current_intensity, current_intensity)
-            else:
-                # Shake finished
-                self.screen_shake_duration = 0
-                self.screen_offset_x = 0
-                self.screen_offset_y = 0
+            # Random shake offset from the prebaked noise table
+            i = self._shake_noise_index
+            self.screen_offset_x = _SHAKE_NOISE[i] * current_intensity
+            self.screen_offset_y = _SHAKE_NOISE[i + 1] * current_intensity
+            self._shake_noise_index = (i + 2) & (_SHAKE_NOISE_SIZE - 1)
+        else:
+            # Shake finished
+            self.screen_shake_duration = 0
+            self.screen_offset_x = 0
+            self.screen_offset_y = 0
     
     def handle_lightning_cross_combo(self, pos, combo_tile):
         """Handle Lightning Cross combo - sequential lightning arcs across the board"""
         # Clear any existing fall animations to prevent interference
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Remove the combo tile
         self.board.set_tile(*pos, None)
@@ -1188,7 +1415,7 @@ class Match3Game:
         # Set up Lightning Cross animation state
         self.lightning_cross_active = True
         self.lightning_cross_timer = 0
-        self.lightning_cross_phase = 'arc_1'
+        self.lightning_cross_phase = 0
         self.lightning_cross_arc_count = 0
         
         # Add points to combo system (special tiles give 100 points)
@@ -1198,7 +1425,7 @@ class Match3Game:
         # Start the Lightning Cross sequence immediately
         self.start_lightning_cross_arc_1()
         
-        print("LIGHTNING CROSS ACTIVATED - Arcing across the board!")
+        logger.debug("LIGHTNING CROSS ACTIVATED - Arcing across the board!")
     
     def start_lightning_cross_arc_1(self):
         """Phase 1: Diagonal lightning from top-left to bottom-right"""
@@ -1206,93 +1433,85 @@ class Match3Game:
         self.pixel_particles.create_diagonal_lightning(
             start_x=self.board_x,
             start_y=self.board_y,
-            end_x=self.board_x + self.board_width * self.tile_size,
-            end_y=self.board_y + self.board_height * self.tile_size,
+            end_x=self._board_right,
+            end_y=self._board_bottom,
             color=(255, 255, 0),  # Yellow lightning
             thickness=6
         )
         
         # Clear tiles along the diagonal path
-        for i in range(min(self.board_height, self.board_width)):
-            if i < self.board_height and i < self.board_width:
-                self.board.set_tile(i, i, None)
+        self.board.clear_positions(self._diagonal_coords)
         
         # Screen shake for lightning impact
         self.start_screen_shake(20.0, 0.4)
         
-        print("Phase 1: Top-left to bottom-right diagonal lightning!")
+        logger.debug("Phase 1: Top-left to bottom-right diagonal lightning!")
     
     def start_lightning_cross_arc_2(self):
         """Phase 2: Vertical lightning from top middle to bottom middle"""
         mid_col = self.board_width // 2
+        mid_x = self.board_x + self._col_center_x[mid_col]
         
         # Create vertical lightning effect (blue/white)
         self.pixel_particles.create_diagonal_lightning(
-            start_x=self.board_x + mid_col * self.tile_size + self.tile_size // 2,
+            start_x=mid_x,
             start_y=self.board_y,
-            end_x=self.board_x + mid_col * self.tile_size + self.tile_size // 2,
-            end_y=self.board_y + self.board_height * self.tile_size,
+            end_x=mid_x,
+            end_y=self._board_bottom,
             color=(100, 200, 255),  # Blue lightning
             thickness=6
         )
         
         # Clear tiles along the vertical column
-        for row in range(self.board_height):
-            if 0 <= mid_col < self.board_width:
-                self.board.set_tile(row, mid_col, None)
+        self.board.clear_column(mid_col)
         
         # Screen shake for lightning impact
         self.start_screen_shake(20.0, 0.4)
         
-        print("Phase 2: Top to bottom vertical lightning!")
+        logger.debug("Phase 2: Top to bottom vertical lightning!")
     
     def start_lightning_cross_arc_3(self):
         """Phase 3: Diagonal lightning from top-right to bottom-left"""
         # Create diagonal lightning effect (purple/white)
         self.pixel_particles.create_diagonal_lightning(
-            start_x=self.board_x + self.board_width * self.tile_size,
+            start_x=self._board_right,
             start_y=self.board_y,
             end_x=self.board_x,
-            end_y=self.board_y + self.board_height * self.tile_size,
+            end_y=self._board_bottom,
             color=(200, 100, 255),  # Purple lightning
             thickness=6
         )
         
         # Clear tiles along the opposite diagonal
-        for i in range(min(self.board_height, self.board_width)):
-            row = i
-            col = (self.board_width - 1) - i
-            if 0 <= row < self.board_height and 0 <= col < self.board_width:
-                self.board.set_tile(row, col, None)
+        self.board.clear_positions(self._anti_diagonal_coords)
         
         # Screen shake for lightning impact
         self.start_screen_shake(20.0, 0.4)
         
-        print("Phase 3: Top-right to bottom-left diagonal lightning!")
+        logger.debug("Phase 3: Top-right to bottom-left diagonal lightning!")
     
     def start_lightning_cross_arc_4(self):
         """Phase 4: Horizontal lightning from middle left to middle right"""
         mid_row = self.board_height // 2
+        mid_y = self.board_y + self._row_center_y[mid_row]
         
         # Create horizontal lightning effect (red/orange)
         self.pixel_particles.create_diagonal_lightning(
             start_x=self.board_x,
-            start_y=self.board_y + mid_row * self.tile_size + self.tile_size // 2,
-            end_x=self.board_x + self.board_width * self.tile_size,
-            end_y=self.board_y + mid_row * self.tile_size + self.tile_size // 2,
+            start_y=mid_y,
+            end_x=self._board_right,
+            end_y=mid_y,
             color=(255, 150, 50),  # Orange lightning
             thickness=6
         )
         
         # Clear tiles along the horizontal row
-        for col in range(self.board_width):
-            if 0 <= mid_row < self.board_height:
-                self.board.set_tile(mid_row, col, None)
+        self.board.clear_row(mid_row)
         
         # Screen shake for lightning impact
         self.start_screen_shake(20.0, 0.4)
         
-        print("Phase 4: Left to right horizontal lightning!")
+        logger.debug("Phase 4: Left to right horizontal lightning!")
     
     def complete_lightning_cross(self):
         """Complete the Lightning Cross animation and restore normal gameplay"""
@@ -1300,18 +1519,19 @@ class Match3Game:
         self.lightning_cross_phase = None
         
         # Clear all animations and effects
-        self.fall_animations.clear()
+        self._clear_fall_animations()
         
         # Apply gravity and create falling tiles for the empty spaces
         self.start_fall_animation()
         
-        print("Lightning Cross complete - Board refilling!")
+        logger.debug("Lightning Cross complete - Board refilling!")
     
     def are_adjacent(self, pos1, pos2):
         """Check if two positions are adjacent (horizontally or vertically)"""
-        row1, col1 = pos1
-        row2, col2 = pos2
-        return (abs(row1 - row2) == 1 and col1 == col2) or (abs(col1 - col2) == 1 and row1 == row2)
+        # Integer grid positions are 4-neighbours exactly when their squared distance is 1
+        row_delta = pos1[0] - pos2[0]
+        col_delta = pos1[1] - pos2[1]
+        return row_delta * row_delta + col_delta * col_delta == 1
     
     def start_swap_animation(self, pos1, pos2):
         """Start swap animation between two tiles"""
@@ -1320,29 +1540,27 @@ class Match3Game:
         screen_pos2 = self.get_tile_screen_pos(pos2)
         
         # Create swap animation
-        swap_anim = SwapAnimation(screen_pos1, screen_pos2, 0.3)
+        swap_anim = self.acquire_swap_animation(screen_pos1, screen_pos2, 0.3)
         swap_anim.tile_pos1 = pos1
         swap_anim.tile_pos2 = pos2
         # Store the original tiles before swapping
         swap_anim.original_tile1 = self.board.get_tile(*pos1)
         swap_anim.original_tile2 = self.board.get_tile(*pos2)
-        self.swap_animations.append(swap_anim)
+        self._add_swap_animation(swap_anim)
         
         # DON'T perform the swap yet - wait for animation to complete
     
     def get_tile_screen_pos(self, board_pos):
-        """Convert board position to screen position"""
+        """Convert board position to the screen position of the tile's center"""
         row, col = board_pos
-        x = self.board_x + col * self.tile_size + self.tile_size // 2
-        y = self.board_y + row * self.tile_size + self.tile_size // 2
-        return (x, y)
+        return (self.board_x + self._col_center_x[col], self.board_y + self._row_center_y[row])
     
     def complete_swap_animation(self, swap_anim):
         """Complete a swap animation and check for matches"""
         pos1, pos2 = swap_anim.tile_pos1, swap_anim.tile_pos2
         
         # First, perform the actual swap on the board (unless this is a reversal)
-        if not getattr(swap_anim, 'is_reversal', False):
+        if not swap_anim.is_reversal:
             self.board.swap_tiles(pos1, pos2)
         
         # Check for combo tiles first
@@ -1357,8 +1575,7 @@ class Match3Game:
             self.board.set_tile(*pos2, None)
             
             # Check if this combo needs special handling
-            if hasattr(combo_tile, 'requires_special_handling') and combo_tile.requires_special_handling:
-                from special_tiles import SpecialTileType
+            if combo_tile.requires_special_handling:
                 if combo_tile.tile_type == SpecialTileType.BOMB_BOARDWIPE:
                     self.handle_bomb_boardwipe_combo(combo_pos, combo_tile)
                 elif combo_tile.tile_type == SpecialTileType.ROCKET_BOARDWIPE:
@@ -1370,33 +1587,25 @@ class Match3Game:
                 return
             
             # Store tile positions BEFORE activation for black hole animation
-            from special_tiles import SpecialTileType
             if combo_tile.tile_type == SpecialTileType.ENERGIZED_BOMB:
                 # Store all tile positions before they get cleared
+                board_x, board_y = self.board_x, self.board_y
+                col_center_x, row_center_y = self._col_center_x, self._row_center_y
                 self.original_tile_positions = {}
-                for row in range(self.board.height):
-                    for col in range(self.board.width):
-                        tile = self.board.get_tile(row, col)
-                        if tile and not tile.is_empty():
-                            screen_pos = self.get_tile_screen_pos((row, col))
-                            self.original_tile_positions[(row, col)] = {
-                                'original_x': screen_pos[0],
-                                'original_y': screen_pos[1],
-                                'current_x': screen_pos[0],
-                                'current_y': screen_pos[1],
-                                'tile': tile
-                            }
-                print(f"Stored {len(self.original_tile_positions)} tiles for black hole animation")
+                for row, col, tile in self.board.iter_occupied():
+                    x = board_x + col_center_x[col]
+                    y = board_y + row_center_y[row]
+                    self.original_tile_positions[(row, col)] = {
+                        'original_x': x,
+                        'original_y': y,
+                        'current_x': x,
+                        'current_y': y,
+                        'tile': tile
+                    }
+                logger.debug("Stored %s tiles for black hole animation", len(self.original_tile_positions))
             
             # Activate the combo tile immediately with animations
-            result = self.activate_special_tile_with_animation(*combo_pos)
-            if isinstance(result, tuple) and len(result) == 2:
-                affected_positions, activated_tiles = result
-            else:
-                # Handle old return format for compatibility
-                print(f"Warning: activate_special_tile returned unexpected format: {result}")
-                affected_positions = result if result else []
-                activated_tiles = [(combo_pos[0], combo_pos[1], combo_tile)] if combo_tile else []
+            affected_positions, activated_tiles = self.activate_special_tile_with_animation(*combo_pos)
             
             if affected_positions:
                 # Create particle effects for all activated special tiles
@@ -1424,7 +1633,6 @@ class Match3Game:
         tile2 = self.board.get_tile(*pos2)
         
         # Handle board wipe special case - need target color from the swapped tile
-        from special_tiles import SpecialTileType
         
         if tile1 and tile1.is_special() and tile1.special_tile.tile_type == SpecialTileType.BOARD_WIPE:
             # Board wipe needs the target color - temporarily set it on the tile
@@ -1443,13 +1651,7 @@ class Match3Game:
         else:
             # Handle other special tiles normally
             if tile1 and tile1.is_special():
-                result = self.activate_special_tile_with_animation(*pos1)
-                if isinstance(result, tuple) and len(result) == 2:
-                    affected_positions, activated_tiles = result
-                else:
-                    # Handle old return format for compatibility
-                    affected_positions = result if result else []
-                    activated_tiles = [(pos1[0], pos1[1], tile1.special_tile)] if tile1.special_tile else []
+                affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos1)
                 
                 if affected_positions:
                     # Create particle effects for all activated special tiles
@@ -1462,13 +1664,7 @@ class Match3Game:
                     special_activated = True
             
             if tile2 and tile2.is_special():
-                result = self.activate_special_tile_with_animation(*pos2)
-                if isinstance(result, tuple) and len(result) == 2:
-                    affected_positions, activated_tiles = result
-                else:
-                    # Handle old return format for compatibility
-                    affected_positions = result if result else []
-                    activated_tiles = [(pos2[0], pos2[1], tile2.special_tile)] if tile2.special_tile else []
+                affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos2)
                 
                 if affected_positions:
                     # Create particle effects for all activated special tiles
@@ -1496,14 +1692,14 @@ class Match3Game:
             # Create reverse swap animation with current positions as starting points
             screen_pos1 = self.get_tile_screen_pos(pos1)
             screen_pos2 = self.get_tile_screen_pos(pos2)
-            reverse_swap = SwapAnimation(screen_pos1, screen_pos2, 0.2)
+            reverse_swap = self.acquire_swap_animation(screen_pos1, screen_pos2, 0.2)
             reverse_swap.tile_pos1 = pos1
             reverse_swap.tile_pos2 = pos2
             reverse_swap.is_reversal = True
             # Store the tiles that need to be shown during reversal (the swapped ones)
             reverse_swap.original_tile1 = self.board.get_tile(*pos1)
             reverse_swap.original_tile2 = self.board.get_tile(*pos2)
-            self.swap_animations.append(reverse_swap)
+            self._add_swap_animation(reverse_swap)
             # Perform the reverse swap on the board
             self.board.swap_tiles(pos1, pos2)
     
@@ -1537,7 +1733,8 @@ class Match3Game:
                 # Scale up the fireball sprite to make it MASSIVE (6x size)
                 original_size = original_sprite.get_size()
                 new_size = (original_size[0] * 6, original_size[1] * 6)
-                self.fireball_sprite = pygame.transform.scale(original_sprite, new_size)
+                # Convert once so the per-frame fireball blit doesn't pay a format conversion
+                self.fireball_sprite = pygame.transform.scale(original_sprite, new_size).convert_alpha()
                 print("✓ Loaded fireball sprite: fireball.png (scaled 6x)")
             except Exception as e:
                 print(f"✗ Could not load fireball sprite: {e}")
@@ -1549,8 +1746,8 @@ class Match3Game:
         target_col = random.randint(0, self.board_width - 1)
         target_row = random.randint(0, self.board_height - 1)
         self.fireball_target = (
-            self.board_x + target_col * self.tile_size + self.tile_size // 2,
-            self.board_y + target_row * self.tile_size + self.tile_size // 2
+            self.board_x + self._col_center_x[target_col],
+            self.board_y + self._row_center_y[target_row]
         )
         
         # Start from top-right corner
@@ -1560,7 +1757,7 @@ class Match3Game:
         self.fireball_active = True
         self.fireball_smoke_particles = []
         
-        print(f"Fireball launched targeting tile!")
+        logger.debug("Fireball launched targeting tile!")
         
     def update_fireball_animation(self, dt):
         """Update fireball movement and effects"""
@@ -1634,14 +1831,12 @@ class Match3Game:
         
         # Detonate special tiles by activating them
         for row, col, tile in special_tiles_to_detonate:
-            print(f"Fireball detonating special tile at ({row}, {col}): {tile.special_tile.tile_type}")
+            logger.debug("Fireball detonating special tile at (%s, %s): %s", row, col, tile.special_tile.tile_type)
             # Activate the special tile with animations (this will cause it to trigger its effect)
-            result = self.activate_special_tile_with_animation(row, col)
-            if isinstance(result, tuple) and len(result) == 2:
-                affected_positions, activated_tiles = result
-                # Create particle effects for the detonated special tile
-                for tile_row, tile_col, special_tile in activated_tiles:
-                    self.create_special_effect_particles((tile_row, tile_col), special_tile)
+            affected_positions, activated_tiles = self.activate_special_tile_with_animation(row, col)
+            # Create particle effects for the detonated special tile
+            for tile_row, tile_col, special_tile in activated_tiles:
+                self.create_special_effect_particles((tile_row, tile_col), special_tile)
                 
         # Create single dramatic explosion at impact center
         if positions_to_clear:
@@ -1661,26 +1856,19 @@ class Match3Game:
         # Start fall animation
         self.start_fall_animation()
         
-        print(f"Fireball exploded! Destroyed {len(positions_to_clear)} tiles for {explosion_points} points")
+        logger.debug("Fireball exploded! Destroyed %s tiles for %s points", len(positions_to_clear), explosion_points)
 
     def get_tile_color_rgb(self, tile_color):
         """Convert TileColor enum to RGB tuple"""
-        color_map = {
-            TileColor.RED: (255, 100, 100),
-            TileColor.GREEN: (100, 255, 100),
-            TileColor.BLUE: (100, 100, 255),
-            TileColor.YELLOW: (255, 255, 100),
-            TileColor.ORANGE: (255, 165, 0)
-        }
-        return color_map.get(tile_color, (255, 255, 255))
+        return _TILE_EFFECT_COLORS.get(tile_color, (255, 255, 255))
 
     def create_tile_particles(self, grid_pos, tile_color):
         """Create explosion particles when a tile is destroyed"""
         row, col = grid_pos
         
         # Convert grid position to screen position
-        center_x = self.board_x + col * self.tile_size + self.tile_size // 2
-        center_y = self.board_y + row * self.tile_size + self.tile_size // 2
+        center_x = self.board_x + self._col_center_x[col]
+        center_y = self.board_y + self._row_center_y[row]
         
         # Convert tile color to RGB
         rgb_color = self.get_tile_color_rgb(tile_color)
@@ -1690,9 +1878,9 @@ class Match3Game:
 
     def calculate_match_points(self, match):
         """Calculate points for a match based on its type"""
-        if hasattr(match, 'is_special_combo') and match.is_special_combo:
+        if match.is_special_combo:
             return 100  # Special tile combo = 100 points
-        elif hasattr(match, 'has_special_tile') and match.has_special_tile:
+        elif match.has_special_tile:
             return 20   # Special tile = 20 points
         else:
             # Regular matches: 3-match=3pts, 4-match=4pts, 5-match=5pts
@@ -1749,6 +1937,13 @@ class Match3Game:
     
     def create_pop_animations_for_matches(self, matches):
         """Create pop animations for matched tiles"""
+        self._create_pop_animations(matches, self.board, self.board_x, self.board_y,
+                                    self.pop_animations, self._pop_cells, self.pop_particles)
+    
+    def _create_pop_animations(self, matches, board, board_x, board_y, pop_animations, pop_cells, pop_particles):
+        """Create pop animations and particles for matched tiles on the given board"""
+        half_tile = self.tile_size // 2
+        col_offset_x, row_offset_y = self._col_offset_x, self._row_offset_y
         for match in matches:
             # Get tile positions and data for animation
             tile_positions = []
@@ -1756,12 +1951,12 @@ class Match3Game:
             match_color = None
             
             for row, col in match.positions:
-                tile = self.board.get_tile(row, col)
+                tile = board.get_tile(row, col)
                 if tile and tile.color != TileColor.EMPTY:
-                    x = self.board_x + col * self.tile_size
-                    y = self.board_y + row * self.tile_size
+                    x = board_x + col_offset_x[col]
+                    y = board_y + row_offset_y[row]
                     tile_positions.append((row, col, x, y))
-                    tile_data.append(tile.copy() if hasattr(tile, 'copy') else tile)  # Store copy of tile
+                    tile_data.append(tile)  # Popping tiles leave the board, so the animation can keep the tile itself
                     if match_color is None:
                         match_color = tile.color
             
@@ -1769,183 +1964,158 @@ class Match3Game:
                 continue
             
             # Check if this match will create a special tile
-            special_tile_pos = self.board.get_special_tile_position(match)
+            special_tile_pos = board.get_special_tile_position(match)
             center_pos = None
-            is_special = False
             
             if special_tile_pos:
-                is_special = True
                 center_row, center_col = special_tile_pos
-                center_x = self.board_x + center_col * self.tile_size + self.tile_size // 2
-                center_y = self.board_y + center_row * self.tile_size + self.tile_size // 2
-                center_pos = (center_x, center_y)
+                center_pos = (board_x + self._col_center_x[center_col],
+                              board_y + self._row_center_y[center_row])
             
             # Create pop animation with tile data
             pop_anim = PopAnimation(tile_positions, tile_data, center_pos)
-            self.pop_animations.append(pop_anim)
+            self._add_pop_animation(pop_animations, pop_cells, pop_anim)
             
-            # Create pop particle at center of match
-            if tile_positions:
-                if is_special and center_pos:
-                    # Special match: white particle at center position
-                    pop_particle = PopParticle(center_pos[0], center_pos[1], (255, 255, 255), True)
-                else:
-                    # Normal match: colored particle at match center
-                    avg_x = sum(pos[2] for pos in tile_positions) / len(tile_positions) + self.tile_size // 2
-                    avg_y = sum(pos[3] for pos in tile_positions) / len(tile_positions) + self.tile_size // 2
-                    
-                    # Get color from tile color
-                    color = self.get_color_from_tile_color(match_color)
-                    pop_particle = PopParticle(avg_x, avg_y, color, False)
+            # Create pop particle burst at center of match
+            if center_pos:
+                # Special match: white particles at center position
+                pop_particles.burst(center_pos[0], center_pos[1], (255, 255, 255), True)
+            else:
+                # Normal match: colored particle at match center
+                sum_x = sum_y = 0
+                for _, _, x, y in tile_positions:
+                    sum_x += x
+                    sum_y += y
+                count = len(tile_positions)
+                avg_x = sum_x / count + half_tile
+                avg_y = sum_y / count + half_tile
                 
-                self.pop_particles.append(pop_particle)
+                # Get color from tile color
+                color = _TILE_EFFECT_COLORS.get(match_color, (255, 255, 255))
+                pop_particles.burst(avg_x, avg_y, color, False)
+    
+    def acquire_fall_animation(self, start_y, end_y, duration):
+        """Get a fall animation from the pool (or a new one) reset to run from start_y to end_y"""
+        if self._fall_animation_pool:
+            fall_anim = self._fall_animation_pool.pop()
+            fall_anim.reset(start_y, end_y, duration)
+            return fall_anim
+        return FallAnimation(start_y, end_y, duration)
+    
+    def acquire_swap_animation(self, pos1, pos2, duration):
+        """Get a swap animation from the pool (or a new one) reset to swap pos1 and pos2"""
+        if self._swap_animation_pool:
+            swap_anim = self._swap_animation_pool.pop()
+            swap_anim.reset(pos1, pos2, duration)
+            return swap_anim
+        return SwapAnimation(pos1, pos2, duration)
+    
+    def acquire_particle_effect(self, x, y, color, count=10):
+        """Get a particle effect from the pool (or a new one) reset to burst at (x, y)"""
+        if self._particle_effect_pool:
+            effect = self._particle_effect_pool.pop()
+            effect.reset(x, y, color, count)
+            return effect
+        return ParticleEffect(x, y, color, count)
     
     def get_color_from_tile_color(self, tile_color):
         """Convert TileColor enum to RGB tuple"""
-        color_map = {
-            TileColor.RED: (255, 100, 100),
-            TileColor.GREEN: (100, 255, 100),
-            TileColor.BLUE: (100, 100, 255),
-            TileColor.YELLOW: (255, 255, 100),
-            TileColor.ORANGE: (255, 165, 0)
-        }
-        return color_map.get(tile_color, (255, 255, 255))
+        return _TILE_EFFECT_COLORS.get(tile_color, (255, 255, 255))
     
     def get_pop_animation_scale(self, row, col):
         """Get the current scale for a tile due to pop animation"""
-        for pop_anim in self.pop_animations:
-            for i, (tile_row, tile_col, _, _) in enumerate(pop_anim.tile_positions):
-                if tile_row == row and tile_col == col:
-                    return pop_anim.get_tile_scale(i)
-        return 1.0  # No animation, full scale
+        entry = self._pop_cells.get((row, col))
+        if entry is None:
+            return 1.0  # No animation, full scale
+        # Indexed cells are always in range, and all of an animation's tiles share its scale
+        return entry[0].scale
     
     def get_pop_animation_tile(self, row, col):
         """Get the tile data from pop animation if this tile is animating"""
-        for pop_anim in self.pop_animations:
-            for i, (tile_row, tile_col, _, _) in enumerate(pop_anim.tile_positions):
-                if tile_row == row and tile_col == col:
-                    return pop_anim.tile_data[i]
-        return None
+        entry = self._pop_cells.get((row, col))
+        if entry is None:
+            return None
+        pop_anim, i = entry
+        return pop_anim.tile_data[i]
     
     def get_spawn_animation_scale(self, row, col):
         """Get the current scale for a tile due to spawn animation"""
-        for spawn_anim in self.spawn_animations:
-            if spawn_anim.row == row and spawn_anim.col == col:
-                return spawn_anim.get_scale()
-        return 1.0  # No animation, full scale
+        spawn_anim = self._spawn_cells.get((row, col))
+        if spawn_anim is None:
+            return 1.0  # No animation, full scale
+        return spawn_anim.get_scale()
     
     def create_spawn_animation(self, row, col):
         """Create a spawn animation for a special tile"""
         spawn_anim = SpawnAnimation(row, col)
         self.spawn_animations.append(spawn_anim)
+        self._spawn_cells.setdefault((row, col), spawn_anim)
     
     def create_boss_pop_animations_for_matches(self, matches):
         """Create pop animations for boss board matched tiles"""
-        for match in matches:
-            # Get tile positions and data for animation
-            tile_positions = []
-            tile_data = []
-            match_color = None
-            
-            for row, col in match.positions:
-                tile = self.boss_board.get_tile(row, col)
-                if tile and tile.color != TileColor.EMPTY:
-                    x = self.boss_board_x + col * self.tile_size
-                    y = self.boss_board_y + row * self.tile_size
-                    tile_positions.append((row, col, x, y))
-                    tile_data.append(tile.copy() if hasattr(tile, 'copy') else tile)  # Store copy of tile
-                    if match_color is None:
-                        match_color = tile.color
-            
-            if not tile_positions:
-                continue
-            
-            # Check if this match will create a special tile
-            special_tile_pos = self.boss_board.get_special_tile_position(match)
-            center_pos = None
-            is_special = False
-            
-            if special_tile_pos:
-                is_special = True
-                center_row, center_col = special_tile_pos
-                center_x = self.boss_board_x + center_col * self.tile_size + self.tile_size // 2
-                center_y = self.boss_board_y + center_row * self.tile_size + self.tile_size // 2
-                center_pos = (center_x, center_y)
-            
-            # Create pop animation with tile data
-            pop_anim = PopAnimation(tile_positions, tile_data, center_pos)
-            self.boss_pop_animations.append(pop_anim)
-            
-            # Create pop particle at center of match
-            if tile_positions:
-                if is_special and center_pos:
-                    # Special match: white particle at center position
-                    pop_particle = PopParticle(center_pos[0], center_pos[1], (255, 255, 255), True)
-                else:
-                    # Normal match: colored particle at match center
-                    avg_x = sum(pos[2] for pos in tile_positions) / len(tile_positions) + self.tile_size // 2
-                    avg_y = sum(pos[3] for pos in tile_positions) / len(tile_positions) + self.tile_size // 2
-                    
-                    # Get color from tile color
-                    color = self.get_color_from_tile_color(match_color)
-                    pop_particle = PopParticle(avg_x, avg_y, color, False)
-                
-                self.boss_pop_particles.append(pop_particle)
+        self._create_pop_animations(matches, self.boss_board, self.boss_board_x, self.boss_board_y,
+                                    self.boss_pop_animations, self._boss_pop_cells, self.boss_pop_particles)
     
     def get_boss_pop_animation_scale(self, row, col):
         """Get the current scale for a boss tile due to pop animation"""
-        for pop_anim in self.boss_pop_animations:
-            for i, (tile_row, tile_col, _, _) in enumerate(pop_anim.tile_positions):
-                if tile_row == row and tile_col == col:
-                    return pop_anim.get_tile_scale(i)
-        return 1.0  # No animation, full scale
+        entry = self._boss_pop_cells.get((row, col))
+        if entry is None:
+            return 1.0  # No animation, full scale
+        # Indexed cells are always in range, and all of an animation's tiles share its scale
+        return entry[0].scale
     
     def get_boss_pop_animation_tile(self, row, col):
         """Get the tile data from boss pop animation if this tile is animating"""
-        for pop_anim in self.boss_pop_animations:
-            for i, (tile_row, tile_col, _, _) in enumerate(pop_anim.tile_positions):
-                if tile_row == row and tile_col == col:
-                    return pop_anim.tile_data[i]
-        return None
+        entry = self._boss_pop_cells.get((row, col))
+        if entry is None:
+            return None
+        pop_anim, i = entry
+        return pop_anim.tile_data[i]
     
     def get_boss_spawn_animation_scale(self, row, col):
         """Get the current scale for a boss tile due to spawn animation"""
-        for spawn_anim in self.boss_spawn_animations:
-            if spawn_anim.row == row and spawn_anim.col == col:
-                return spawn_anim.get_scale()
-        return 1.0  # No animation, full scale
+        spawn_anim = self._boss_spawn_cells.get((row, col))
+        if spawn_anim is None:
+            return 1.0  # No animation, full scale
+        return spawn_anim.get_scale()
     
     def create_boss_spawn_animation(self, row, col):
         """Create a spawn animation for a boss special tile"""
         spawn_anim = SpawnAnimation(row, col)
         self.boss_spawn_animations.append(spawn_anim)
+        self._boss_spawn_cells.setdefault((row, col), spawn_anim)
     
     def start_fall_animation(self):
         """Start falling animation for tiles after matches are cleared"""
         # Apply gravity to determine new positions
         fall_data = self.board.apply_gravity_with_animation_data()
         
+        board_y = self.board_y
+        tile_size = self.tile_size
+        row_offset_y = self._row_offset_y
+        board_height_px = self.board_height * tile_size
+        
         # Create fall animations for existing tiles
         for col, tiles_to_fall in fall_data.items():
             for tile_data in tiles_to_fall:
-                start_y = self.board_y + tile_data['from_row'] * self.tile_size
-                end_y = self.board_y + tile_data['to_row'] * self.tile_size
+                start_y = board_y + row_offset_y[tile_data['from_row']]
+                end_y = board_y + row_offset_y[tile_data['to_row']]
                 
                 if start_y != end_y:
                     # Calculate duration - use same formula as new tiles for consistency
                     fall_distance = end_y - start_y
-                    duration = 0.3 + (fall_distance / (self.board_height * self.tile_size)) * 0.8
+                    duration = 0.3 + (fall_distance / board_height_px) * 0.8
                     
-                    fall_anim = FallAnimation(start_y, end_y, duration)
+                    fall_anim = self.acquire_fall_animation(start_y, end_y, duration)
                     fall_anim.col = col
                     fall_anim.from_row = tile_data['from_row']
                     fall_anim.to_row = tile_data['to_row']
                     fall_anim.tile = tile_data['tile']
                     fall_anim.is_existing_tile = True
-                    self.fall_animations.append(fall_anim)
+                    self._add_fall_animation(fall_anim)
         
         # During Reality Break, don't fill empty spaces with new tiles
-        if not hasattr(self, 'reality_break_phase') or self.reality_break_phase is None:
+        if self.reality_break_phase is None:
             # Create fall animations for new tiles BEFORE placing them on board
             self.create_new_tile_animations_improved()
             
@@ -1953,16 +2123,22 @@ class Match3Game:
     
     def create_new_tile_animations_improved(self):
         """Create fall animations for new tiles - tiles exist ONLY in animations until completion"""
-        import random
-        from board import Tile
+        grid = self.board.grid
+        available_colors = self.board.available_colors
+        board_y = self.board_y
+        tile_size = self.tile_size
+        row_offset_y = self._row_offset_y
+        board_height_px = self.board_height * tile_size
+        
+        # Find empty positions that need new tiles, then draw every new tile's color in one call
+        empties_per_col = [[row for row, grid_row in enumerate(grid) if grid_row[col] is None]
+                           for col in range(self.board_width)]
+        total_empty = sum(len(empty_positions) for empty_positions in empties_per_col)
+        if not total_empty:
+            return
+        new_colors = iter(random.choices(available_colors, k=total_empty))
         
-        for col in range(self.board_width):
-            # Find empty positions that need new tiles
-            empty_positions = []
-            for row in range(self.board_height):
-                if self.board.get_tile(row, col) is None:
-                    empty_positions.append(row)
-            
+        for col, empty_positions in enumerate(empties_per_col):
             # Skip this column if there are no empty positions  
             if not empty_positions:
                 continue
@@ -1970,58 +2146,26 @@ class Match3Game:
             # Create animations for new tiles, stacking them properly above the board
             for i, row in enumerate(empty_positions):
                 # Create a new tile
-                color = random.choice(self.board.available_colors)
-                tile = Tile(color)
+                tile = Tile(next(new_colors))
                 
                 # Stack new tiles above the board in reverse order
                 stack_position = len(empty_positions) - i
-                start_y = self.board_y - stack_position * self.tile_size
-                end_y = self.board_y + row * self.tile_size
+                start_y = board_y - stack_position * tile_size
+                end_y = board_y + row_offset_y[row]
                 
                 # Calculate fall duration based on distance
                 fall_distance = end_y - start_y
-                fall_duration = 0.3 + (fall_distance / (self.board_height * self.tile_size)) * 0.8
+                fall_duration = 0.3 + (fall_distance / board_height_px) * 0.8
                 
-                fall_anim = FallAnimation(start_y, end_y, fall_duration)
+                fall_anim = self.acquire_fall_animation(start_y, end_y, fall_duration)
                 fall_anim.col = col
                 fall_anim.to_row = row
                 fall_anim.tile = tile
                 fall_anim.is_new_tile = True
-                self.fall_animations.append(fall_anim)
+                self._add_fall_animation(fall_anim)
                 
                 # DO NOT place tile on board - it exists only in animation until completion
 
-    def create_new_tile_animations(self):
-        """Create fall animations for newly spawned tiles"""
-        for col in range(self.board_width):
-            # Find all newly spawned tiles in this column from top to bottom
-            new_tiles = []
-            for row in range(self.board_height):
-                tile = self.board.get_tile(row, col)
-                if tile and hasattr(tile, 'newly_spawned') and tile.newly_spawned:
-                    new_tiles.append((row, tile))
-                    # Remove the newly_spawned flag
-                    delattr(tile, 'newly_spawned')
-            
-            # Create animations for new tiles, stacking them properly above the board
-            for i, (row, tile) in enumerate(new_tiles):
-                # Stack new tiles above the board in reverse order
-                # The tile that will end up at the topmost empty position should start highest
-                stack_position = len(new_tiles) - i
-                start_y = self.board_y - stack_position * self.tile_size
-                end_y = self.board_y + row * self.tile_size
-                
-                # Calculate fall duration based on distance (makes it feel more natural)
-                fall_distance = end_y - start_y
-                fall_duration = 0.3 + (fall_distance / (self.board_height * self.tile_size)) * 0.8
-                
-                fall_anim = FallAnimation(start_y, end_y, fall_duration)
-                fall_anim.col = col
-                fall_anim.to_row = row
-                fall_anim.tile = tile
-                fall_anim.is_new_tile = True
-                self.fall_animations.append(fall_anim)
-    
     def complete_fall_animation(self):
         """Complete falling animation and check for new matches"""
         # Check for new matches
@@ -2039,112 +2183,73 @@ class Match3Game:
     
     def create_special_effect_particles(self, pos, special_tile, boss_board=False):
         """Create particle effects for special tile activation"""
+        self.create_special_effect_particles_batch(((pos[0], pos[1], special_tile),), boss_board)
+    
+    def create_special_effect_particles_batch(self, activated_tiles, boss_board=False):
+        """Create particle effects for (row, col, special_tile) activations, setting up the board once"""
         if boss_board:
-            screen_pos = self.get_boss_tile_screen_pos(pos)
+            board_x, board_y = self.boss_board_x, self.boss_board_y
+            board_bounds = self._get_boss_board_bounds()
         else:
-            screen_pos = self.get_tile_screen_pos(pos)
-        visual_data = special_tile.get_visual_representation()
-        effect_color = visual_data.get('effect_color', (255, 255, 255))
-        
-        # Check if it's a bomb and create pixel explosion effect
-        if special_tile.tile_type == SpecialTileType.BOMB:
-            # Create pixel art explosion for regular bombs (not in combos)
-            center_x = screen_pos[0] + self.tile_size // 2
-            center_y = screen_pos[1] + self.tile_size // 2
-            self.pixel_particles.create_bomb_explosion(center_x, center_y)
-            # Add dramatic screen shake for bomb explosions
-            self.start_screen_shake(12.0, 0.4)  # Strong shake for bombs
-        
-        # Check if it's a rocket and create rocket trail effect
-        elif special_tile.tile_type in [SpecialTileType.ROCKET_HORIZONTAL, SpecialTileType.ROCKET_VERTICAL]:
-            # Get appropriate board bounds for clipping
-            if boss_board:
-                board_bounds = self._get_boss_board_bounds()
-                board_x, board_y = self.boss_board_x, self.boss_board_y
-            else:
-                board_bounds = self._get_board_bounds()
-                board_x, board_y = self.board_x, self.board_y
+            board_x, board_y = self.board_x, self.board_y
+            board_bounds = self._get_board_bounds()
+        col_center_x = self._col_center_x
+        row_center_y = self._row_center_y
+        half_tile = self.tile_size // 2
+        
+        for row, col, special_tile in activated_tiles:
+            tile_type = special_tile.tile_type
+            handler_name = _SPECIAL_FX_HANDLERS.get(tile_type)
+            if handler_name is None:
+                continue  # No pixel effect for this type
             
-            if special_tile.tile_type == SpecialTileType.ROCKET_HORIZONTAL:
-                # For horizontal rockets, use row center and middle of board for Y
-                row, col = pos
-                center_x = screen_pos[0] + self.tile_size // 2
-                # Center the horizontal rocket on the exact middle of the row
-                center_y = board_y + (row * self.tile_size) + (self.tile_size // 2)
-                self.pixel_particles.create_rocket_trail(center_x, center_y, 'horizontal', board_bounds)
-            else:
-                # For vertical rockets, use column center and middle of board for X
-                row, col = pos
-                # Center the vertical rocket on the exact middle of the column
-                center_x = board_x + (col * self.tile_size) + (self.tile_size // 2)
-                center_y = screen_pos[1] + self.tile_size // 2
-                self.pixel_particles.create_rocket_trail(center_x, center_y, 'vertical', board_bounds)
-        
-        # Check if it's a simple cross (rocket combo) and create cross trail effect
-        elif special_tile.tile_type == SpecialTileType.SIMPLE_CROSS:
-            # Create cross pattern (both horizontal and vertical) - properly centered
-            if boss_board:
-                board_bounds = self._get_boss_board_bounds()
-                board_x, board_y = self.boss_board_x, self.boss_board_y
-            else:
-                board_bounds = self._get_board_bounds()
-                board_x, board_y = self.board_x, self.board_y
+            # The cell's center comes straight from the precomputed center tables
+            center_x = board_x + col_center_x[col]
+            center_y = board_y + row_center_y[row]
             
-            row, col = pos
-            # Use same centering logic as individual rockets
-            center_x = board_x + (col * self.tile_size) + (self.tile_size // 2)
-            center_y = board_y + (row * self.tile_size) + (self.tile_size // 2)
-            self.pixel_particles.create_rocket_trail(center_x, center_y, 'cross', board_bounds)
-        
-        # Check if it's a lightning cross combo and create sequential lightning arcs
-        elif special_tile.tile_type == SpecialTileType.LIGHTNING_CROSS:
-            self.handle_lightning_cross_combo(pos, special_tile)
-            return  # Special handling, no normal board clearing
-        
-        # Check if it's a bomb+rocket combo and create large bomb-colored cross trail
-        elif special_tile.tile_type == SpecialTileType.BOMB_ROCKET:
-            # Create large cross pattern with bomb explosion colors (3-wide cross)
-            if boss_board:
-                board_bounds = self._get_boss_board_bounds()
-                board_x, board_y = self.boss_board_x, self.boss_board_y
-            else:
-                board_bounds = self._get_board_bounds()
-                board_x, board_y = self.board_x, self.board_y
+            # Point effects have always been placed half a tile past the cell center
+            getattr(self, handler_name)((row, col), special_tile, center_x, center_y,
+                                        center_x + half_tile, center_y + half_tile, board_bounds)
             
-            row, col = pos
-            # Use same centering logic as individual rockets
-            center_x = board_x + (col * self.tile_size) + (self.tile_size // 2)
-            center_y = board_y + (row * self.tile_size) + (self.tile_size // 2)
-            self.pixel_particles.create_bomb_rocket_trail(center_x, center_y, board_bounds)
-            # Add massive screen shake for bomb+rocket combo (most powerful)
-            self.start_screen_shake(15.0, 0.5)  # Strongest shake for ultimate combo
-        
-        # Check if it's a lightning and create lightning arc effect
-        elif special_tile.tile_type == SpecialTileType.LIGHTNING:
-            # Create dramatic lightning arc effect
-            center_x = screen_pos[0] + self.tile_size // 2
-            center_y = screen_pos[1] + self.tile_size // 2
-            self.pixel_particles.create_lightning_arc(center_x, center_y)
-            # Add electric screen shake for lightning bolts
-            self.start_screen_shake(6.0, 0.25)  # Medium shake for lightning
-        
-        # Check if it's a mega bomb (bomb+bomb combo) and create nuclear explosion
-        elif special_tile.tile_type == SpecialTileType.MEGA_BOMB:
-            # Create nuclear-style megabomb explosion
-            center_x = screen_pos[0] + self.tile_size // 2
-            center_y = screen_pos[1] + self.tile_size // 2
-            self.pixel_particles.create_nuclear_megabomb(center_x, center_y)
-            # Add MASSIVE screen shake for nuclear megabomb (most intense)
-            self.start_screen_shake(20.0, 0.8)  # ULTIMATE shake for nuclear bomb!
-        
-        # Check if it's an energized bomb (bomb+lightning combo) and create black hole effect
-        elif special_tile.tile_type == SpecialTileType.ENERGIZED_BOMB:
-            # Start black hole animation
-            center_x = screen_pos[0] + self.tile_size // 2
-            center_y = screen_pos[1] + self.tile_size // 2
-            self.start_black_hole_animation(center_x, center_y)
-        
-        # Skip old particle effects - pixel particles are much more dramatic
+            shake = _SPECIAL_FX_SHAKE.get(tile_type)
+            if shake is not None:
+                self.start_screen_shake(*shake)
+    
+    def _fx_bomb(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Pixel art explosion for regular bombs (not in combos)"""
+        self.pixel_particles.create_bomb_explosion(offset_x, offset_y)
+    
+    def _fx_rocket_horizontal(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Rocket trail centered on the exact middle of the row"""
+        self.pixel_particles.create_rocket_trail(offset_x, center_y, 'horizontal', board_bounds)
+    
+    def _fx_rocket_vertical(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Rocket trail centered on the exact middle of the column"""
+        self.pixel_particles.create_rocket_trail(center_x, offset_y, 'vertical', board_bounds)
+    
+    def _fx_simple_cross(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Horizontal and vertical rocket trails (rocket combo), centered like single rockets"""
+        self.pixel_particles.create_rocket_trail(center_x, center_y, 'cross', board_bounds)
+    
+    def _fx_lightning_cross(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Sequential lightning arcs; handles its own board clearing"""
+        self.handle_lightning_cross_combo(pos, special_tile)
+    
+    def _fx_bomb_rocket(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Large 3-wide bomb-colored cross trail, centered like single rockets"""
+        self.pixel_particles.create_bomb_rocket_trail(center_x, center_y, board_bounds)
+    
+    def _fx_lightning(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Dramatic lightning arc"""
+        self.pixel_particles.create_lightning_arc(offset_x, offset_y)
+    
+    def _fx_mega_bomb(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Nuclear-style explosion for the bomb+bomb combo"""
+        self.pixel_particles.create_nuclear_megabomb(offset_x, offset_y)
+    
+    def _fx_energized_bomb(self, pos, special_tile, center_x, center_y, offset_x, offset_y, board_bounds):
+        """Black hole for the bomb+lightning combo"""
+        self.start_black_hole_animation(offset_x, offset_y)
     
     def _get_board_bounds(self):
         """Get the board rendering bounds for particle clipping"""
@@ -2168,7 +2273,13 @@ class Match3Game:
         """Update game state"""
         # Update bomb boardwipe animation
         if self.bomb_boardwipe_active:
-            self.update_bomb_boardwipe_animation(dt)
+            if self.bomb_boardwipe_phase == 'showing':
+                # Phase 1: Just show the bombs for 0.5 seconds
+                self.bomb_boardwipe_timer += dt
+                if self.bomb_boardwipe_timer >= 0.5:
+                    self.bomb_boardwipe_phase = 'detonating'
+            if self.bomb_boardwipe_phase == 'detonating':
+                self.update_bomb_boardwipe_animation(dt)
             # Continue with other animations (especially fall animations)
         
         # Update board wipe animation
@@ -2181,7 +2292,8 @@ class Match3Game:
             # Don't return early - let particle system update
         
         # Update screen shake
-        self.update_screen_shake(dt)
+        if self.screen_shake_duration > 0:
+            self.update_screen_shake(dt)
         
         # Update boss board combo animations
         if self.boss_bomb_boardwipe_active:
@@ -2198,47 +2310,63 @@ class Match3Game:
             self.update_black_hole_animation(dt)
         
         # Update reality break animation
-        if hasattr(self, 'reality_break_active') and self.reality_break_active:
+        if self.reality_break_active:
             self.update_reality_break_animation(dt)
         
         # Update lightning cross animation
-        if hasattr(self, 'lightning_cross_active') and self.lightning_cross_active:
+        if self.lightning_cross_active:
             self.update_lightning_cross_animation(dt)
         
+        # Falls pause during rocket lightning and black hole; swaps also pause during reality break
+        # and lightning cross. Read the flags once here, after the effect updates above.
+        fall_blocked = self.rocket_lightning_active or self.black_hole_active
+        swap_blocked = fall_blocked or self.reality_break_active or self.lightning_cross_active
+        
         # Update swap animations (skip during special effects)
-        if (not self.rocket_lightning_active and not self.black_hole_active and 
-            not (hasattr(self, 'reality_break_active') and self.reality_break_active) and
-            not (hasattr(self, 'lightning_cross_active') and self.lightning_cross_active)):
-            for swap_anim in self.swap_animations[:]:
-                if swap_anim.update(dt):
-                    # Animation completed
-                    self.swap_animations.remove(swap_anim)
+        if not swap_blocked and self.swap_animations:
+            # Drop finished swaps before completing them, since completing may start a new swap
+            finished = self._step_animations(self.swap_animations, dt)
+            if finished:
+                for swap_anim in finished:
+                    self._release_swap_animation(swap_anim)
                     
-                    if not hasattr(swap_anim, 'is_reversal'):
+                    if not swap_anim.is_reversal:
                         # Check for matches (not for reversals)
                         self.complete_swap_animation(swap_anim)
+                    # Only recycle once it's fully handled; completing may start a new swap
+                    self._swap_animation_pool.append(swap_anim)
+                # Completing a swap can set off a combo effect
+                fall_blocked = self.rocket_lightning_active or self.black_hole_active
         
         # Update fall animations (skip during rocket lightning and black hole)
-        if not self.rocket_lightning_active and not self.black_hole_active:
+        if not fall_blocked and self.fall_animations:
             completed_fall_animations = []
             # First pass: update animations and mark completed ones
             completed_new_tiles = []  # Store new tiles to place after removal
             
-            for fall_anim in self.fall_animations[:]:
+            # Hoisted for the per-animation loop; fall targets are always on the board
+            grid = self.board.grid
+            release_fall_animation = self._release_fall_animation
+            active_fall_animations = []
+            keep_fall_animation = active_fall_animations.append
+            for fall_anim in self.fall_animations:
                 if fall_anim.update(dt):
                     # ALL tiles (new and existing) - place on board immediately but delay removal
-                    if hasattr(fall_anim, 'tile') and hasattr(fall_anim, 'to_row') and hasattr(fall_anim, 'col'):
-                        self.board.set_tile(fall_anim.to_row, fall_anim.col, fall_anim.tile)
+                    tile = fall_anim.tile
+                    if tile is not None:
+                        grid[fall_anim.to_row][fall_anim.col] = tile
                     
                     # Add delay before removal for ALL tiles
-                    if not hasattr(fall_anim, 'completion_delay'):
+                    if fall_anim.completion_delay is None:
                         fall_anim.completion_delay = 0.05  # 50ms delay
-                        fall_anim.delay_elapsed = 0.0
                     
                     fall_anim.delay_elapsed += dt
                     if fall_anim.delay_elapsed >= fall_anim.completion_delay:
                         completed_fall_animations.append(fall_anim)
-                        self.fall_animations.remove(fall_anim)
+                        release_fall_animation(fall_anim)
+                        continue
+                keep_fall_animation(fall_anim)
+            self.fall_animations[:] = active_fall_animations
             
             # Check if all fall animations are complete and we need to check for new matches  
             if completed_fall_animations and not self.fall_animations:
@@ -2246,36 +2374,32 @@ class Match3Game:
                 self.complete_fall_animation()
         
         # Update pulse animations
-        for pulse_anim in self.pulse_animations[:]:
-            if pulse_anim.update(dt):
-                self.pulse_animations.remove(pulse_anim)
+        if self.pulse_animations:
+            self.pulse_animations[:] = [pulse_anim for pulse_anim in self.pulse_animations
+                                        if not pulse_anim.update(dt)]
         
         # Update physics eject animations (all special tile deletions)
-        for eject_anim in self.physics_eject_animations[:]:
-            if eject_anim.update(dt):
-                self.physics_eject_animations.remove(eject_anim)
+        if self.physics_eject_animations:
+            self.physics_eject_animations[:] = [eject_anim for eject_anim in self.physics_eject_animations
+                                                if not eject_anim.update(dt)]
         
         # Update board wipe charging animations
-        for charging_anim in self.board_wipe_charging_animations[:]:
+        charging_finished = False
+        for charging_anim in self.board_wipe_charging_animations:
             if charging_anim.update(dt):
-                # Animation completed, remove it
-                self.board_wipe_charging_animations.remove(charging_anim)
-            elif charging_anim.should_detonate() and not hasattr(charging_anim, 'activated'):
+                # Animation completed, dropped below
+                charging_finished = True
+            elif not charging_anim.activated and charging_anim.should_detonate():
                 # Time to detonate - activate the board wipe with target color
                 charging_anim.activated = True
                 
                 # Use the target color to find affected positions
                 target_color = charging_anim.target_color
-                positions_to_clear = []
                 
                 # Find all tiles with the target color
-                for r in range(charging_anim.board.height):
-                    for c in range(charging_anim.board.width):
-                        tile = charging_anim.board.get_tile(r, c)
-                        if tile and not tile.is_empty() and tile.color == target_color:
-                            positions_to_clear.append((r, c))
+                positions_to_clear = charging_anim.board.get_positions_with_color(target_color)
                 
-                print(f"Board wipe charging complete! Targeting {target_color.name} - will clear {len(positions_to_clear)} tiles")
+                logger.debug("Board wipe charging complete! Targeting %s - will clear %s tiles", target_color.name, len(positions_to_clear))
                 
                 # Clear the board wipe tile itself
                 charging_anim.board.grid[charging_anim.row][charging_anim.col] = None
@@ -2297,29 +2421,37 @@ class Match3Game:
                 
                 # Start fall animation to fill gaps
                 self.start_fall_animation()
+        if charging_finished:
+            self.board_wipe_charging_animations[:] = [charging_anim for charging_anim in self.board_wipe_charging_animations
+                                                      if not charging_anim.completed]
         
         # Update particle effects
-        for effect in self.particle_effects[:]:
-            effect.update(dt)
-            if effect.is_finished():
-                self.particle_effects.remove(effect)
+        if self.particle_effects:
+            alive = []
+            for effect in self.particle_effects:
+                effect.update(dt)
+                if effect.is_finished():
+                    self._particle_effect_pool.append(effect)
+                else:
+                    alive.append(effect)
+            self.particle_effects[:] = alive
         
         # Update pop animations
-        for pop_anim in self.pop_animations[:]:
-            if pop_anim.update(dt):
-                self.pop_animations.remove(pop_anim)
+        if self.pop_animations:
+            finished = self._step_animations(self.pop_animations, dt)
+            if finished:
+                self._release_pop_animations(self.pop_animations, self._pop_cells, finished)
         
         # If all pop animations are done and we have pending matches, clear them and start falling
-        if not self.pop_animations and hasattr(self, 'pending_matches') and self.pending_matches:
-            # Check for special tiles that will be created and trigger spawn animations
+        if not self.pop_animations and self.pending_matches:
+            # Clear matches (which creates special tiles), noting where special tiles appear
+            # so their spawn animations can start once every match is cleared. A match's
+            # special tile position depends only on the match, so one pass does both.
             special_tile_positions = []
             for match in self.pending_matches:
                 special_tile_pos = self.board.get_special_tile_position(match)
                 if special_tile_pos:
                     special_tile_positions.append(special_tile_pos)
-            
-            # Clear matches (which creates special tiles)
-            for match in self.pending_matches:
                 self.board.clear_matches(match)
             
             # Create spawn animations for special tiles
@@ -2330,32 +2462,31 @@ class Match3Game:
             self.start_fall_animation()
         
         # Update pop particles
-        for pop_particle in self.pop_particles[:]:
-            pop_particle.update(dt)
-            if pop_particle.is_finished():
-                self.pop_particles.remove(pop_particle)
+        if self.pop_particles:
+            self.pop_particles.update(dt)
         
         # Update spawn animations
-        for spawn_anim in self.spawn_animations[:]:
-            if spawn_anim.update(dt):
-                self.spawn_animations.remove(spawn_anim)
+        if self.spawn_animations:
+            finished = self._step_animations(self.spawn_animations, dt)
+            if finished:
+                self._release_spawn_animations(self.spawn_animations, self._spawn_cells, finished)
         
         # Update boss pop animations
-        for pop_anim in self.boss_pop_animations[:]:
-            if pop_anim.update(dt):
-                self.boss_pop_animations.remove(pop_anim)
+        if self.boss_pop_animations:
+            finished = self._step_animations(self.boss_pop_animations, dt)
+            if finished:
+                self._release_pop_animations(self.boss_pop_animations, self._boss_pop_cells, finished)
         
         # If all boss pop animations are done and we have pending matches, clear them and apply gravity
-        if not self.boss_pop_animations and hasattr(self, 'pending_boss_matches') and self.pending_boss_matches:
-            # Check for special tiles that will be created and trigger spawn animations
+        if not self.boss_pop_animations and self.pending_boss_matches:
+            # Clear matches (which creates special tiles), noting where special tiles appear
+            # so their spawn animations can start once every match is cleared. A match's
+            # special tile position depends only on the match, so one pass does both.
             special_tile_positions = []
             for match in self.pending_boss_matches:
                 special_tile_pos = self.boss_board.get_special_tile_position(match)
                 if special_tile_pos:
                     special_tile_positions.append(special_tile_pos)
-            
-            # Clear matches (which creates special tiles)
-            for match in self.pending_boss_matches:
                 self.boss_board.clear_matches(match)
             
             # Create spawn animations for special tiles
@@ -2366,40 +2497,50 @@ class Match3Game:
             self.apply_boss_board_gravity()
         
         # Update boss pop particles
-        for pop_particle in self.boss_pop_particles[:]:
-            pop_particle.update(dt)
-            if pop_particle.is_finished():
-                self.boss_pop_particles.remove(pop_particle)
+        if self.boss_pop_particles:
+            self.boss_pop_particles.update(dt)
         
         # Update boss spawn animations
-        for spawn_anim in self.boss_spawn_animations[:]:
-            if spawn_anim.update(dt):
-                self.boss_spawn_animations.remove(spawn_anim)
+        if self.boss_spawn_animations:
+            finished = self._step_animations(self.boss_spawn_animations, dt)
+            if finished:
+                self._release_spawn_animations(self.boss_spawn_animations, self._boss_spawn_cells, finished)
+        
+        # Update pixel particle system (skipped entirely when no effects are alive)
+        if self.pixel_particles.active:
+            self.pixel_particles.update(dt)
         
-        # Update pixel particle system
-        self.pixel_particles.update(dt)
+        # Player matches processed above may have started an effect, so read the flags again
+        fall_blocked = self.rocket_lightning_active or self.black_hole_active
+        swap_blocked = fall_blocked or self.reality_break_active or self.lightning_cross_active
         
         # Update boss swap animations
-        if (not self.rocket_lightning_active and not self.black_hole_active and 
-            not (hasattr(self, 'reality_break_active') and self.reality_break_active) and
-            not (hasattr(self, 'lightning_cross_active') and self.lightning_cross_active)):
-            for swap_anim in self.boss_swap_animations[:]:
-                if swap_anim.update(dt):
-                    # Animation completed
-                    self.boss_swap_animations.remove(swap_anim)
+        if not swap_blocked and self.boss_swap_animations:
+            finished = self._step_animations(self.boss_swap_animations, dt)
+            if finished:
+                for swap_anim in finished:
                     self.complete_boss_swap_animation(swap_anim)
+                    self._swap_animation_pool.append(swap_anim)
+                fall_blocked = self.rocket_lightning_active or self.black_hole_active
         
         # Update boss fall animations (simplified for performance)
-        if not self.rocket_lightning_active and not self.black_hole_active:
+        if not fall_blocked and self.boss_fall_animations:
             completed_count = 0
-            for fall_anim in self.boss_fall_animations[:]:
+            grid = self.boss_board.grid
+            fall_animation_pool = self._fall_animation_pool
+            active_fall_animations = []
+            for fall_anim in self.boss_fall_animations:
                 if fall_anim.update(dt):
                     # Animation completed - ensure tile is properly placed on boss board
-                    if hasattr(fall_anim, 'tile') and hasattr(fall_anim, 'to_row') and hasattr(fall_anim, 'col'):
-                        self.boss_board.set_tile(fall_anim.to_row, fall_anim.col, fall_anim.tile)
+                    tile = fall_anim.tile
+                    if tile is not None:
+                        grid[fall_anim.to_row][fall_anim.col] = tile
                     
-                    self.boss_fall_animations.remove(fall_anim)
+                    fall_animation_pool.append(fall_anim)
                     completed_count += 1
+                else:
+                    active_fall_animations.append(fall_anim)
+            self.boss_fall_animations[:] = active_fall_animations
             
             # Check if all boss fall animations are complete
             if completed_count > 0 and not self.boss_fall_animations:
@@ -2426,18 +2567,61 @@ class Match3Game:
             self.update_fireball_animation(dt)
         
         # Update smoke particles (always, so they persist after fireball ends)
-        for particle in self.fireball_smoke_particles[:]:
-            particle['life'] -= dt * 2.0
-            particle['y'] -= dt * 20  # Rise upward
-            particle['size'] = max(1, particle['size'] - dt * 3)
-            if particle['life'] <= 0:
-                self.fireball_smoke_particles.remove(particle)
+        if self.fireball_smoke_particles:
+            alive = []
+            for particle in self.fireball_smoke_particles:
+                particle['life'] -= dt * 2.0
+                particle['y'] -= dt * 20  # Rise upward
+                particle['size'] = max(1, particle['size'] - dt * 3)
+                if particle['life'] > 0:
+                    alive.append(particle)
+            self.fireball_smoke_particles[:] = alive
         
         # Explosion particles are now handled by self.pixel_particles system
         # which updates automatically in the main particle system
     
+    def get_idle_frame_key(self):
+        """Get a key for everything an idle frame shows, or None while anything on screen can change by itself"""
+        if (self.debug_mode or self.perk_gui.visible or
+                self.combo_active or self.screen_shake_duration > 0 or self.pixel_particles.active or
+                self.fireball_active or self.black_hole_active or self.bomb_boardwipe_active or
+                self.rocket_lightning_active or self.board_wipe_active or self.pending_matches or
+                self.reality_break_active or self.lightning_cross_active):
+            return None
+        if (self.fall_animations or self.swap_animations or self.pulse_animations or
+                self.particle_effects or self.pop_animations or self.pop_particles or
+                self.spawn_animations or self.plop_out_animations or self.physics_eject_animations or
+                self.progressive_rocket_animations or self.board_wipe_charging_animations or
+                self.fireball_smoke_particles):
+            return None
+        # Tiles are compared by identity; a changed cell always holds a different Tile object
+        grid_key = tuple(tuple(grid_row) for grid_row in self.board.grid)
+        if not self.level_config.dual_board:
+            return (self.score, self.selected_tile, grid_key)
+        
+        # The boss board only changes by itself while the AI thinks (pulsing indicator) or animates
+        if ((self.boss_ai and self.boss_ai.is_thinking()) or self.pending_boss_matches or
+                self.boss_bomb_boardwipe_active or self.boss_rocket_lightning_active or
+                self.boss_reality_break_active):
+            return None
+        if (self.boss_fall_animations or self.boss_swap_animations or self.boss_pop_animations or
+                self.boss_pop_particles or self.boss_spawn_animations):
+            return None
+        return (self.score, self.selected_tile, grid_key, tuple(tuple(grid_row) for grid_row in self.boss_board.grid))
+    
     def draw(self):
         """Draw the entire game"""
+        # Nothing is moving and nothing changed since the last presented frame: keep it on screen
+        # instead of redrawing and flipping an identical full-window image
+        idle_frame_key = self.get_idle_frame_key()
+        if idle_frame_key is not None and idle_frame_key == self._last_idle_frame_key:
+            return
+        self._last_idle_frame_key = idle_frame_key
+        
+        # Background color and board borders; drawn before the board positions are shifted,
+        # since draw_background applies the shake offset to its cached layer itself
+        self.draw_background()
+        
         # Apply screen shake offset by temporarily adjusting board position
         original_board_x = self.board_x
         original_board_y = self.board_y
@@ -2449,19 +2633,14 @@ class Match3Game:
         self.boss_board_x += int(self.screen_offset_x)
         self.boss_board_y += int(self.screen_offset_y)
         
-        self.screen.fill(BACKGROUND_COLOR)
-        
         if self.level_config.dual_board:
             # Draw dual board layout
             self.draw_dual_boards()
         else:
             # Draw single board layout
-            # Draw the border behind everything if available
-            self.draw_border()
             # Set up clipping area for the game board
-            board_area = pygame.Rect(self.board_x, self.board_y, 
-                                    self.board_width * self.tile_size, 
-                                    self.board_height * self.tile_size)
+            board_area = self._board_clip_rect
+            board_area.topleft = (self.board_x, self.board_y)
             
             # Draw the board with clipping
             old_clip = self.screen.get_clip()
@@ -2470,7 +2649,8 @@ class Match3Game:
             self.screen.set_clip(old_clip)
         
         # Draw particle effects (affected by shake)
-        self.pixel_particles.draw(self.screen)
+        if self.pixel_particles.active:
+            self.pixel_particles.draw(self.screen)
         
         # Restore original board positions
         self.board_x = original_board_x
@@ -2490,8 +2670,37 @@ class Match3Game:
         
         pygame.display.flip()
     
-    def draw_border(self):
-        """Draw the border around the game area"""
+    def draw_background(self):
+        """Fill the background and draw the board borders by blitting a cached copy, shifted while the screen shakes"""
+        if self._static_background is None:
+            # Render the static layer once per level
+            self._static_background = pygame.Surface(self.screen.get_size()).convert()
+            self._static_background.fill(BACKGROUND_COLOR)
+            if self.level_config.dual_board:
+                self.draw_dual_borders(self._static_background)
+            else:
+                self.draw_border(self._static_background)
+        
+        # Borders move with the shake, which is the whole layer shifted by the same offset;
+        # only the strips it uncovers at the screen edges still need the plain background
+        offset_x = int(self.screen_offset_x)
+        offset_y = int(self.screen_offset_y)
+        self.screen.blit(self._static_background, (offset_x, offset_y))
+        if offset_x or offset_y:
+            width, height = self.screen.get_size()
+            if offset_x > 0:
+                self.screen.fill(BACKGROUND_COLOR, (0, 0, offset_x, height))
+            elif offset_x < 0:
+                self.screen.fill(BACKGROUND_COLOR, (width + offset_x, 0, -offset_x, height))
+            if offset_y > 0:
+                self.screen.fill(BACKGROUND_COLOR, (0, 0, width, offset_y))
+            elif offset_y < 0:
+                self.screen.fill(BACKGROUND_COLOR, (0, height + offset_y, width, -offset_y))
+    
+    def draw_border(self, surface=None):
+        """Draw the border around the game area (onto the screen unless another surface is given)"""
+        if surface is None:
+            surface = self.screen
         if self.sprite_manager.has_border_sprite():
             # Calculate border dimensions (much larger than board area)
             border_padding = 120  # Extra space around the board
@@ -2503,20 +2712,43 @@ class Match3Game:
                 # Center the border around the board
                 border_x = self.board_x - border_padding
                 border_y = self.board_y - border_padding
-                self.screen.blit(border_sprite, (border_x, border_y))
+                surface.blit(border_sprite, (border_x, border_y))
     
     def draw_board(self):
         """Draw the game board and tiles"""
         # Skip drawing normal tiles during black hole animation
         if not (self.black_hole_active and self.black_hole_phase == 'condensing'):
-            # Draw static tiles (not involved in animations)
+            # Draw static tiles (not involved in animations). Plain sprite tiles are
+            # collected and sent to the screen in one blits() call; anything else is
+            # drawn individually after flushing the batch so draw order is unchanged.
+            # Hoisted out of the W×H loop; the black hole check in is_tile_animating is
+            # already false here, so animating means swapping or falling
+            swapping_cells = self._swapping_cells
+            falling_cells = self._falling_cells
+            get_static_tile_blit = self.get_static_tile_blit
+            draw_tile_at_position = self.draw_tile_at_position
+            blits = self.screen.blits
+            blit_batch = []
+            append_blit = blit_batch.append
             for row in range(self.board_height):
                 for col in range(self.board_width):
                     # Skip tiles that are currently animating
-                    if self.is_tile_animating(row, col):
+                    cell = (row, col)
+                    if cell in swapping_cells or cell in falling_cells:
+                        continue
+                    
+                    blit = get_static_tile_blit(row, col)
+                    if blit is not None:
+                        append_blit(blit)
                         continue
                     
-                    self.draw_tile_at_position(row, col, row, col)
+                    if blit_batch:
+                        blits(blit_batch, doreturn=False)
+                        blit_batch.clear()
+                    draw_tile_at_position(row, col, row, col)
+            
+            if blit_batch:
+                blits(blit_batch, doreturn=False)
         
         # Draw falling tiles (skip during black hole)
         if not self.black_hole_active:
@@ -2529,8 +2761,8 @@ class Match3Game:
         if not self.black_hole_active:
             for swap_anim in self.swap_animations:
                 # Use the original tiles stored in the animation (before any swap)
-                tile1 = getattr(swap_anim, 'original_tile1', self.board.get_tile(*swap_anim.tile_pos1))
-                tile2 = getattr(swap_anim, 'original_tile2', self.board.get_tile(*swap_anim.tile_pos2))
+                tile1 = swap_anim.original_tile1
+                tile2 = swap_anim.original_tile2
                 
                 if tile1:
                     self.draw_animated_tile_at_screen_pos(tile1, swap_anim.current_pos1)
@@ -2539,17 +2771,33 @@ class Match3Game:
         
         # Draw black hole condensing tiles
         if self.black_hole_active and self.black_hole_phase == 'condensing':
-            for (row, col), tile_data in self.original_tile_positions.items():
-                # Calculate scale based on distance to center and animation progress
-                distance_to_center = ((tile_data['current_x'] - self.black_hole_center_x) ** 2 + 
-                                    (tile_data['current_y'] - self.black_hole_center_y) ** 2) ** 0.5
-                max_distance = 300  # Approximate max distance from center
-                # Scale based on distance: far away = full size (1.0), close to center = tiny (0.1)
-                distance_factor = min(1.0, distance_to_center / max_distance)
-                scale = max(0.1, 0.1 + distance_factor * 0.9)  # Scale from 0.1 to 1.0 based on distance
+            # Scales are updated alongside the positions, shrinking tiles as they near the center.
+            # Sprite tiles are sent to the screen in one blits() call; a tile without a sprite
+            # flushes the batch and draws its fallback through draw_black_hole_tile, keeping order.
+            tile_size = self.tile_size
+            blits = self.screen.blits
+            blit_batch = []
+            for tile, current_x, current_y, scale in zip(self.black_hole_tiles, self.black_hole_current_x,
+                                                         self.black_hole_current_y, self.black_hole_scales):
+                if not tile or tile.is_empty():
+                    continue
+                scaled_size = int(tile_size * scale)
+                if scaled_size <= 0:
+                    continue
                 
                 # Draw tile at current animated position with scaling
-                self.draw_black_hole_tile(tile_data['tile'], tile_data['current_x'], tile_data['current_y'], scale)
+                sprite_surface = self.get_black_hole_tile_sprite(tile, scaled_size)
+                if sprite_surface:
+                    blit_batch.append((sprite_surface, sprite_surface.get_rect(center=(current_x, current_y))))
+                    continue
+                
+                if blit_batch:
+                    blits(blit_batch, doreturn=False)
+                    blit_batch.clear()
+                self.draw_black_hole_tile(tile, current_x, current_y, scale)
+            
+            if blit_batch:
+                blits(blit_batch, doreturn=False)
         
         # Draw physics eject animations (all special tile deletions now use this)
         for eject_anim in self.physics_eject_animations:
@@ -2605,6 +2853,30 @@ class Match3Game:
             pygame.draw.rect(self.screen, tile.color.value if hasattr(tile.color, 'value') else (128, 0, 128), 
                            fallback_rect)
     
+    def get_symbol_surface(self, symbol, font_size, symbol_color):
+        """Get the rendered text symbol for a special tile without a sprite, cached by size and color"""
+        key = (symbol, font_size, symbol_color)
+        symbol_surface = self._symbol_cache.get(key)
+        if symbol_surface is None:
+            font = self._symbol_fonts.get(font_size)
+            if font is None:
+                font = self._symbol_fonts[font_size] = pygame.font.Font(None, font_size)
+            symbol_surface = self._symbol_cache[key] = font.render(symbol, True, symbol_color)
+        return symbol_surface
+    
+    def get_black_hole_tile_sprite(self, tile, scaled_size):
+        """Get the scaled sprite for a condensing tile, or None if it has no sprite"""
+        if tile.is_special():
+            # For special tiles, try to get their sprite
+            visual_data = tile.special_tile.get_visual_representation()
+            sprite_type = visual_data.get('sprite_type')
+            if sprite_type and self.sprite_manager.has_special_sprite(sprite_type):
+                return self.sprite_manager.get_special_sprite(sprite_type, scaled_size)
+        
+        # If no special sprite, use regular tile sprite
+        # Use the sprite manager for proper caching instead of loading directly
+        return self.sprite_manager.get_tile_sprite(tile.color, scaled_size)
+    
     def draw_black_hole_tile(self, tile, center_x, center_y, scale):
         """Draw a tile during black hole condensation with scaling using actual tile sprites"""
         if not tile or tile.is_empty():
@@ -2615,22 +2887,9 @@ class Match3Game:
         if scaled_size <= 0:
             return
             
-        from board import TileColor
             
         # Get the appropriate sprite for this tile
-        sprite_surface = None
-        
-        if tile.is_special():
-            # For special tiles, try to get their sprite
-            visual_data = tile.special_tile.get_visual_representation()
-            sprite_type = visual_data.get('sprite_type')
-            if sprite_type and self.sprite_manager.has_special_sprite(sprite_type):
-                sprite_surface = self.sprite_manager.get_special_sprite(sprite_type, scaled_size)
-        
-        # If no special sprite, use regular tile sprite
-        if sprite_surface is None:
-            # Use the sprite manager for proper caching instead of loading directly
-            sprite_surface = self.sprite_manager.get_tile_sprite(tile.color, scaled_size)
+        sprite_surface = self.get_black_hole_tile_sprite(tile, scaled_size)
         
         # Draw the sprite centered at the current position
         if sprite_surface:
@@ -2638,7 +2897,7 @@ class Match3Game:
             self.screen.blit(sprite_surface, sprite_rect)
         else:
             # Ultimate fallback - draw colored rectangle
-            print(f"No sprite available for tile {tile.color}, using colored rectangle")
+            logger.debug("No sprite available for tile %s, using colored rectangle", tile.color)
             rect = pygame.Rect(center_x - scaled_size // 2, center_y - scaled_size // 2, scaled_size, scaled_size)
             pygame.draw.rect(self.screen, tile.color.value, rect)
     
@@ -2649,30 +2908,19 @@ class Match3Game:
             return True
             
         # Check if involved in swap animation
-        for swap_anim in self.swap_animations:
-            if (row, col) in [swap_anim.tile_pos1, swap_anim.tile_pos2]:
-                return True
+        if (row, col) in self._swapping_cells:
+            return True
         
         # Check if this specific position is actually falling (not just in a column with falling tiles)
         return self.is_position_actually_falling(row, col)
     
     def is_column_affected_by_falling(self, col, max_row=None):
         """Check if a column (or specific row in column) is affected by falling tiles"""
-        for fall_anim in self.fall_animations:
-            if fall_anim.col == col:
-                if max_row is None:
-                    return True
-                # Check if there's a tile that originally came from this position OR is falling to this position
-                # This handles both existing tiles moving and new tiles falling
-                if hasattr(fall_anim, 'from_row'):
-                    # Existing tile moving from one position to another
-                    if fall_anim.from_row == max_row or fall_anim.to_row == max_row:
-                        return True
-                else:
-                    # New tile falling to a position (no from_row)
-                    if fall_anim.to_row == max_row:
-                        return True
-        return False
+        if max_row is None:
+            return any(fall_anim.col == col for fall_anim in self.fall_animations)
+        # A tile that originally came from this position OR is falling to this position
+        # (both existing tiles moving and new tiles falling) is recorded in the cell index
+        return (max_row, col) in self._falling_cells
     
     def is_tile_swappable(self, row, col):
         """Check if a tile can be swapped (more restrictive than is_tile_animating for swap prevention)"""
@@ -2681,44 +2929,166 @@ class Match3Game:
             return False
             
         # Check if involved in swap animation
-        for swap_anim in self.swap_animations:
-            if (row, col) in [swap_anim.tile_pos1, swap_anim.tile_pos2]:
-                return False
+        if (row, col) in self._swapping_cells:
+            return False
         
         # Check if this position or column is affected by falling tiles (more restrictive for swaps)
         return not self.is_column_affected_by_falling(col, row)
     
     def is_position_actually_falling(self, row, col):
         """Check if a specific position is actually involved in a falling animation"""
-        for fall_anim in self.fall_animations:
-            if fall_anim.col == col:
-                if hasattr(fall_anim, 'from_row'):
-                    # Existing tile moving - check if this is the source or destination
-                    if fall_anim.from_row == row or fall_anim.to_row == row:
-                        return True
-                else:
-                    # New tile falling - check if this is the destination
-                    if fall_anim.to_row == row:
-                        return True
-        return False
+        return (row, col) in self._falling_cells
+    
+    def _get_fall_animation_cells(self, fall_anim):
+        """Get the board cells a fall animation occupies (source and destination)"""
+        cells = {(fall_anim.to_row, fall_anim.col)}
+        if fall_anim.from_row is not None:
+            # Existing tile moving - the source cell is affected too
+            cells.add((fall_anim.from_row, fall_anim.col))
+        return cells
+    
+    def _add_fall_animation(self, fall_anim):
+        """Start tracking a fall animation and index the cells it touches"""
+        self.fall_animations.append(fall_anim)
+        for cell in self._get_fall_animation_cells(fall_anim):
+            self._falling_cells[cell] = self._falling_cells.get(cell, 0) + 1
+    
+    def _release_fall_animation(self, fall_anim):
+        """Release a finished fall animation's indexed cells and pool it (the caller drops it from fall_animations)"""
+        for cell in self._get_fall_animation_cells(fall_anim):
+            remaining = self._falling_cells[cell] - 1
+            if remaining:
+                self._falling_cells[cell] = remaining
+            else:
+                del self._falling_cells[cell]
+        self._fall_animation_pool.append(fall_anim)
+    
+    def _clear_fall_animations(self):
+        """Drop all fall animations along with the cell index"""
+        self._fall_animation_pool.extend(self.fall_animations)
+        self.fall_animations.clear()
+        self._falling_cells.clear()
+    
+    def _step_animations(self, animations, dt):
+        """Update each animation once, keep the running ones in the list and return the finished ones"""
+        finished = []
+        running = []
+        for anim in animations:
+            if anim.update(dt):
+                finished.append(anim)
+            else:
+                running.append(anim)
+        if finished:
+            animations[:] = running
+        return finished
+    
+    def _add_pop_animation(self, pop_animations, pop_cells, pop_anim):
+        """Start tracking a pop animation and index its tiles; earlier animations keep shared cells"""
+        pop_animations.append(pop_anim)
+        for i, cell in enumerate(pop_anim.cells):
+            pop_cells.setdefault(cell, (pop_anim, i))
+    
+    def _release_pop_animations(self, pop_animations, pop_cells, finished):
+        """Unindex finished pop animations (already dropped from pop_animations), handing their cells to
+        the next animation covering them"""
+        released = False
+        for pop_anim in finished:
+            for cell in pop_anim.cells:
+                entry = pop_cells.get(cell)
+                if entry is not None and entry[0] is pop_anim:
+                    del pop_cells[cell]
+                    released = True
+        if released:
+            for other in pop_animations:
+                for i, cell in enumerate(other.cells):
+                    pop_cells.setdefault(cell, (other, i))
+    
+    def _release_spawn_animations(self, spawn_animations, spawn_cells, finished):
+        """Unindex finished spawn animations (already dropped from spawn_animations), handing their
+        cells to the next spawn animation there"""
+        for spawn_anim in finished:
+            cell = (spawn_anim.row, spawn_anim.col)
+            if spawn_cells.get(cell) is spawn_anim:
+                del spawn_cells[cell]
+                for other in spawn_animations:
+                    if (other.row, other.col) == cell:
+                        spawn_cells[cell] = other
+                        break
+    
+    def _add_swap_animation(self, swap_anim):
+        """Start tracking a swap animation and index both of its cells"""
+        self.swap_animations.append(swap_anim)
+        for cell in (swap_anim.tile_pos1, swap_anim.tile_pos2):
+            self._swapping_cells[cell] = self._swapping_cells.get(cell, 0) + 1
+    
+    def _release_swap_animation(self, swap_anim):
+        """Release a finished swap animation's indexed cells (the caller drops it from swap_animations)"""
+        for cell in (swap_anim.tile_pos1, swap_anim.tile_pos2):
+            remaining = self._swapping_cells[cell] - 1
+            if remaining:
+                self._swapping_cells[cell] = remaining
+            else:
+                del self._swapping_cells[cell]
+    
+    def get_static_tile_blit(self, row, col):
+        """Get an (atlas, position, source_rect) blit for a resting full-size tile, or None if it needs draw_tile_at_position"""
+        cell = (row, col)
+        if self.selected_tile == cell or cell in self._pop_cells:
+            return None
+        spawn_anim = self._spawn_cells.get(cell)
+        if spawn_anim is not None and spawn_anim.get_scale() != 1.0:
+            return None
+        
+        tile = self.board.grid[row][col]
+        if not tile:
+            return None
+        
+        # Same placement as draw_tile_at_position at scale 1.0
+        x = self.board_x + self._col_x[col]
+        y = self.board_y + self._row_y[row]
+        tile_size_with_spacing = self._tile_inner_size
+        
+        if tile.is_special():
+            sprite_type = tile.special_tile.get_visual_representation().get('sprite_type')
+            if not sprite_type:
+                return None
+            atlas_entry = self.sprite_manager.get_tile_from_atlas(sprite_type, tile_size_with_spacing)
+            if atlas_entry is None:
+                return None
+            return (atlas_entry[0], (x, y), atlas_entry[1])
+        
+        atlas_entry = self.sprite_manager.get_tile_from_atlas(tile.color, tile_size_with_spacing)
+        if atlas_entry is None:
+            return None
+        # Sprite is 5 pixels bigger than tile, so center it by offsetting by -2
+        return (atlas_entry[0], (x - 2, y - 2), atlas_entry[1])
     
     def draw_tile_at_position(self, tile_row, tile_col, draw_row, draw_col):
         """Draw a tile at a specific board position"""
-        # Check for pop animation scaling
-        scale = self.get_pop_animation_scale(tile_row, tile_col)
+        # Check for pop animation scaling; one index lookup gives both the scale and the popping tile
+        cell = (tile_row, tile_col)
+        pop_entry = self._pop_cells.get(cell)
+        if pop_entry is None:
+            scale = 1.0
+            tile = None
+        else:
+            pop_anim, i = pop_entry
+            scale = pop_anim.scale
+            tile = pop_anim.tile_data[i]
         
         # Also check for spawn animation scaling (spawn takes priority if both exist)
-        spawn_scale = self.get_spawn_animation_scale(tile_row, tile_col)
-        if spawn_scale != 1.0:
-            scale = spawn_scale
+        spawn_anim = self._spawn_cells.get(cell)
+        if spawn_anim is not None:
+            spawn_scale = spawn_anim.get_scale()
+            if spawn_scale != 1.0:
+                scale = spawn_scale
         
         # Calculate tile position with spacing
-        spacing = 2  # Small gap between tiles
-        base_x = self.board_x + draw_col * self.tile_size + spacing
-        base_y = self.board_y + draw_row * self.tile_size + spacing
+        base_x = self.board_x + self._col_x[draw_col]
+        base_y = self.board_y + self._row_y[draw_row]
         
         # Apply scaling for pop animation
-        tile_size_with_spacing = self.tile_size - (spacing * 2)
+        tile_size_with_spacing = self._tile_inner_size
         scaled_size = int(tile_size_with_spacing * scale)
         
         # Center the scaled tile
@@ -2732,8 +3102,7 @@ class Match3Game:
             
         tile_rect = pygame.Rect(x, y, scaled_size, scaled_size)
         
-        # Get tile color - check if it's animating first
-        tile = self.get_pop_animation_tile(tile_row, tile_col)
+        # Get tile color - the popping tile (looked up above) takes priority over the board
         if tile is None:
             tile = self.board.get_tile(tile_row, tile_col)
         if tile:
@@ -2750,7 +3119,7 @@ class Match3Game:
                 else:
                     # Fallback to text rendering
                     bg_color = visual_data.get('background_color', tile.color.value)
-                    self.draw_rounded_rect(self.screen, bg_color, tile_rect, 8)
+                    pygame.draw.rect(self.screen, bg_color, tile_rect)
                     
                     # Draw special tile symbol
                     symbol = visual_data.get('symbol', '?')
@@ -2758,8 +3127,7 @@ class Match3Game:
                     
                     # Create font for symbol - make it bigger and bolder
                     font_size = max(scaled_size // 2, 12)  # Bigger font, scaled
-                    font = pygame.font.Font(None, font_size)
-                    symbol_surface = font.render(symbol, True, symbol_color)
+                    symbol_surface = self.get_symbol_surface(symbol, font_size, symbol_color)
                     
                     # Center the symbol
                     symbol_rect = symbol_surface.get_rect(center=(x + scaled_size // 2, y + scaled_size // 2))
@@ -2779,12 +3147,12 @@ class Match3Game:
                 else:
                     # Fallback to colored rectangle
                     color = tile.color.value
-                    self.draw_rounded_rect(self.screen, color, tile_rect, 8)
+                    pygame.draw.rect(self.screen, color, tile_rect)
         else:
             # Don't render anything for empty tiles during special effects
-            if not self.rocket_lightning_active and not getattr(self, 'reality_break_active', False):
+            if not self.rocket_lightning_active and not self.reality_break_active:
                 color = TileColor.EMPTY.value
-                self.draw_rounded_rect(self.screen, color, tile_rect, 8)
+                pygame.draw.rect(self.screen, color, tile_rect)
         
         # Highlight selected tile
         if self.selected_tile == (tile_row, tile_col):
@@ -2792,18 +3160,15 @@ class Match3Game:
         
         # Dim tiles that are currently animating (can't be selected)
         if self.is_tile_animating(tile_row, tile_col):
-            dim_overlay = pygame.Surface((self.tile_size, self.tile_size))
-            dim_overlay.set_alpha(100)
-            dim_overlay.fill((0, 0, 0))
-            self.screen.blit(dim_overlay, (x, y))
+            self.screen.blit(self._dim_overlay, (x, y))
     
     def draw_animated_tile(self, tile, col, row_float):
         """Draw a tile at a floating-point row position"""
         spacing = 2  # Small gap between tiles
-        x = self.board_x + col * self.tile_size + spacing
+        x = self.board_x + self._col_x[col]
         y = self.board_y + row_float * self.tile_size + spacing
         
-        tile_size_with_spacing = self.tile_size - (spacing * 2)
+        tile_size_with_spacing = self._tile_inner_size
         tile_rect = pygame.Rect(x, y, tile_size_with_spacing, tile_size_with_spacing)
         
         if tile:
@@ -2818,15 +3183,14 @@ class Match3Game:
                 else:
                     # Fallback to text rendering
                     bg_color = visual_data.get('background_color', tile.color.value)
-                    self.draw_rounded_rect(self.screen, bg_color, tile_rect, 8)
+                    pygame.draw.rect(self.screen, bg_color, tile_rect)
                     
                     # Draw special tile symbol
                     symbol = visual_data.get('symbol', '?')
                     symbol_color = visual_data.get('color', (255, 255, 255))
                     
                     font_size = max(tile_size_with_spacing // 2, 24)  # Bigger font
-                    font = pygame.font.Font(None, font_size)
-                    symbol_surface = font.render(symbol, True, symbol_color)
+                    symbol_surface = self.get_symbol_surface(symbol, font_size, symbol_color)
                     
                     symbol_rect = symbol_surface.get_rect(center=(x + tile_size_with_spacing // 2, y + tile_size_with_spacing // 2))
                     self.screen.blit(symbol_surface, symbol_rect)
@@ -2843,7 +3207,7 @@ class Match3Game:
                     self.screen.blit(sprite, (sprite_x, sprite_y))
                 else:
                     color = tile.color.value
-                    self.draw_rounded_rect(self.screen, color, tile_rect, 8)
+                    pygame.draw.rect(self.screen, color, tile_rect)
     
     def draw_animated_tile_at_screen_pos(self, tile, screen_pos):
         """Draw a tile at a specific screen position"""
@@ -2855,7 +3219,7 @@ class Match3Game:
         # Apply spacing to animated tiles too
         x += spacing
         y += spacing
-        tile_size_with_spacing = self.tile_size - (spacing * 2)
+        tile_size_with_spacing = self._tile_inner_size
         tile_rect = pygame.Rect(x, y, tile_size_with_spacing, tile_size_with_spacing)
         
         if tile:
@@ -2871,15 +3235,14 @@ class Match3Game:
                 else:
                     # Fallback to text rendering
                     bg_color = visual_data.get('background_color', tile.color.value)
-                    self.draw_rounded_rect(self.screen, bg_color, tile_rect, 8)
+                    pygame.draw.rect(self.screen, bg_color, tile_rect)
                     
                     # Draw special tile symbol
                     symbol = visual_data.get('symbol', '?')
                     symbol_color = visual_data.get('color', (255, 255, 255))
                     
                     font_size = max(tile_size_with_spacing // 2, 24)  # Bigger font
-                    font = pygame.font.Font(None, font_size)
-                    symbol_surface = font.render(symbol, True, symbol_color)
+                    symbol_surface = self.get_symbol_surface(symbol, font_size, symbol_color)
                     
                     symbol_rect = symbol_surface.get_rect(center=(x + tile_size_with_spacing // 2, y + tile_size_with_spacing // 2))
                     self.screen.blit(symbol_surface, symbol_rect)
@@ -2896,13 +3259,7 @@ class Match3Game:
                     self.screen.blit(sprite, (sprite_x, sprite_y))
                 else:
                     color = tile.color.value
-                    self.draw_rounded_rect(self.screen, color, tile_rect, 8)
-    
-    def draw_rounded_rect(self, surface, color, rect, radius):
-        """Draw a rounded rectangle"""
-        # Simple implementation - draw rectangle with rounded corners
-        pygame.draw.rect(surface, color, rect)
-        # Could add actual rounded corner implementation here for better visuals
+                    pygame.draw.rect(self.screen, color, tile_rect)
     
     def draw_plop_out_tile(self, tile, screen_pos, scale, alpha):
         """Draw a tile with plop-out animation (scale up and fade out)"""
@@ -2979,7 +3336,7 @@ class Match3Game:
         self.physics_eject_animations.append(eject_anim)
     
     def activate_special_tile_with_animation(self, row, col, board=None):
-        """Activate a special tile with plop-out animations for affected tiles"""
+        """Activate a special tile with plop-out animations for affected tiles, returning (affected_positions, activated_tiles)"""
         if board is None:
             board = self.board
             
@@ -3049,8 +3406,10 @@ class Match3Game:
         # Don't activate immediately - let animation handle it
         return [], []
     
-    def draw_dual_borders(self):
-        """Draw borders around both boards in dual mode"""
+    def draw_dual_borders(self, surface=None):
+        """Draw borders around both boards in dual mode (onto the screen unless another surface is given)"""
+        if surface is None:
+            surface = self.screen
         if self.sprite_manager.has_border_sprite():
             border_padding = 120  # Extra space around each board
             border_width = self.board_width * self.tile_size + (border_padding * 2)
@@ -3061,22 +3420,18 @@ class Match3Game:
                 # Player board border (left)
                 player_border_x = self.board_x - border_padding
                 player_border_y = self.board_y - border_padding
-                self.screen.blit(border_sprite, (player_border_x, player_border_y))
+                surface.blit(border_sprite, (player_border_x, player_border_y))
                 
                 # Boss board border (right)
                 boss_border_x = self.boss_board_x - border_padding
                 boss_border_y = self.boss_board_y - border_padding
-                self.screen.blit(border_sprite, (boss_border_x, boss_border_y))
+                surface.blit(border_sprite, (boss_border_x, boss_border_y))
 
     def draw_dual_boards(self):
         """Draw both player and boss boards side by side"""
-        # Draw borders for both boards
-        self.draw_dual_borders()
-        
         # Draw player board (left side)
-        player_board_area = pygame.Rect(self.board_x, self.board_y, 
-                                      self.board_width * self.tile_size, 
-                                      self.board_height * self.tile_size)
+        player_board_area = self._board_clip_rect
+        player_board_area.topleft = (self.board_x, self.board_y)
         
         old_clip = self.screen.get_clip()
         self.screen.set_clip(player_board_area)
@@ -3085,17 +3440,16 @@ class Match3Game:
         
         # Draw boss board (right side)
         if self.boss_board:
-            boss_board_area = pygame.Rect(self.boss_board_x, self.boss_board_y, 
-                                        self.board_width * self.tile_size, 
-                                        self.board_height * self.tile_size)
+            boss_board_area = self._boss_board_clip_rect
+            boss_board_area.topleft = (self.boss_board_x, self.boss_board_y)
             
             self.screen.set_clip(boss_board_area)
             self.draw_boss_board()
             self.screen.set_clip(old_clip)
         
         # Draw labels
-        player_label = self.font.render("PLAYER", True, (255, 255, 255))
-        boss_label = self.font.render("BOSS", True, (255, 100, 100))
+        player_label = self._player_label
+        boss_label = self._boss_label
         
         # Position labels above the boards
         player_label_x = self.board_x + (self.board_width * self.tile_size - player_label.get_width()) // 2
@@ -3107,59 +3461,141 @@ class Match3Game:
     
     def draw_boss_board(self):
         """Draw the boss board with animations"""
-        # Draw static tiles (not involved in animations)
-        for row in range(self.boss_board.height):
-            for col in range(self.boss_board.width):
-                # Skip tiles that are currently animating
-                if self.is_boss_tile_animating(row, col):
-                    continue
+        blits = self.screen.blits
+        
+        # While nothing on the boss board moves (typically while the AI thinks) its resting tiles
+        # come out the same every frame, so the last still frame's blit list is sent again as is
+        static_key = None
+        if not (self.boss_fall_animations or self.boss_swap_animations or
+                self._boss_pop_cells or self._boss_spawn_cells):
+            # Tiles are compared by identity; a changed cell always holds a different Tile object
+            static_key = (self.boss_board_x, self.boss_board_y,
+                          tuple(tuple(grid_row) for grid_row in self.boss_board.grid))
+            if static_key == self._boss_static_blits_key:
+                blits(self._boss_static_blits, doreturn=False)
                 
-                tile = self.boss_board.get_tile(row, col)
-                if tile:
-                    self.draw_boss_tile_at_position(row, col, tile)
+                # Draw AI thinking indicator
+                if self.boss_ai and self.boss_ai.is_thinking():
+                    self.draw_thinking_indicator()
+                return
         
-        # Draw falling tiles on boss board
+        # Draw static tiles (not involved in animations), batching plain sprite tiles
+        # into blits() calls the same way draw_board does
+        animating_cells = self.get_boss_animating_cells()
+        get_boss_static_tile_blit = self.get_boss_static_tile_blit
+        draw_boss_tile_at_position = self.draw_boss_tile_at_position
+        blit_batch = []
+        append_blit = blit_batch.append
+        all_batched = True
+        for row, grid_row in enumerate(self.boss_board.grid):
+            for col, tile in enumerate(grid_row):
+                # Skip empty cells and tiles that are currently animating
+                if not tile or (row, col) in animating_cells:
+                    continue
+                
+                blit = get_boss_static_tile_blit(row, col, tile)
+                if blit is not None:
+                    append_blit(blit)
+                    continue
+                
+                if blit_batch:
+                    blits(blit_batch, doreturn=False)
+                    blit_batch.clear()
+                draw_boss_tile_at_position(row, col, tile)
+                all_batched = False
+        
+        # A still board has no moving tiles, so this batch is the whole frame's tile blits
+        if static_key is not None and all_batched:
+            self._boss_static_blits = blit_batch
+            self._boss_static_blits_key = static_key
+        
+        # Falling then swapping tiles, gathered as (tile, screen center) in draw order
+        moving_tiles = []
+        tile_size = self.tile_size
+        half_tile = tile_size // 2
         for fall_anim in self.boss_fall_animations:
             # Calculate current position accounting for tile center offset
-            current_row = (fall_anim.current_y - self.boss_board_y - self.tile_size // 2) / self.tile_size
-            self.draw_boss_animated_tile(fall_anim.tile, fall_anim.col, current_row)
-        
-        # Draw swapping tiles on boss board
+            current_row = (fall_anim.current_y - self.boss_board_y - half_tile) / tile_size
+            moving_tiles.append((fall_anim.tile, (self.boss_board_x + self._col_center_x[fall_anim.col],
+                                                  self.boss_board_y + current_row * tile_size + half_tile)))
         for swap_anim in self.boss_swap_animations:
             # Always use the original tiles stored in the animation
-            tile1 = swap_anim.original_tile1
-            tile2 = swap_anim.original_tile2
+            if swap_anim.original_tile1:
+                moving_tiles.append((swap_anim.original_tile1, swap_anim.current_pos1))
+            if swap_anim.original_tile2:
+                moving_tiles.append((swap_anim.original_tile2, swap_anim.current_pos2))
+        
+        # Batched like the static tiles; anything without a plain sprite flushes the batch
+        # and goes through draw_boss_animated_tile_at_screen_pos
+        for tile, screen_pos in moving_tiles:
+            blit = self.get_boss_animated_tile_blit(tile, screen_pos)
+            if blit is not None:
+                append_blit(blit)
+                continue
             
-            if tile1:
-                self.draw_boss_animated_tile_at_screen_pos(tile1, swap_anim.current_pos1)
-            if tile2:
-                self.draw_boss_animated_tile_at_screen_pos(tile2, swap_anim.current_pos2)
+            if blit_batch:
+                blits(blit_batch, doreturn=False)
+                blit_batch.clear()
+            self.draw_boss_animated_tile_at_screen_pos(tile, screen_pos)
+        
+        if blit_batch:
+            blits(blit_batch, doreturn=False)
         
         # Draw AI thinking indicator
         if self.boss_ai and self.boss_ai.is_thinking():
             self.draw_thinking_indicator()
     
+    def get_boss_static_tile_blit(self, row, col, tile):
+        """Get an (atlas, position, source_rect) blit for a resting boss tile, or None if it needs draw_boss_tile_at_position"""
+        cell = (row, col)
+        if cell in self._boss_pop_cells:
+            return None
+        spawn_anim = self._boss_spawn_cells.get(cell)
+        if spawn_anim is not None and spawn_anim.get_scale() != 1.0:
+            return None
+        
+        if tile.special_tile:
+            key = tile.special_tile.get_visual_representation().get('sprite_type', 'lightning')
+        else:
+            key = tile.color
+        atlas_entry = self.sprite_manager.get_tile_from_atlas(key, self.tile_size)
+        if atlas_entry is None:
+            return None
+        
+        # Same placement as draw_boss_tile_at_position at scale 1.0: sprite centered on the cell
+        source_rect = atlas_entry[1]
+        x = self.boss_board_x + self._col_center_x[col] - source_rect.width // 2
+        y = self.boss_board_y + self._row_center_y[row] - source_rect.height // 2
+        return (atlas_entry[0], (x, y), source_rect)
+    
     def draw_boss_tile_at_position(self, row, col, tile):
         """Draw a single tile on the boss board"""
-        # Check for pop animation scaling
-        scale = self.get_boss_pop_animation_scale(row, col)
+        # Check for pop animation scaling; one index lookup gives both the scale and the popping tile
+        cell = (row, col)
+        pop_entry = self._boss_pop_cells.get(cell)
+        if pop_entry is None:
+            scale = 1.0
+        else:
+            pop_anim, i = pop_entry
+            scale = pop_anim.scale
+            # Get tile data from the animation while it's popping
+            animation_tile = pop_anim.tile_data[i]
+            if animation_tile is not None:
+                tile = animation_tile
         
         # Also check for spawn animation scaling (spawn takes priority if both exist)
-        spawn_scale = self.get_boss_spawn_animation_scale(row, col)
-        if spawn_scale != 1.0:
-            scale = spawn_scale
-        
-        # Get tile data - check if it's animating first
-        animation_tile = self.get_boss_pop_animation_tile(row, col)
-        if animation_tile is not None:
-            tile = animation_tile
+        spawn_anim = self._boss_spawn_cells.get(cell)
+        if spawn_anim is not None:
+            spawn_scale = spawn_anim.get_scale()
+            if spawn_scale != 1.0:
+                scale = spawn_scale
         
         # Skip drawing if tile is too small (popped)
         if scale < 0.1:
             return
             
-        base_x = self.boss_board_x + col * self.tile_size + self.tile_size // 2
-        base_y = self.boss_board_y + row * self.tile_size + self.tile_size // 2
+        base_x = self.boss_board_x + self._col_center_x[col]
+        base_y = self.boss_board_y + self._row_center_y[row]
         
         # Apply scaling
         scaled_size = int(self.tile_size * scale)
@@ -3178,41 +3614,35 @@ class Match3Game:
             tile_rect = pygame.Rect(base_x - scaled_size // 2, base_y - scaled_size // 2, scaled_size, scaled_size)
             pygame.draw.rect(self.screen, tile.color.value, tile_rect)
     
-    def is_boss_tile_animating(self, row, col):
-        """Check if a boss tile is currently involved in any animation"""
-        # Check if involved in swap animation
+    def get_boss_animating_cells(self):
+        """Get the boss cells held by animations: both swap endpoints, and each fall's source and destination"""
+        cells = set()
         for swap_anim in self.boss_swap_animations:
-            if (row, col) in [swap_anim.tile_pos1, swap_anim.tile_pos2]:
-                return True
-        
-        # Check if this position is affected by falling tiles in the same column
-        return self.is_boss_column_affected_by_falling(col, row)
-    
-    def is_boss_column_affected_by_falling(self, col, max_row=None):
-        """Check if a column in boss board is affected by falling tiles"""
+            cells.add(swap_anim.tile_pos1)
+            cells.add(swap_anim.tile_pos2)
         for fall_anim in self.boss_fall_animations:
-            if fall_anim.col == col:
-                if max_row is None:
-                    return True
-                # Check if there's a tile that originally came from this position OR is falling to this position
-                if hasattr(fall_anim, 'from_row'):
-                    # Existing tile moving from one position to another
-                    if fall_anim.from_row == max_row or fall_anim.to_row == max_row:
-                        return True
-                else:
-                    # New tile falling to a position (no from_row)
-                    if fall_anim.to_row == max_row:
-                        return True
-        return False
+            cells.add((fall_anim.to_row, fall_anim.col))
+            if fall_anim.from_row is not None:
+                cells.add((fall_anim.from_row, fall_anim.col))
+        return cells
     
     def draw_boss_animated_tile(self, tile, col, row_float):
         """Draw an animated tile on the boss board at a floating row position"""
         # Calculate tile position
-        x = self.boss_board_x + col * self.tile_size + self.tile_size // 2
+        x = self.boss_board_x + self._col_center_x[col]
         y = self.boss_board_y + row_float * self.tile_size + self.tile_size // 2
         
         self.draw_boss_animated_tile_at_screen_pos(tile, (x, y))
     
+    def get_boss_animated_tile_blit(self, tile, screen_pos):
+        """Get a (sprite, rect) blit for a moving regular boss tile, or None if it needs draw_boss_animated_tile_at_screen_pos"""
+        if tile.special_tile:
+            return None
+        sprite = self.sprite_manager.get_tile_sprite(tile.color, self.tile_size)
+        if not sprite:
+            return None
+        return (sprite, sprite.get_rect(center=screen_pos))
+    
     def draw_boss_animated_tile_at_screen_pos(self, tile, screen_pos):
         """Draw an animated tile on the boss board at a specific screen position"""
         x, y = screen_pos
@@ -3241,14 +3671,13 @@ class Match3Game:
         pulse = (pygame.time.get_ticks() / 500) % 1.0  # Pulse every 500ms
         alpha = int(128 + 127 * abs(pulse - 0.5) * 2)  # Pulse between 128-255
         
-        # Create thinking text
-        thinking_text = self.font.render("AI THINKING...", True, (255, 255, 0))
+        # Thinking text
+        thinking_text = self._thinking_text
         thinking_rect = thinking_text.get_rect(center=(indicator_x, indicator_y))
         
         # Draw background with pulsing alpha
-        bg_surface = pygame.Surface((thinking_rect.width + 20, thinking_rect.height + 10))
+        bg_surface = self._thinking_bg
         bg_surface.set_alpha(alpha)
-        bg_surface.fill((0, 0, 0))
         bg_rect = bg_surface.get_rect(center=(indicator_x, indicator_y))
         self.screen.blit(bg_surface, bg_rect)
         
@@ -3256,13 +3685,14 @@ class Match3Game:
         self.screen.blit(thinking_text, thinking_rect)
         
         # Draw spinning dots
-        dots = "⚈ ⚈ ⚈"
-        dots_text = self.font.render(dots, True, (255, 255, 255))
+        dots_text = self._thinking_dots_text
         dots_rect = dots_text.get_rect(center=(indicator_x, indicator_y + 25))
         
-        # Rotate the dots
-        angle = (pygame.time.get_ticks() / 10) % 360
-        rotated_dots = pygame.transform.rotate(dots_text, angle)
+        # Rotate the dots; whole degrees are finer than the ~1.7 degrees they turn per frame
+        angle = (pygame.time.get_ticks() // 10) % 360
+        rotated_dots = self._thinking_dots_rotations.get(angle)
+        if rotated_dots is None:
+            rotated_dots = self._thinking_dots_rotations[angle] = pygame.transform.rotate(dots_text, angle)
         rotated_rect = rotated_dots.get_rect(center=dots_rect.center)
         self.screen.blit(rotated_dots, rotated_rect)
     
@@ -3295,10 +3725,7 @@ class Match3Game:
         border_offsets = [(-2, -2), (-2, 0), (-2, 2), (0, -2), (0, 2), (2, -2), (2, 0), (2, 2)]
         
         # Use bigger font (32 instead of 24)
-        if hasattr(self, 'gothic_font_32'):
-            gothic_font = self.gothic_font_32
-        else:
-            gothic_font = self.gothic_font_24
+        gothic_font = self.gothic_font_32
             
         # Draw border
         for dx, dy in border_offsets:
@@ -3416,12 +3843,10 @@ class Match3Game:
             effect.draw(self.screen)
         
         # Draw pop particles
-        for pop_particle in self.pop_particles:
-            pop_particle.draw(self.screen)
+        self.pop_particles.draw(self.screen)
         
         # Draw boss pop particles
-        for pop_particle in self.boss_pop_particles:
-            pop_particle.draw(self.screen)
+        self.boss_pop_particles.draw(self.screen)
         
         # Draw instructions
         if self.selected_tile is None:
@@ -3498,78 +3923,35 @@ class Match3Game:
     
     def draw_special_tile_legend(self):
         """Draw legend showing what each special tile does"""
-        legend_y = 150
-        legend_items = [
-            ("R (Orange): Horizontal Rocket - Clears entire row", (255, 69, 0)),
-            ("R (Blue): Vertical Rocket - Clears entire column", (30, 144, 255)),
-            ("B (Gray): Bomb - Explodes 5x5 area", (64, 64, 64)),
-            ("L (Dark Blue): Lightning - Arc pattern strike", (25, 25, 112)),
-            ("W (Purple): Board Wipe - Clears all of same color", (128, 0, 128))
-        ]
-        
-        small_font = pygame.font.Font(None, 24)
-        for i, (text, color) in enumerate(legend_items):
-            legend_surface = small_font.render(text, True, (255, 255, 255))
-            
-            # Draw colored square next to text
-            square_size = 20
-            square_rect = pygame.Rect(20, legend_y + i * 25, square_size, square_size)
-            pygame.draw.rect(self.screen, color, square_rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), square_rect, 2)
-            
-            # Draw text
-            self.screen.blit(legend_surface, (50, legend_y + i * 25))
+        screen = self.screen
+        # Draw colored squares next to the text
+        for color, square_rect in self._legend_squares:
+            pygame.draw.rect(screen, color, square_rect)
+            pygame.draw.rect(screen, (255, 255, 255), square_rect, 2)
+        
+        # Draw text
+        screen.blits(self._legend_blits, False)
     
     def draw_debug_overlay(self):
         """Draw debug mode overlay"""
-        from special_tiles import SpecialTileType
         
-        # Create semi-transparent overlay
-        debug_surface = pygame.Surface((WINDOW_WIDTH, 120))
-        debug_surface.set_alpha(200)
-        debug_surface.fill((0, 0, 0))
-        self.screen.blit(debug_surface, (0, 0))
+        # Semi-transparent overlay
+        self.screen.blit(self._debug_overlay_bg, (0, 0))
         
         # Debug text
-        font = pygame.font.Font(None, 24)
-        text_lines = [
-            "DEBUG MODE ACTIVE",
-            f"Current Tile: {self.get_current_debug_tile_name()}",
-            "TAB = Cycle tiles | Click = Place tile",
-            "F3+1 = Exit debug mode"
-        ]
-        
-        for i, line in enumerate(text_lines):
-            color = (255, 255, 0) if i == 0 else (255, 255, 255)
-            text_surface = font.render(line, True, color)
-            self.screen.blit(text_surface, (10, 10 + i * 25))
+        self.screen.blits(self._debug_overlay_blits, False)
+        current_line = f"Current Tile: {self.get_current_debug_tile_name()}"
+        self.screen.blit(self.small_font.render(current_line, True, (255, 255, 255)), (10, 35))
     
     def get_current_debug_tile_name(self):
         """Get the name of the currently selected debug tile"""
-        from special_tiles import SpecialTileType
-        
-        special_types = [
-            SpecialTileType.ROCKET_HORIZONTAL,
-            SpecialTileType.ROCKET_VERTICAL,
-            SpecialTileType.BOMB,
-            SpecialTileType.LIGHTNING,
-            SpecialTileType.BOARD_WIPE,
-            SpecialTileType.BOMB_ROCKET,
-            SpecialTileType.BOMB_BOARDWIPE,
-            SpecialTileType.MEGA_BOMB,
-            SpecialTileType.ENERGIZED_BOMB,
-            SpecialTileType.ROCKET_BOARDWIPE,
-            SpecialTileType.ROCKET_LIGHTNING,
-            SpecialTileType.SIMPLE_CROSS,
-        ]
-        
         # Add bounds checking to prevent crashes
-        if 0 <= self.debug_special_type < len(special_types):
-            return special_types[self.debug_special_type].name
+        if 0 <= self.debug_special_type < len(_DEBUG_SPECIAL_TYPES):
+            return _DEBUG_SPECIAL_TYPE_NAMES[self.debug_special_type]
         else:
             # Reset to first tile if out of bounds
             self.debug_special_type = 0
-            return special_types[0].name
+            return _DEBUG_SPECIAL_TYPE_NAMES[0]
     
     def update_boss_ai(self):
         """Update the AI and execute moves for the boss board"""
@@ -3593,7 +3975,6 @@ class Match3Game:
     
     def execute_boss_move(self, move):
         """Execute an AI move on the boss board with animations"""
-        from boss_ai import Move
         
         # Start boss swap animation
         pos1, pos2 = move.pos1, move.pos2
@@ -3603,9 +3984,9 @@ class Match3Game:
         screen_pos2 = self.get_boss_tile_screen_pos(pos2)
         
         # Create swap animation for boss board
-        print(f"Creating boss swap animation: {screen_pos1} -> {screen_pos2}, duration: 0.3s")
-        swap_anim = SwapAnimation(screen_pos1, screen_pos2, 0.3)  # Same speed as player animations
-        print(f"Animation created: start_pos1={swap_anim.start_pos1}, start_pos2={swap_anim.start_pos2}, duration={swap_anim.duration}")
+        logger.debug("Creating boss swap animation: %s -> %s, duration: 0.3s", screen_pos1, screen_pos2)
+        swap_anim = self.acquire_swap_animation(screen_pos1, screen_pos2, 0.3)  # Same speed as player animations
+        logger.debug("Animation created: start_pos1=%s, start_pos2=%s, duration=%s", swap_anim.start_pos1, swap_anim.start_pos2, swap_anim.duration)
         
         # Store tile positions and original tiles in the animation
         swap_anim.tile_pos1 = pos1
@@ -3622,9 +4003,7 @@ class Match3Game:
     def get_boss_tile_screen_pos(self, board_pos):
         """Get screen position for a boss board tile"""
         row, col = board_pos
-        x = self.boss_board_x + col * self.tile_size + self.tile_size // 2
-        y = self.boss_board_y + row * self.tile_size + self.tile_size // 2
-        return (x, y)
+        return (self.boss_board_x + self._col_center_x[col], self.boss_board_y + self._row_center_y[row])
     
     def complete_boss_swap_animation(self, swap_anim):
         """Complete a boss board swap animation and process matches"""
@@ -3638,8 +4017,6 @@ class Match3Game:
         if combo_tile:
             # Create combo tile at one of the positions
             combo_pos = pos1  # Place combo at first position
-            from board import Tile
-            from board import TileColor
             new_tile = Tile(TileColor.RED, special_tile=combo_tile)
             self.boss_board.set_tile(*combo_pos, new_tile)
             
@@ -3647,9 +4024,8 @@ class Match3Game:
             self.boss_board.set_tile(*pos2, None)
             
             # Check if this combo needs special handling
-            if hasattr(combo_tile, 'requires_special_handling') and combo_tile.requires_special_handling:
-                from special_tiles import SpecialTileType
-                print(f"Boss created special combo: {combo_tile.tile_type}")
+            if combo_tile.requires_special_handling:
+                logger.debug("Boss created special combo: %s", combo_tile.tile_type)
                 if combo_tile.tile_type == SpecialTileType.BOMB_BOARDWIPE:
                     self.handle_boss_bomb_boardwipe_combo(combo_pos, combo_tile)
                 elif combo_tile.tile_type == SpecialTileType.ROCKET_BOARDWIPE:
@@ -3661,12 +4037,10 @@ class Match3Game:
                 return
             
             # Activate the combo tile immediately on boss board with animations
-            result = self.activate_special_tile_with_animation(*combo_pos, board=self.boss_board)
-            if isinstance(result, tuple) and len(result) == 2:
-                affected_positions, activated_tiles = result
-                # Create particle effects for boss special tiles
-                for tile_row, tile_col, special_tile in activated_tiles:
-                    self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
+            affected_positions, activated_tiles = self.activate_special_tile_with_animation(*combo_pos, board=self.boss_board)
+            # Create particle effects for boss special tiles
+            for tile_row, tile_col, special_tile in activated_tiles:
+                self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
             
             self.apply_boss_board_gravity()
             return
@@ -3678,7 +4052,6 @@ class Match3Game:
         tile2 = self.boss_board.get_tile(*pos2)
         
         # Handle board wipe special case
-        from special_tiles import SpecialTileType
         
         if tile1 and tile1.is_special() and tile1.special_tile.tile_type == SpecialTileType.BOARD_WIPE:
             # Board wipe targets the color of the tile it was swapped with
@@ -3695,24 +4068,20 @@ class Match3Game:
         else:
             # Handle other special tiles normally
             if tile1 and tile1.is_special():
-                result = self.activate_special_tile_with_animation(*pos1, board=self.boss_board)
-                if isinstance(result, tuple) and len(result) == 2:
-                    affected_positions, activated_tiles = result
-                    if affected_positions:
-                        # Create particle effects for boss special tiles
-                        for tile_row, tile_col, special_tile in activated_tiles:
-                            self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
-                        special_activated = True
+                affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos1, board=self.boss_board)
+                if affected_positions:
+                    # Create particle effects for boss special tiles
+                    for tile_row, tile_col, special_tile in activated_tiles:
+                        self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
+                    special_activated = True
             
             if tile2 and tile2.is_special():
-                result = self.activate_special_tile_with_animation(*pos2, board=self.boss_board)
-                if isinstance(result, tuple) and len(result) == 2:
-                    affected_positions, activated_tiles = result
-                    if affected_positions:
-                        # Create particle effects for boss special tiles
-                        for tile_row, tile_col, special_tile in activated_tiles:
-                            self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
-                        special_activated = True
+                affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos2, board=self.boss_board)
+                if affected_positions:
+                    # Create particle effects for boss special tiles
+                    for tile_row, tile_col, special_tile in activated_tiles:
+                        self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
+                    special_activated = True
         
         if special_activated:
             # Special tile was activated, apply gravity
@@ -3756,7 +4125,7 @@ class Match3Game:
                     distance_factor = fall_distance / (self.tile_size * 3)
                     duration = base_duration + distance_factor * 0.3
                     
-                    fall_anim = FallAnimation(start_y, end_y, duration)
+                    fall_anim = self.acquire_fall_animation(start_y, end_y, duration)
                     fall_anim.col = col
                     fall_anim.from_row = tile_data['from_row']
                     fall_anim.to_row = tile_data['to_row']
@@ -3765,40 +4134,37 @@ class Match3Game:
                     self.boss_fall_animations.append(fall_anim)
         
         # Fill empty spaces with new tiles
-        self.boss_board.fill_empty_spaces_with_fall_data()
+        spawn_data = self.boss_board.fill_empty_spaces_with_fall_data()
         
         # Create fall animations for new tiles
-        self.create_boss_new_tile_animations()
+        self.create_boss_new_tile_animations(spawn_data)
         
         # Set boss_animating to True if we have animations
         if self.boss_fall_animations:
             self.boss_animating = True
     
-    def create_boss_new_tile_animations(self):
-        """Create fall animations for newly spawned tiles on boss board"""
-        for col in range(self.boss_board.width):
-            # Find all newly spawned tiles in this column from top to bottom
-            new_tiles = []
-            for row in range(self.boss_board.height):
-                tile = self.boss_board.get_tile(row, col)
-                if tile and hasattr(tile, 'newly_spawned') and tile.newly_spawned:
-                    new_tiles.append((row, tile))
-                    # Remove the newly_spawned flag
-                    delattr(tile, 'newly_spawned')
-            
+    def create_boss_new_tile_animations(self, spawn_data):
+        """Create fall animations for the newly spawned tiles on the boss board"""
+        boss_board_y = self.boss_board_y
+        tile_size = self.tile_size
+        row_center_y = self._row_center_y
+        # New tiles stack upward from one tile above the top row's center
+        stack_top_y = boss_board_y + row_center_y[0] - tile_size
+        board_height_px = self.boss_board.height * tile_size
+        
+        for col, new_tiles in spawn_data.items():
             # Create animations for new tiles, stacking them properly above the board
             for i, (row, tile) in enumerate(new_tiles):
                 # Stack new tiles above the board in reverse order
                 stack_position = len(new_tiles) - i
-                boss_board_y = self.get_boss_tile_screen_pos((0, 0))[1] - self.tile_size
-                start_y = boss_board_y - stack_position * self.tile_size
-                end_y = self.get_boss_tile_screen_pos((row, col))[1]
+                start_y = stack_top_y - stack_position * tile_size
+                end_y = boss_board_y + row_center_y[row]
                 
                 # Calculate fall duration based on distance
                 fall_distance = end_y - start_y
-                fall_duration = 0.3 + (fall_distance / (self.boss_board.height * self.tile_size)) * 0.8
+                fall_duration = 0.3 + (fall_distance / board_height_px) * 0.8
                 
-                fall_anim = FallAnimation(start_y, end_y, fall_duration)
+                fall_anim = self.acquire_fall_animation(start_y, end_y, fall_duration)
                 fall_anim.col = col
                 fall_anim.to_row = row
                 fall_anim.tile = tile
@@ -3840,16 +4206,14 @@ class Match3Game:
         
         # Create explosion particle effect at activation position
         screen_pos = self.get_boss_tile_screen_pos(pos)
-        effect = ParticleEffect(screen_pos[0], screen_pos[1], (255, 255, 255), 50)
+        effect = self.acquire_particle_effect(screen_pos[0], screen_pos[1], (255, 255, 255), 50)
         self.particle_effects.append(effect)
     
     def handle_boss_rocket_boardwipe_combo(self, pos, combo_tile):
         """Handle the rocket + boardwipe combo on boss board"""
-        from special_tiles import create_special_tile, SpecialTileType
-        from board import Tile, TileColor
-        import random
         
         # Clear any existing boss fall animations
+        self._fall_animation_pool.extend(self.boss_fall_animations)
         self.boss_fall_animations.clear()
         
         # Get rocket positions before removing combo tile
@@ -3866,8 +4230,8 @@ class Match3Game:
         # Remove the combo tile after placing rockets
         self.boss_board.set_tile(*pos, None)
         
-        # Sort positions from top to bottom, left to right for sequential detonation
-        rocket_positions.sort(key=lambda pos: (pos[0], pos[1]))
+        # Sort positions from top to bottom, left to right for sequential detonation (tuple order is (row, col))
+        rocket_positions.sort()
         
         # Set up animation state for boss board (use separate state variables)
         self.boss_bomb_boardwipe_active = True
@@ -3879,12 +4243,10 @@ class Match3Game:
         # Immediately start a fall animation to fill gaps
         self.apply_boss_board_gravity()
         
-        print(f"Boss placed {len(rocket_positions)} rockets for sequential detonation!")
+        logger.debug("Boss placed %s rockets for sequential detonation!", len(rocket_positions))
     
     def handle_boss_bomb_boardwipe_combo(self, pos, combo_tile):
         """Handle the bomb + boardwipe combo on boss board"""
-        from special_tiles import create_special_tile, SpecialTileType
-        from board import Tile, TileColor
         
         # Get bomb positions before removing combo tile
         bomb_positions = combo_tile.get_bomb_positions(self.boss_board, pos)
@@ -3906,7 +4268,7 @@ class Match3Game:
         self.boss_bomb_boardwipe_detonation_index = 0
         
         self.apply_boss_board_gravity()
-        print(f"Boss placed {len(bomb_positions)} bombs for sequential detonation!")
+        logger.debug("Boss placed %s bombs for sequential detonation!", len(bomb_positions))
     
     def handle_boss_rocket_lightning_combo(self, pos, combo_tile):
         """Handle the rocket + lightning combo on boss board"""
@@ -3916,7 +4278,7 @@ class Match3Game:
         self.boss_rocket_lightning_timer = 0.0
         self.boss_rocket_lightning_phase = 'charging'
         
-        print("Boss activated rocket lightning combo!")
+        logger.debug("Boss activated rocket lightning combo!")
     
     def handle_boss_reality_break_combo(self, pos, combo_tile):
         """Handle the reality break combo on boss board"""
@@ -3926,7 +4288,7 @@ class Match3Game:
         self.boss_reality_break_timer = 0.0
         self.boss_reality_break_phase = 'charging'
         
-        print("Boss activated reality break combo!")
+        logger.debug("Boss activated reality break combo!")
     
     def update_boss_bomb_boardwipe_animation(self, dt):
         """Update boss board bomb/rocket boardwipe animation (sequential detonation)"""
@@ -3952,12 +4314,10 @@ class Match3Game:
             # Activate the special tile at this position on boss board
             tile = self.boss_board.get_tile(*pos)
             if tile and tile.is_special():
-                result = self.activate_special_tile_with_animation(*pos, board=self.boss_board)
-                if isinstance(result, tuple) and len(result) == 2:
-                    affected_positions, activated_tiles = result
-                    # Create particle effects for boss special tiles
-                    for tile_row, tile_col, special_tile in activated_tiles:
-                        self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
+                affected_positions, activated_tiles = self.activate_special_tile_with_animation(*pos, board=self.boss_board)
+                # Create particle effects for boss special tiles
+                for tile_row, tile_col, special_tile in activated_tiles:
+                    self.create_boss_special_effect_particles((tile_row, tile_col), special_tile)
             
             self.boss_bomb_boardwipe_detonation_index += 1
             self.boss_bomb_boardwipe_detonation_timer = 0
@@ -3971,19 +4331,19 @@ class Match3Game:
         """Update boss board rocket lightning combo animation"""
         # For now, just end the animation quickly - can be enhanced later
         self.boss_rocket_lightning_active = False
-        print("Boss rocket lightning combo completed!")
+        logger.debug("Boss rocket lightning combo completed!")
         self.apply_boss_board_gravity()
     
     def update_boss_reality_break_animation(self, dt):
         """Update boss board reality break combo animation"""
         # For now, just end the animation quickly - can be enhanced later
         self.boss_reality_break_active = False
-        print("Boss reality break combo completed!")
+        logger.debug("Boss reality break combo completed!")
         self.apply_boss_board_gravity()
 
 def run_level_select():
     """Run the level select screen and return selected level"""
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE)
+    screen = create_display()
     pygame.display.set_caption("Match 3 - Level Select")
     clock = pygame.time.Clock()
     
@@ -29,6 +29,7 @@ class SpecialTile(ABC):
         self.tile_type = tile_type
         self.color = color  # Some special tiles might retain the color of the match
         self.is_special = True
+        self.requires_special_handling = False  # Combos the game runs as their own sequence set this
     
     @abstractmethod
     def get_affected_positions(self, board, activation_pos: Tuple[int, int]) -> List[Tuple[int, int]]:
@@ -37,7 +38,7 @@ class SpecialTile(ABC):
     
     @abstractmethod
     def get_visual_representation(self) -> dict:
-        """Get visual data for rendering this special tile"""
+        """Get visual data for rendering this special tile (shared by every instance, so treat it as read-only)"""
         pass
     
     def can_be_swapped(self) -> bool:
@@ -72,24 +73,27 @@ class RocketTile(SpecialTile):
         
         return positions
     
+    _VISUAL_DATA_HORIZONTAL = {
+        'sprite_type': 'rocket',
+        'symbol': 'R',
+        'color': (255, 255, 255),
+        'background_color': (255, 69, 0),  # Red-orange for horizontal rocket
+        'effect_color': (255, 140, 0)
+    }
+    _VISUAL_DATA_VERTICAL = {
+        'sprite_type': 'rocket',
+        'symbol': 'R',
+        'color': (255, 255, 255),
+        'background_color': (30, 144, 255),  # Dodger blue for vertical rocket
+        'effect_color': (0, 191, 255)
+    }
+    
     def get_visual_representation(self) -> dict:
         """Visual data for the rocket"""
         if self.is_horizontal:
-            return {
-                'sprite_type': 'rocket',
-                'symbol': 'R',
-                'color': (255, 255, 255),
-                'background_color': (255, 69, 0),  # Red-orange for horizontal rocket
-                'effect_color': (255, 140, 0)
-            }
+            return self._VISUAL_DATA_HORIZONTAL
         else:
-            return {
-                'sprite_type': 'rocket',
-                'symbol': 'R',
-                'color': (255, 255, 255),
-                'background_color': (30, 144, 255),  # Dodger blue for vertical rocket
-                'effect_color': (0, 191, 255)
-            }
+            return self._VISUAL_DATA_VERTICAL
 
 class BoardWipeTile(SpecialTile):
     """Board wipe that clears all tiles of a specific color"""
@@ -105,27 +109,20 @@ class BoardWipeTile(SpecialTile):
         if not target_tile or target_tile.is_empty():
             return []
         
-        positions = []
-        target_color = target_tile.color
-        
         # Find all tiles with the same color
-        for r in range(board.height):
-            for c in range(board.width):
-                tile = board.get_tile(r, c)
-                if tile and not tile.is_empty() and tile.color == target_color:
-                    positions.append((r, c))
-        
-        return positions
+        return board.get_positions_with_color(target_tile.color)
+    
+    _VISUAL_DATA = {
+        'sprite_type': 'boardwipe',
+        'symbol': 'W',
+        'color': (255, 255, 255),
+        'background_color': (128, 0, 128),  # Purple for board wipe
+        'effect_color': (255, 0, 255)  # Magenta effect
+    }
     
     def get_visual_representation(self) -> dict:
         """Visual data for the board wipe"""
-        return {
-            'sprite_type': 'boardwipe',
-            'symbol': 'W',
-            'color': (255, 255, 255),
-            'background_color': (128, 0, 128),  # Purple for board wipe
-            'effect_color': (255, 0, 255)  # Magenta effect
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 2000
@@ -148,15 +145,17 @@ class BombTile(SpecialTile):
         
         return positions
     
+    _VISUAL_DATA = {
+        'sprite_type': 'bomb',
+        'symbol': 'B',
+        'color': (255, 255, 255),
+        'background_color': (64, 64, 64),  # Dark gray for bomb
+        'effect_color': (255, 69, 0)  # Orange-red explosion effect
+    }
+    
     def get_visual_representation(self) -> dict:
         """Visual data for the bomb"""
-        return {
-            'sprite_type': 'bomb',
-            'symbol': 'B',
-            'color': (255, 255, 255),
-            'background_color': (64, 64, 64),  # Dark gray for bomb
-            'effect_color': (255, 69, 0)  # Orange-red explosion effect
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 1000
@@ -192,15 +191,17 @@ class LightningTile(SpecialTile):
         # Remove duplicates
         return list(set(positions))
     
+    _VISUAL_DATA = {
+        'sprite_type': 'lightning',
+        'symbol': 'L',
+        'color': (255, 255, 255),
+        'background_color': (25, 25, 112),  # Midnight blue for lightning
+        'effect_color': (255, 255, 0)  # Bright yellow lightning effect
+    }
+    
     def get_visual_representation(self) -> dict:
         """Visual data for the lightning"""
-        return {
-            'sprite_type': 'lightning',
-            'symbol': 'L',
-            'color': (255, 255, 255),
-            'background_color': (25, 25, 112),  # Midnight blue for lightning
-            'effect_color': (255, 255, 0)  # Bright yellow lightning effect
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 800
@@ -264,31 +265,29 @@ class BombRocketTile(SpecialTile):
         row, col = activation_pos
         positions = []
         
-        # Horizontal 3-wide stripe (entire width of board)
-        for c in range(board.width):
-            for r_offset in [-1, 0, 1]:  # 3 rows tall
-                target_row = row + r_offset
-                if 0 <= target_row < board.height:
-                    positions.append((target_row, c))
+        # Horizontal 3-wide stripe (entire width of board), clipped to the rows on the board
+        for target_row in range(max(0, row - 1), min(board.height, row + 2)):
+            for c in range(board.width):
+                positions.append((target_row, c))
         
-        # Vertical 3-wide stripe (entire height of board)
-        for r in range(board.height):
-            for c_offset in [-1, 0, 1]:  # 3 columns wide
-                target_col = col + c_offset
-                if 0 <= target_col < board.width:
-                    positions.append((r, target_col))
+        # Vertical 3-wide stripe (entire height of board), clipped to the columns on the board
+        for target_col in range(max(0, col - 1), min(board.width, col + 2)):
+            for r in range(board.height):
+                positions.append((r, target_col))
         
         # Remove duplicates (center area will overlap)
         return list(set(positions))
     
+    _VISUAL_DATA = {
+        'sprite_type': 'bomb',  # Use bomb sprite for now
+        'symbol': 'BR',
+        'color': (255, 255, 255),
+        'background_color': (255, 165, 0),  # Orange
+        'effect_color': (255, 69, 0)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'bomb',  # Use bomb sprite for now
-            'symbol': 'BR',
-            'color': (255, 255, 255),
-            'background_color': (255, 165, 0),  # Orange
-            'effect_color': (255, 69, 0)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 2500
@@ -325,14 +324,16 @@ class BombBoardwipeTile(SpecialTile):
         """This shouldn't be called for bomb-boardwipe, but return activation pos as fallback"""
         return [activation_pos]
     
+    _VISUAL_DATA = {
+        'sprite_type': 'boardwipe',  # Use boardwipe sprite for now
+        'symbol': 'BW',
+        'color': (255, 255, 255),
+        'background_color': (128, 0, 128),  # Purple
+        'effect_color': (255, 0, 255)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'boardwipe',  # Use boardwipe sprite for now
-            'symbol': 'BW',
-            'color': (255, 255, 255),
-            'background_color': (128, 0, 128),  # Purple
-            'effect_color': (255, 0, 255)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 5000
@@ -355,14 +356,16 @@ class MegaBombTile(SpecialTile):
         
         return positions
     
+    _VISUAL_DATA = {
+        'sprite_type': 'bomb',  # Use bomb sprite for now
+        'symbol': 'MB',
+        'color': (255, 255, 255),
+        'background_color': (139, 0, 0),  # Dark red
+        'effect_color': (255, 69, 0)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'bomb',  # Use bomb sprite for now
-            'symbol': 'MB',
-            'color': (255, 255, 255),
-            'background_color': (139, 0, 0),  # Dark red
-            'effect_color': (255, 69, 0)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 3000
@@ -385,14 +388,16 @@ class EnergizedBombTile(SpecialTile):
         
         return positions
     
+    _VISUAL_DATA = {
+        'sprite_type': 'lightning',  # Use lightning sprite for now
+        'symbol': 'EB',
+        'color': (255, 255, 255),
+        'background_color': (75, 0, 130),  # Indigo
+        'effect_color': (255, 255, 0)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'lightning',  # Use lightning sprite for now
-            'symbol': 'EB',
-            'color': (255, 255, 255),
-            'background_color': (75, 0, 130),  # Indigo
-            'effect_color': (255, 255, 0)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 4000
@@ -429,14 +434,16 @@ class RocketBoardwipeTile(SpecialTile):
         """This shouldn't be called for rocket-boardwipe, but return activation pos as fallback"""
         return [activation_pos]
     
+    _VISUAL_DATA = {
+        'sprite_type': 'rocket',  # Use rocket sprite for now
+        'symbol': 'RW',
+        'color': (255, 255, 255),
+        'background_color': (255, 20, 147),  # Deep pink
+        'effect_color': (255, 105, 180)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'rocket',  # Use rocket sprite for now
-            'symbol': 'RW',
-            'color': (255, 255, 255),
-            'background_color': (255, 20, 147),  # Deep pink
-            'effect_color': (255, 105, 180)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 4500
@@ -456,14 +463,16 @@ class RocketLightningTile(SpecialTile):
         """This shouldn't be called for rocket-lightning, but return activation pos as fallback"""
         return [activation_pos]
     
+    _VISUAL_DATA = {
+        'sprite_type': 'lightning',  # Use lightning sprite for now
+        'symbol': 'RL',
+        'color': (255, 255, 255),
+        'background_color': (255, 215, 0),  # Gold
+        'effect_color': (255, 255, 0)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'lightning',  # Use lightning sprite for now
-            'symbol': 'RL',
-            'color': (255, 255, 255),
-            'background_color': (255, 215, 0),  # Gold
-            'effect_color': (255, 255, 0)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 3500
@@ -494,14 +503,16 @@ class SimpleCrossTile(SpecialTile):
         
         return positions
     
+    _VISUAL_DATA = {
+        'sprite_type': 'lightning',  # Use lightning sprite for now
+        'symbol': 'X',
+        'color': (255, 255, 255),
+        'background_color': (100, 149, 237),  # Cornflower blue
+        'effect_color': (135, 206, 250)
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'lightning',  # Use lightning sprite for now
-            'symbol': 'X',
-            'color': (255, 255, 255),
-            'background_color': (100, 149, 237),  # Cornflower blue
-            'effect_color': (135, 206, 250)
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 2000
@@ -519,8 +530,7 @@ class LightningCrossTile(SpecialTile):
         
         # Phase 1: Top-left to bottom-right diagonal
         for i in range(min(board.height, board.width)):
-            if i < board.height and i < board.width:
-                positions.append((i, i))
+            positions.append((i, i))
         
         # Phase 2: Top-middle to bottom-middle (vertical)
         center_col = board.width // 2
@@ -529,8 +539,7 @@ class LightningCrossTile(SpecialTile):
         
         # Phase 3: Top-right to bottom-left diagonal
         for i in range(min(board.height, board.width)):
-            if i < board.height and (board.width - 1 - i) >= 0:
-                positions.append((i, board.width - 1 - i))
+            positions.append((i, board.width - 1 - i))
         
         # Phase 4: Middle-right to middle-left (horizontal)
         center_row = board.height // 2
@@ -540,14 +549,16 @@ class LightningCrossTile(SpecialTile):
         # Remove duplicates
         return list(set(positions))
     
+    _VISUAL_DATA = {
+        'symbol': '⚡',
+        'color': (255, 255, 255),  # Bright white
+        'background_color': (75, 0, 130),  # Indigo background
+        'effect_color': (255, 255, 0)  # Bright yellow effect
+    }
+    
     def get_visual_representation(self):
         """Return visual representation for lightning cross tile"""
-        return {
-            'symbol': '⚡',
-            'color': (255, 255, 255),  # Bright white
-            'background_color': (75, 0, 130),  # Indigo background
-            'effect_color': (255, 255, 0)  # Bright yellow effect
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 3000  # Higher score for dramatic cross lightning effect
@@ -568,14 +579,16 @@ class RealityBreakTile(SpecialTile):
                 positions.append((row, col))
         return positions
     
+    _VISUAL_DATA = {
+        'sprite_type': 'boardwipe',  # Use boardwipe sprite but with special effects
+        'symbol': '∞',  # Infinity symbol for reality break
+        'color': (255, 255, 255),
+        'background_color': (0, 0, 0),  # Black background
+        'effect_color': (255, 255, 255)  # White effect
+    }
+    
     def get_visual_representation(self) -> dict:
-        return {
-            'sprite_type': 'boardwipe',  # Use boardwipe sprite but with special effects
-            'symbol': '∞',  # Infinity symbol for reality break
-            'color': (255, 255, 255),
-            'background_color': (0, 0, 0),  # Black background
-            'effect_color': (255, 255, 255)  # White effect
-        }
+        return self._VISUAL_DATA
     
     def get_score_bonus(self) -> int:
         return 10000  # Massive score bonus for the ultimate combo!
@@ -11,6 +11,31 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from board import Board, TileColor, MatchType, Tile
 
+# Letters used to lay out test boards; '.' leaves the cell without a tile
+LAYOUT_COLORS = {
+    'R': TileColor.RED,
+    'G': TileColor.GREEN,
+    'B': TileColor.BLUE,
+    'Y': TileColor.YELLOW,
+    'O': TileColor.ORANGE,
+    '_': TileColor.EMPTY,
+}
+
+def make_board(rows):
+    """Build a board from rows of layout letters"""
+    board = Board(len(rows[0]), len(rows), 60)
+    board.grid = [[None if letter == '.' else Tile(LAYOUT_COLORS[letter]) for letter in row] for row in rows]
+    return board
+
+def check_matches(name, rows, expected):
+    """Compare find_all_matches with the expected (type, positions) list, in the order found"""
+    found = [(match.match_type, match.positions) for match in make_board(rows).find_all_matches()]
+    if found == expected:
+        print(f"✓ {name}")
+        return True
+    print(f"✗ {name}: expected {expected}, found {found}")
+    return False
+
 def test_corner_match():
     """Test corner match detection"""
     print("Testing Corner Match Detection...")
@@ -120,12 +145,176 @@ def test_priority():
         print("✗ Priority system not working correctly")
         return False
 
+def test_line_matches_with_gaps():
+    """Test that line runs stop at missing tiles and EMPTY tiles"""
+    print("\nTesting Line Matches Across Gaps...")
+    results = [
+        # Two reds, a missing tile, then three reds; EMPTY tiles break runs and never match
+        check_matches("horizontal runs split by gaps", [
+            "RR.RRR",
+            "GG_GGB",
+            "___OBO",
+            "YBYBYB",
+        ], [(MatchType.THREE, [(0, 3), (0, 4), (0, 5)])]),
+        # A missing tile splits a column into two runs, and an EMPTY tile ends a run
+        check_matches("vertical runs split by gaps", [
+            "R.",
+            "RB",
+            "RG",
+            "B_",
+            "BG",
+            "BY",
+        ], [(MatchType.THREE, [(0, 0), (1, 0), (2, 0)]),
+            (MatchType.THREE, [(3, 0), (4, 0), (5, 0)])]),
+        check_matches("run lengths", [
+            "RRRRGB",
+            "BBBBBG",
+            "GYGYOY",
+        ], [(MatchType.FOUR, [(0, 0), (0, 1), (0, 2), (0, 3)]),
+            (MatchType.FIVE, [(1, 0), (1, 1), (1, 2), (1, 3), (1, 4)])]),
+    ]
+    return all(results)
+
+def test_edge_placements():
+    """Test that special shapes touching the right and bottom edges are found"""
+    print("\nTesting Shapes At Board Edges...")
+    results = [
+        check_matches("bottom-right corner", [
+            "GBGBG",
+            "BGBGB",
+            "GBGBR",
+            "BGBGR",
+            "GBRRR",
+        ], [(MatchType.CORNER, [(2, 4), (3, 4), (4, 2), (4, 3), (4, 4)])]),
+        check_matches("T along the bottom edge", [
+            "GBGBG",
+            "BGBGB",
+            "GBGRB",
+            "BGBRG",
+            "GBRRR",
+        ], [(MatchType.T_SHAPE, [(2, 3), (3, 3), (4, 2), (4, 3), (4, 4)])]),
+        check_matches("T along the right edge", [
+            "GBGBG",
+            "BGBGR",
+            "GBRRR",
+            "BGBGR",
+            "GBGBG",
+        ], [(MatchType.T_SHAPE, [(1, 4), (2, 2), (2, 3), (2, 4), (3, 4)])]),
+        check_matches("square in the bottom-right corner", [
+            "GBGBG",
+            "BGBGB",
+            "GBGBG",
+            "BGBRR",
+            "GBGRR",
+        ], [(MatchType.SQUARE, [(3, 3), (3, 4), (4, 3), (4, 4)])]),
+    ]
+    return all(results)
+
+def test_shape_order():
+    """Test that corners claim tiles before T shapes, then squares, then lines"""
+    print("\nTesting Shape Order...")
+    results = [
+        # The corner takes the top row and left column, the square takes what is left
+        check_matches("3x3 block", [
+            "RRRB",
+            "RRRG",
+            "RRRB",
+            "GBGY",
+        ], [(MatchType.CORNER, [(0, 0), (0, 1), (0, 2), (1, 0), (2, 0)]),
+            (MatchType.SQUARE, [(1, 1), (1, 2), (2, 1), (2, 2)])]),
+        check_matches("T over square", [
+            "RRRB",
+            "GRRG",
+            "BRBG",
+            "GBGY",
+        ], [(MatchType.T_SHAPE, [(0, 0), (0, 1), (0, 2), (1, 1), (2, 1)])]),
+        check_matches("square over line", [
+            "RRRB",
+            "RRGY",
+            "BGBG",
+            "GBYB",
+        ], [(MatchType.SQUARE, [(0, 0), (0, 1), (1, 0), (1, 1)])]),
+        # Horizontal runs are checked before vertical ones, so the crossing tile goes to the row
+        check_matches("crossing lines", [
+            "GRGB",
+            "RRRG",
+            "GRGB",
+            "BGBG",
+        ], [(MatchType.THREE, [(1, 0), (1, 1), (1, 2)])]),
+    ]
+    return all(results)
+
+def test_gravity_fall_data():
+    """Test the fall data and final grid from apply_gravity_with_animation_data"""
+    print("\nTesting Gravity Fall Data...")
+    board = Board(2, 6, 60)
+    top, middle, bottom = Tile(TileColor.RED), Tile(TileColor.GREEN), Tile(TileColor.BLUE)
+    full_column = [Tile(TileColor.YELLOW) for _ in range(6)]
+    # Column 0 has holes, column 1 is full
+    column = [top, None, middle, None, None, bottom]
+    board.grid = [[column[row], full_column[row]] for row in range(6)]
+    
+    fall_data = board.apply_gravity_with_animation_data()
+    
+    # Moves are listed bottom-up; the bottom tile is already in place and doesn't move
+    expected_falls = {
+        0: [{'from_row': 2, 'to_row': 4, 'tile': middle},
+            {'from_row': 0, 'to_row': 3, 'tile': top}],
+        1: [],
+    }
+    expected_column = [None, None, None, top, middle, bottom]
+    falls_ok = fall_data == expected_falls
+    column_ok = all(board.grid[row][0] is expected_column[row] for row in range(6))
+    full_ok = all(board.grid[row][1] is full_column[row] for row in range(6))
+    
+    if falls_ok and column_ok and full_ok:
+        print("✓ Gravity fall data and final grid correct")
+        return True
+    print(f"✗ Gravity incorrect: falls {fall_data}, grid {board.grid}")
+    return False
+
+def test_possible_moves():
+    """Test has_possible_moves on boards with one move and none, leaving the tiles in place"""
+    print("\nTesting Possible Moves...")
+    # Diagonal stripes of five colors: no swap lines up three or forms a square
+    no_move_rows = [
+        "RGBYO",
+        "GBYOR",
+        "BYORG",
+        "YORGB",
+        "ORGBY",
+    ]
+    # Same board with one tile changed: only swapping (2, 3) and (2, 4) makes a match
+    one_move_rows = no_move_rows[:4] + ["ORGGY"]
+    
+    results = []
+    for name, rows, expected in (("one move", one_move_rows, True), ("no moves", no_move_rows, False)):
+        board = make_board(rows)
+        tiles_before = [list(grid_row) for grid_row in board.grid]
+        has_moves = board.has_possible_moves()
+        # The search must not leave any tile swapped
+        unchanged = all(board.grid[row][col] is tiles_before[row][col]
+                        for row in range(board.height) for col in range(board.width))
+        
+        if has_moves == expected and unchanged:
+            print(f"✓ {name}")
+            results.append(True)
+        else:
+            print(f"✗ {name}: has_possible_moves returned {has_moves}, tiles unchanged: {unchanged}")
+            results.append(False)
+    return all(results)
+
 if __name__ == "__main__":
     corner_ok = test_corner_match()
     t_ok = test_t_match()
     priority_ok = test_priority()
+    gaps_ok = test_line_matches_with_gaps()
+    edges_ok = test_edge_placements()
+    order_ok = test_shape_order()
+    gravity_ok = test_gravity_fall_data()
+    moves_ok = test_possible_moves()
     
-    if corner_ok and t_ok and priority_ok:
+    if corner_ok and t_ok and priority_ok and gaps_ok and edges_ok and order_ok and gravity_ok and moves_ok:
         print("\n🎉 All match detection tests passed!")
     else:
         print("\n❌ Some tests failed. Check the implementation.")
\ No newline at end of file